@@ -0,0 +1,475 @@
+'''
+Programa que mide el rendimiento de distintas partes del proyecto.
+Se ejecuta desde la terminal: python benchmark.py [--grupos ...] [--json resultados.json] [--base base.json]
+Los resultados se pueden guardar en JSON y compararse con los de una ejecucion anterior (base): cada
+medida que empeore mas que el umbral se marca como regresion y el programa termina con codigo 1.
+'''
+
+# ---Imports---
+# os: variables de entorno
+import os
+# sys: codigo de salida
+import sys
+# json: resultados y base de comparacion
+import json
+# time: medicion de tiempos de una sola ejecucion
+import time
+# timeit: medicion de tiempos
+import timeit
+# platform: descripcion de la maquina
+import platform
+# argparse: opciones de la linea de comandos
+import argparse
+# subprocess: importaciones medidas en un interprete nuevo
+import subprocess
+# tracemalloc: memoria reservada por la construccion de animaciones
+import tracemalloc
+# warnings: aviso de animaciones que se borran sin dibujarse
+import warnings
+# numpy (np): manejo de arrays
+import numpy as np
+# scipy.integrate.odeint: resolucion de ecuaciones diferenciales
+from scipy.integrate import odeint
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+# jac_pendulo (jac): jacobianos exactos de las ecuaciones diferenciales
+import jac_pendulo as jac
+# func_pendulo (fp): funciones para trabajar con pendulos
+import func_pendulo as fp
+# func_integradores (fi): metodos de paso fijo del bucle a tiempo real
+import func_integradores as fi
+# func_jit (fj): version compilada de las ecuaciones y los bucles
+import func_jit as fj
+
+# ---Funciones---
+def mide(func, repeticiones = 5):
+	'''
+	Mide el mejor tiempo por llamada de una funcion sin argumentos
+
+	---Parametros---
+	* func: funcion a medir
+	* repeticiones: numero de repeticiones de la medida
+
+	---Return---
+	* <float>: tiempo por llamada en segundos
+	'''
+	# Se calibra el numero de llamadas por medida y se toma la mejor de las repeticiones
+	timer = timeit.Timer(func)
+	n, _ = timer.autorange()
+	return min(timer.repeat(repeticiones, n)) / n
+
+def bench_rhs():
+	'''
+	Compara ode.Triple con la ecuacion generada por ode.Triple_gen, para un estado y para un lote
+
+	---Return---
+	* <dict>: tiempos por llamada en segundos
+	'''
+	# Constantes y estados de prueba
+	ctes = (9.8, 1., 1., 1., 1., 1., 1.)
+	y = np.radians([90., 0., 60., 0., 30., 0.])
+	Y = np.random.default_rng(0).uniform(-np.pi, np.pi, (6, 10000))
+	f = ode.Triple_gen(*ctes)
+
+	return {'Triple': mide(lambda: ode.Triple(y, 0, *ctes)),
+		'Triple_gen': mide(lambda: f(y, 0)),
+		'Triple lote 10000': mide(lambda: ode.Triple(Y, 0, *ctes)),
+		'Triple_gen lote 10000': mide(lambda: f(Y, 0))}
+
+def comprueba_cadena(lote = 1000):
+	'''
+	Compara ode.Cadena con Simple (sin rozamiento), Doble y Triple sobre estados y constantes al azar,
+	y mide su coste para cadenas largas
+
+	---Parametros---
+	* lote: numero de estados de cada comprobacion
+
+	---Return---
+	* <dict>: diferencia maxima con cada ecuacion y tiempos por llamada en segundos
+	'''
+	rng = np.random.default_rng(0)
+	g = 9.8
+	casos = [['Simple', lambda Y, L, m: ode.Simple(Y, 0, g, L[0], 0, m[0])],
+		['Doble', lambda Y, L, m: ode.Doble(Y, 0, g, *L, *m)],
+		['Triple', lambda Y, L, m: ode.Triple(Y, 0, g, *L, *m)]]
+
+	informe = {}
+	for N, (nombre, f) in enumerate(casos, 1):
+		Y = rng.uniform(-np.pi, np.pi, (2*N, lote))
+		L = rng.uniform(.5, 2, N); m = rng.uniform(.5, 2, N)
+		informe['Cadena - ' + nombre] = np.max(np.abs(np.array(f(Y, L, m)) - ode.Cadena(Y, 0, g, L, m)))
+
+	# Coste para cadenas largas, con un estado y con un lote
+	for N in (10, 100):
+		L = np.ones(N); m = np.ones(N)
+		y = rng.uniform(-np.pi, np.pi, 2*N); Y = rng.uniform(-np.pi, np.pi, (2*N, lote))
+		informe['Cadena N=%d' % N] = mide(lambda: ode.Cadena(y, 0, g, L, m))
+		informe['Cadena N=%d lote %d' % (N, lote)] = mide(lambda: ode.Cadena(Y, 0, g, L, m))
+
+	return informe
+
+def comprueba_jit(estados = 1000):
+	'''
+	Compara las ecuaciones de func_jit (compiladas si hay numba) con las de ode_pendulo sobre estados y
+	constantes al azar, con masas y longitudes distintas
+
+	---Parametros---
+	* estados: numero de estados de cada comprobacion
+
+	---Return---
+	* <dict>: diferencia relativa maxima con cada ecuacion
+	'''
+	rng = np.random.default_rng(0)
+	casos = [['Simple', 2, lambda: (9.8, *rng.uniform(.5, 2, 3))],
+		['Doble', 4, lambda: (9.8, *rng.uniform(.5, 2, 4))],
+		['Triple', 6, lambda: (9.8, *rng.uniform(.5, 2, 6))],
+		['Esferico', 4, lambda: (9.8, rng.uniform(.5, 2))]]
+
+	informe = {}
+	for k, (nombre, n, constantes) in enumerate(casos):
+		diferencia = 0.
+		for _ in range(estados):
+			y = rng.uniform(-np.pi, np.pi, n); ctes = constantes()
+			esperado = np.array(getattr(ode, nombre)(y, 0, *ctes))
+			obtenido = fj._ecuacion(k, y, np.array(ctes))
+			diferencia = max(diferencia, np.max(np.abs(obtenido - esperado)) / max(np.max(np.abs(esperado)), 1.))
+		informe['fj - ode.' + nombre] = diferencia
+
+	return informe
+
+def informe_jacobianos():
+	'''
+	Cuenta las evaluaciones de la ecuacion (nfe) y del jacobiano (nje) que realiza odeint
+	con el jacobiano por diferencias finitas y con el jacobiano exacto de jac_pendulo
+
+	---Return---
+	* <dict>: para cada caso, (nfe, nje) sin jacobiano y (nfe, nje) con jacobiano
+	'''
+	# Casos de prueba: [nombre, ecuacion, jacobiano, valores iniciales, constantes]
+	casos = [['Simple', ode.Simple, jac.Simple, (np.pi/2, 0), (9.8, 1, .1, 1)],
+		['Simple b/m alto', ode.Simple, jac.Simple, (np.pi/2, 0), (9.8, 1, 3, .01)],
+		['Doble', ode.Doble, jac.Doble, (np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1)],
+		['Triple', ode.Triple, jac.Triple, (np.pi/2, 0, np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1, 1, 1)],
+		['Esferico', ode.Esferico, jac.Esferico, (np.pi/2, 1, np.pi/2, 0), (9.8, 1)]]
+	t = np.arange(0, 20.02, 0.02)
+
+	informe = {}
+	for nombre, f, Dfun, params, argms in casos:
+
+		# Se resuelve sin y con jacobiano exacto y se suman las evaluaciones de todos los pasos
+		cuentas = []
+		for D in (None, Dfun):
+			_, info = odeint(f, params, t, args=argms, Dfun=D, full_output=True)
+			cuentas.append((int(info['nfe'][-1]), int(info['nje'][-1])))
+		informe[nombre] = cuentas
+
+	return informe
+
+def bench_metodos(metodos = ('odeint', 'LSODA', 'DOP853', 'RK45', 'Radau', 'rk4', 'verlet')):
+	'''
+	Compara el coste y la deriva de energia de los metodos de fp.Resolver para cada pendulo
+
+	---Parametros---
+	* metodos: nombres de los metodos a comparar
+
+	---Return---
+	* <dict>: para cada pendulo, lista con el informe de fp.Resolver de cada metodo
+	'''
+	# Casos de prueba: [nombre, funcion Sol_*, valores iniciales, constantes, metodos que no se usan].
+	# En el esferico la aceleracion depende de las velocidades y Verlet explicito diverge con el paso
+	# de fp.Resolver (deriva nan), asi que no se compara
+	casos = [['Simple', fp.Sol_Simple, (np.pi/2, 0), (9.8, 1, 0, 1), ()],
+		['Doble', fp.Sol_Doble, (np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1), ()],
+		['Triple', fp.Sol_Triple, (np.pi/2, 0, np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1, 1, 1), ()],
+		['Esferico', fp.Sol_Esferico, (0, 1, np.pi/2, 0), (9.8, 1), ('verlet',)]]
+	t = np.arange(0, 20.02, 0.02)
+
+	# Los desbordamientos de un metodo de paso fijo se reflejan en su deriva, sin avisos por cada paso
+	with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+		return {nombre: [Sol(t, params, argms, metodo=metodo, informe=True)[-1] for metodo in metodos if metodo not in excluidos]
+			for nombre, Sol, params, argms, excluidos in casos}
+
+def bench_ecuaciones():
+	'''
+	Mide el tiempo por llamada de cada ecuacion de ode_pendulo con un estado, de la ecuacion que usan
+	Sol_* (fj.ecuacion, compilada si hay numba) y de la cadena de N barras
+
+	---Return---
+	* <dict>: tiempos por llamada en segundos
+	'''
+	# Casos de prueba: [nombre, modelo, estado, constantes]
+	casos = [['Simple', 'simple', (np.pi/2, 0.), (9.8, 1., .1, 1.)],
+		['Doble', 'doble', (np.pi/2, 0., np.pi/2, 0.), (9.8, 1., 1., 1., 1.)],
+		['Triple', 'triple', (np.pi/2, 0., np.pi/2, 0., np.pi/2, 0.), (9.8, 1., 1., 1., 1., 1., 1.)],
+		['Esferico', 'esferico', (np.pi/2, 1., np.pi/2, 0.), (9.8, 1.)]]
+
+	tiempos = {}
+	for nombre, modelo, y, ctes in casos:
+		y = np.array(y)
+		f = getattr(ode, nombre); f_fj = fj.ecuacion(modelo, ctes)
+		tiempos['ode.' + nombre] = mide(lambda: f(y, 0, *ctes))
+		tiempos['fj.ecuacion ' + modelo] = mide(lambda: f_fj(y, 0))
+
+	L = np.ones(10); m = np.ones(10); y = np.zeros(20)
+	tiempos['ode.Cadena N=10'] = mide(lambda: ode.Cadena(y, 0, 9.8, L, m))
+
+	return tiempos
+
+def bench_soluciones():
+	'''
+	Mide el tiempo de cada Sol_* de principio a fin (sin cache) con los tiempos de las animaciones (1001 instantes)
+
+	---Return---
+	* <dict>: tiempos por resolucion en segundos
+	'''
+	# Casos de prueba: [nombre, funcion Sol_*, valores iniciales, constantes]
+	casos = [['Sol_Simple', fp.Sol_Simple, (np.pi/2, 0), (9.8, 1, .1, 1)],
+		['Sol_Doble', fp.Sol_Doble, (np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1)],
+		['Sol_Triple', fp.Sol_Triple, (np.pi/2, 0, np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1, 1, 1)],
+		['Sol_Esferico', fp.Sol_Esferico, (0, 1, np.pi/2, 0), (9.8, 1)]]
+	t = np.arange(0, 20.02, 0.02)
+
+	return {nombre: mide(lambda: Sol(t, params, argms), 3) for nombre, Sol, params, argms in casos}
+
+def bench_animacion(frames = 1001):
+	'''
+	Mide el tiempo y la memoria de construir las animaciones 2D (pendulo doble) y 3D (pendulo esferico),
+	y el tiempo de preparar todos sus frames sin dibujarlos
+
+	---Parametros---
+	* frames: numero de instantes de la animacion
+
+	---Return---
+	* <dict>: tiempos en segundos y memoria maxima reservada en bytes
+	'''
+	import matplotlib
+	matplotlib.use('Agg')
+	import matplotlib.pyplot as plt
+	import func_animacion as fa
+
+	# Las animaciones se construyen para medirlas y se borran sin llegar a dibujarse
+	warnings.filterwarnings('ignore', 'Animation was deleted')
+
+	t = np.linspace(0, 20, frames)
+	doble = fp.Sol_Doble(t, (np.pi/2, 0, np.pi/2, 0), (9.8, 1, 1, 1, 1), trayectoria=True)
+	esferico = fp.Sol_Esferico(t, (0, 1, np.pi/2, 0), (9.8, 1), trayectoria=True)
+	casos = [['Animacion2D', fa.Animacion2D, fa.escena2D, (list(doble.x), list(doble.y), doble.th_red[1], doble.th_red[0]), {'m': [1, 1]}],
+		['Animacion3D', fa.Animacion3D, fa.escena3D, (list(esferico.x), list(esferico.y), list(esferico.z), esferico.th_red[0], esferico.th_red[1]), {}]]
+
+	resultados = {}
+	for nombre, Animacion, escena, datos, opciones in casos:
+
+		# Construccion de la animacion, con la memoria maxima reservada mientras se construye
+		tracemalloc.start()
+		inicio = time.perf_counter()
+		an = Animacion(t, 2.2, *datos, **opciones)
+		resultados[nombre + ' construccion'] = time.perf_counter() - inicio
+		resultados[nombre + ' memoria'] = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		plt.close('all')
+
+		# Actualizacion de los artistas en todos los frames
+		fig = plt.figure()
+		actualiza = escena(fig, t, 2.2, *datos, **opciones)
+		inicio = time.perf_counter()
+		for i in range(frames): actualiza(i)
+		resultados[nombre + ' frames'] = time.perf_counter() - inicio
+		plt.close('all')
+		del an
+
+	return resultados
+
+def bench_energias(resoluciones = (100, 1000, 4000)):
+	'''
+	Mide el tiempo de evaluar el campo de energia del pendulo doble a varias resoluciones,
+	con las mallas que no dependen de los parametros ya calculadas
+
+	---Parametros---
+	* resoluciones: numero de puntos de cada eje
+
+	---Return---
+	* <dict>: tiempos por evaluacion en segundos
+	'''
+	import func_energias as fe
+
+	tiempos = {}
+	for r in resoluciones:
+		fe.coseno_diferencia(r, 'float64')
+		tiempos['Campo_Doble %d' % r] = mide(lambda: fe.Campo_Doble(9.8, 1, 1, 1, 1, 1, 2, r), 3)
+
+	return tiempos
+
+def bench_paso(segundos = 10, dt = 1e-2):
+	'''
+	Mide los pasos por segundo del bucle a tiempo real de func_vpython sin pantalla: los pasos que hace
+	fj.pasos en cada frame con el metodo por defecto de cada pendulo (fi.metodos_vpython). No se importa
+	func_vpython, que al importarse abre el servidor y el navegador de vpython
+
+	---Parametros---
+	* segundos: tiempo simulado en cada medida
+	* dt: intervalo temporal de cada paso
+
+	---Return---
+	* <dict>: pasos por segundo
+	'''
+	# Casos de prueba: [nombre, aceleraciones, posiciones, velocidades, constantes]
+	casos = [['simple', ode.a_simple, [np.pi/2], [0.], (9.8, 1, .1, 1)],
+		['doble', ode.a_doble, [np.pi/2, np.pi/2], [0., 0.], (9.8, 1, 1, 1, 1)],
+		['triple', ode.a_triple, [np.pi/2, np.pi/2, np.pi/2], [0., 0., 0.], (9.8, 1, 1, 1, 1, 1, 1)],
+		['esferico', ode.a_esferico, [0., np.pi/2], [1., 0.], (9.8, 1)]]
+	n = int(segundos / dt)
+
+	resultados = {}
+	for nombre, f, x, v, ctes in casos:
+		metodo = fi.metodos_vpython[nombre]
+		resultados['%s %s' % (metodo.__name__[len('paso_'):], nombre)] = n / mide(lambda: fj.pasos(metodo, f, dt, list(x), list(v), ctes, n), 3)
+
+	return resultados
+
+def bench_arranque(repeticiones = 5):
+	'''
+	Mide en un interprete nuevo lo que tarda en importarse el menu (descontando el arranque de python)
+	y cuenta los modulos de vpython (y func_vpython) que quedan cargados tras importar el menu y func_energias
+
+	---Parametros---
+	* repeticiones: numero de repeticiones de cada medida (se toma la mejor)
+
+	---Return---
+	* <dict>: tiempo de importacion en segundos y numero de modulos de vpython cargados
+	'''
+	carpeta = os.path.dirname(os.path.abspath(__file__))
+	entorno = dict(os.environ, PENDULO_PERFIL='')
+	def ejecuta(codigo):
+		inicio = time.perf_counter()
+		salida = subprocess.run([sys.executable, '-c', codigo], cwd=carpeta, env=entorno, capture_output=True, text=True, check=True).stdout
+		return time.perf_counter() - inicio, salida
+
+	base = min(ejecuta('pass')[0] for _ in range(repeticiones))
+	menu = min(ejecuta('import menu')[0] for _ in range(repeticiones))
+	_, vpython = ejecuta("import sys, menu, func_energias; print(sum(m.split('.')[0] in ('vpython', 'func_vpython') for m in sys.modules))")
+
+	return {'importar menu': menu - base, 'vpython tras func_energias': int(vpython)}
+
+# ---Grupos---
+# Para cada grupo de medidas: funcion que las devuelve en un diccionario {nombre: (valor, unidad)}.
+# En las unidades de mejores y peores se compara con la base; el resto (errores, derivas) solo se informa.
+grupos = {'ecuaciones': lambda: {k: (v, 's') for k, v in bench_ecuaciones().items()},
+			'rhs': lambda: {k: (v, 's') for k, v in bench_rhs().items()},
+			'cadena': lambda: {k: (v, 'dif' if k.startswith('Cadena - ') else 's') for k, v in comprueba_cadena().items()},
+			'jit': lambda: {k: (v, 'dif') for k, v in comprueba_jit().items()},
+			'soluciones': lambda: {k: (v, 's') for k, v in bench_soluciones().items()},
+			'jacobianos': lambda: {'%s %s' % (k, tipo): (dif_exacto[i][0], 'nfe') for k, dif_exacto in informe_jacobianos().items() for i, tipo in enumerate(('dif.', 'exacto'))},
+			'metodos': lambda: {'%s %s %s' % (k, info['metodo'], c): (info[c], u) for k, informes in bench_metodos().items() for info in informes for c, u in (('tiempo', 's'), ('deriva', 'deriva'))},
+			'animacion': lambda: {k: (v, 'B' if k.endswith('memoria') else 's') for k, v in bench_animacion().items()},
+			'energias': lambda: {k: (v, 's') for k, v in bench_energias().items()},
+			'paso': lambda: {k: (v, 'pasos/s') for k, v in bench_paso().items()},
+			'arranque': lambda: {k: (v, 'modulos' if k.startswith('vpython') else 's') for k, v in bench_arranque().items()}}
+
+# Valores maximos admitidos de algunas medidas, independientes de la base: el menu debe aparecer en
+# menos de 100 ms, las graficas de energia no deben cargar vpython y las ecuaciones de func_jit deben
+# coincidir con las de ode_pendulo
+presupuestos = {('arranque', 'importar menu'): 0.1, ('arranque', 'vpython tras func_energias'): 0}
+presupuestos.update({('jit', 'fj - ode.' + nombre): 1e-10 for nombre in ('Simple', 'Doble', 'Triple', 'Esferico')})
+
+# Unidades en las que un valor mas alto es peor y en las que un valor mas alto es mejor
+peores = ('s', 'B', 'nfe')
+mejores = ('pasos/s',)
+
+def ejecuta(nombres):
+	'''
+	Realiza los grupos de medidas indicados
+
+	---Parametros---
+	* nombres: lista de nombres de grupos
+
+	---Return---
+	* <dict>: resultados {'maquina': {...}, 'medidas': {grupo: {nombre: {'valor', 'unidad'}}}}
+	'''
+	import scipy
+	maquina = {'python': platform.python_version(), 'numpy': np.__version__, 'scipy': scipy.__version__,
+		'numba': fj.disponible, 'procesador': platform.processor() or platform.machine(), 'nucleos': os.cpu_count(),
+		'fecha': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+	medidas = {}
+	for nombre in nombres:
+		medidas[nombre] = {k: {'valor': float(v), 'unidad': u} for k, (v, u) in grupos[nombre]().items()}
+
+	return {'maquina': maquina, 'medidas': medidas}
+
+def compara(resultados, base, umbral = 0.2):
+	'''
+	Compara unos resultados con los de una ejecucion base
+
+	---Parametros---
+	* resultados: resultados de ejecuta
+	* base: resultados de una ejecucion anterior
+	* umbral: empeoramiento relativo a partir del cual una medida es una regresion (0.2: 20%)
+
+	---Return---
+	* <dict>: para cada grupo y medida presente en los dos, cociente actual/base (para pasos/s, base/actual),
+	  de forma que un valor mayor que 1 siempre es un empeoramiento
+	* <lista>: medidas (grupo, nombre, cociente) que superan el umbral
+	'''
+	cocientes, regresiones = {}, []
+	for grupo, medidas in resultados['medidas'].items():
+		for nombre, medida in medidas.items():
+			anterior = base.get('medidas', {}).get(grupo, {}).get(nombre)
+			if anterior is None or medida['unidad'] not in peores + mejores or not anterior['valor'] or not medida['valor']: continue
+			cociente = medida['valor'] / anterior['valor']
+			if medida['unidad'] in mejores: cociente = 1 / cociente
+			cocientes[grupo, nombre] = cociente
+			if cociente > 1 + umbral: regresiones.append((grupo, nombre, cociente))
+
+	return cocientes, regresiones
+
+def formato(valor, unidad):
+	'''
+	---Parametros---
+	* valor: valor de una medida
+	* unidad: unidad de la medida
+
+	---Return---
+	* <string>: valor con una escala legible
+	'''
+	if unidad == 's': return '%10.3f ms' % (valor * 1e3) if valor >= 1e-3 else '%10.3f us' % (valor * 1e6)
+	if unidad == 'B': return '%10.2f MiB' % (valor / 2**20)
+	if unidad in ('dif', 'deriva'): return '%10.2e' % valor
+	return '%10.0f %s' % (valor, unidad)
+
+if __name__ == '__main__':
+
+	# Opciones de la linea de comandos
+	parser = argparse.ArgumentParser(description='Mide el rendimiento del proyecto y lo compara con una ejecucion anterior.')
+	parser.add_argument('--grupos', nargs='+', choices=list(grupos), default=list(grupos), help='grupos de medidas (por defecto todos)')
+	parser.add_argument('--json', help='archivo en el que guardar los resultados')
+	parser.add_argument('--base', help='resultados de una ejecucion anterior con los que comparar')
+	parser.add_argument('--umbral', type=float, default=0.2, help='empeoramiento relativo que se considera regresion (por defecto 0.2)')
+	opciones = parser.parse_args()
+
+	resultados = ejecuta(opciones.grupos)
+	if opciones.json:
+		with open(opciones.json, 'w') as archivo: json.dump(resultados, archivo, indent=1)
+
+	# Se compara con la base si se indica
+	cocientes, regresiones = {}, []
+	if opciones.base:
+		with open(opciones.base) as archivo: base = json.load(archivo)
+		cocientes, regresiones = compara(resultados, base, opciones.umbral)
+
+	# Se imprimen las medidas de cada grupo, con el cociente respecto a la base
+	for grupo, medidas in resultados['medidas'].items():
+		print('\n[%s]' % grupo)
+		for nombre, medida in medidas.items():
+			cociente = cocientes.get((grupo, nombre))
+			marca = '' if cociente is None else ' x%.2f%s' % (cociente, ' REGRESION' if cociente > 1 + opciones.umbral else '')
+			print('%-40s %s%s' % (nombre, formato(medida['valor'], medida['unidad']), marca))
+
+	# Se comprueban los presupuestos de las medidas realizadas
+	excesos = [(grupo, nombre) for (grupo, nombre), maximo in presupuestos.items()
+		if nombre in resultados['medidas'].get(grupo, {}) and resultados['medidas'][grupo][nombre]['valor'] > maximo]
+	for grupo, nombre in excesos:
+		print('%s: %s supera el presupuesto (%g)' % (grupo, nombre, presupuestos[grupo, nombre]))
+
+	if regresiones:
+		print('\n%d regresiones por encima del %.0f%%' % (len(regresiones), opciones.umbral * 100))
+	if regresiones or excesos: sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,171 @@
+'''
+Programa que lanza los experimentos desde la terminal sin pasar por el menu ni por la ventana de sliders.
+Los valores se leen de los argumentos o de un archivo JSON; las variables que no se indiquen toman el
+valor inicial de las tablas de func_sliders.
+
+Ejemplos:
+	python cli.py simple --param m=2 --param theta_0=120 --archivo simple.gif
+	python cli.py doble --modo solucion --config configuraciones.json --salida doble.npz
+	python cli.py triple --variables
+'''
+
+# ---Imports---
+# os: rutas de archivos
+import os
+# sys: argumentos de la terminal
+import sys
+# json: lectura de archivos de configuracion
+import json
+# argparse: lectura de argumentos de la terminal
+import argparse
+
+# ---Modos---
+# Modulo y descripcion de cada modo (los modulos se importan solo al usarlos)
+modos = {'animacion': ('func_pendulo', 'animacion de matplotlib (o exportacion si se indica --archivo)'),
+			'vpython': ('func_vpython', 'representacion con vpython'),
+			'energia': ('func_energias', 'graficas de regimenes de energia (o imagen si se indica --archivo)'),
+			'solucion': ('func_pendulo', 'solo resuelve y guarda la trayectoria en un .npz (--salida)')}
+
+# ---Funciones---
+def lee_param(texto):
+	'''
+	Convierte un argumento nombre=valor en una tupla
+
+	---Parametros---
+	* texto: string con formato nombre=valor
+
+	---Return---
+	* <tupla>: (nombre, valor)
+	'''
+	nombre, igual, valor = texto.partition('=')
+	if not igual: raise argparse.ArgumentTypeError('Se esperaba nombre=valor y se recibio %r' % texto)
+	try: return nombre.strip(), float(valor)
+	except ValueError: raise argparse.ArgumentTypeError('Valor no numerico en %r' % texto)
+
+def ejecuciones(config, params):
+	'''
+	Construye la lista de ejecuciones a partir del archivo de configuracion y de los --param
+
+	---Parametros---
+	* config: ruta de un JSON con un diccionario {nombre: valor} o una lista de ellos (o None)
+	* params: lista de tuplas (nombre, valor) que se aplican sobre cada ejecucion
+
+	---Return---
+	* <lista>: diccionarios de valores, uno por ejecucion
+	'''
+	lista = [{}]
+	if config is not None:
+		with open(config) as archivo: datos = json.load(archivo)
+		lista = datos if isinstance(datos, list) else [datos]
+
+	return [dict(valores, **dict(params)) for valores in lista]
+
+def numera(ruta, n, total):
+	'''
+	Añade el numero de ejecucion a una ruta cuando hay varias ejecuciones
+
+	---Parametros---
+	* ruta: ruta de salida (o None)
+	* n: numero de la ejecucion
+	* total: numero total de ejecuciones
+
+	---Return---
+	* <string>: ruta numerada (la misma si solo hay una ejecucion)
+	'''
+	if ruta is None or total == 1: return ruta
+	base, extension = os.path.splitext(ruta)
+	return '%s_%04d%s' % (base, n, extension)
+
+def solucion(modelo, valores, salida, t_f = 20, dt = 0.02, muestras = None):
+	'''
+	Resuelve un pendulo sin representarlo y guarda el resultado
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* valores: diccionario de valores de las variables de func_sliders
+	* salida: ruta del .npz de salida (None: no se guarda)
+	* t_f: tiempo final
+	* dt: intervalo temporal entre instantes
+	* muestras: si se indica, se resuelve con salida densa (fp.Sol_Denso) y se interpola en ese numero de instantes
+
+	---Return---
+	* <dict>: arrays con los tiempos, valores de la tabla y columnas de Sol_*
+	'''
+	import numpy as np
+	import func_pendulo as fp
+	import func_sliders as fs
+
+	tabla, Prepara, Sol = fp.modelos[modelo]
+	valores = fs.obtener_valores(tabla, valores)
+	params, args = Prepara(valores)
+
+	# Se resuelve y se guardan las columnas junto a los valores usados
+	if muestras is None:
+		t = np.arange(0, t_f + dt, dt)
+		datos = {'t': t, 'valores': np.array(valores), 'columnas': np.array(Sol(t, params, args))}
+	else:
+		densa = fp.Sol_Denso(modelo, t_f, params, args)
+		tr = densa.muestrea(n=muestras)
+		datos = {'t': tr.t, 'valores': np.array(valores), 'columnas': np.array(tr.columnas()), 'nodos': densa.nodos}
+	if salida is not None: np.savez(salida, **datos)
+
+	return datos
+
+def main(argv = None):
+	'''
+	Lee los argumentos de la terminal y lanza las ejecuciones
+
+	---Parametros---
+	* argv: lista de argumentos (None: sys.argv)
+	'''
+	parser = argparse.ArgumentParser(description='Experimentos con pendulos sin menu ni sliders')
+	parser.add_argument('modelo', choices=['simple', 'doble', 'triple', 'esferico'])
+	parser.add_argument('--modo', choices=list(modos), default='animacion',
+		help='; '.join('%s: %s' % (m, d) for m, (_, d) in modos.items()))
+	parser.add_argument('--param', type=lee_param, action='append', default=[], metavar='NOMBRE=VALOR',
+		help='valor de una variable (repetible); ver --variables')
+	parser.add_argument('--config', help='JSON con un diccionario de valores o una lista de ellos (una ejecucion por elemento)')
+	parser.add_argument('--archivo', help='exporta la animacion (.mp4, .gif, .png) o la grafica de energia (.png, .pdf)')
+	parser.add_argument('--salida', help='archivo .npz del modo solucion')
+	parser.add_argument('--tf', type=float, default=20, help='tiempo final del modo solucion')
+	parser.add_argument('--dt', type=float, default=0.02, help='intervalo temporal del modo solucion')
+	parser.add_argument('--muestras', type=int, help='modo solucion con paso adaptativo y salida densa, interpolada en MUESTRAS instantes')
+	parser.add_argument('--variables', action='store_true', help='muestra las variables del modelo y sus limites')
+	parser.add_argument('--perfil', nargs='?', const='', metavar='ARCHIVO.prof',
+		help='informe de tiempos al terminar; con un archivo, ademas perfil de cProfile (ver func_perfil)')
+	args = parser.parse_args(argv)
+
+	# La instrumentacion se activa antes de importar los modulos instrumentados
+	if args.perfil is not None:
+		import func_perfil as fpe
+		fpe.activa(args.perfil or None)
+
+	import func_sliders as fs
+	tabla = getattr(fs, args.modelo)
+
+	# Se muestran las variables disponibles
+	if args.variables:
+		for fila in tabla: print('%-12s %10s  [%s, %s]' % (fs.nombre(fila), fila[1], fila[2], fila[3]))
+		return
+
+	# Sin pantalla solo se usa el backend Agg de matplotlib
+	if args.archivo is not None or args.modo == 'solucion':
+		import matplotlib
+		matplotlib.use('Agg')
+
+	lista = ejecuciones(args.config, args.param)
+	for n, valores in enumerate(lista):
+		if args.modo == 'solucion':
+			solucion(args.modelo, valores, numera(args.salida, n, len(lista)), args.tf, args.dt, args.muestras)
+			continue
+
+		modulo = __import__(modos[args.modo][0])
+		funcion = getattr(modulo, args.modelo.capitalize())
+		if args.modo == 'vpython': funcion(valores)
+		else: funcion(valores, numera(args.archivo, n, len(lista)))
+
+if __name__ == '__main__':
+
+	# Se lanza con los argumentos de la terminal
+	try: main()
+	except ValueError as error: sys.exit('Error: %s' % error)
\ No newline at end of file
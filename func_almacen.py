@@ -0,0 +1,206 @@
+'''
+Implementa un almacen en disco de trayectorias de pendulos organizado por columnas y por bloques.
+Cada bloque de trayectorias guarda cada columna de Sol_* (angulos, velocidades y posiciones) en su propio
+archivo .npy, que se lee con memmap sin cargarlo entero, o todas las columnas en un .npz comprimido.
+La descripcion del almacen (columnas, tiempos, tipo de datos y tamaño de los bloques) se guarda en meta.json.
+'''
+
+# ---Imports---
+# os: rutas de archivos
+import os
+# json: descripcion del almacen
+import json
+# numpy (np): manejo de arrays
+import numpy as np
+
+# ---Columnas---
+# Nombre de las columnas que devuelve cada funcion Sol_* de func_pendulo, en orden
+columnas_sol = {'simple': ['th', 'w', 'x', 'y'],
+				'doble': ['th1', 'w1', 'th2', 'w2', 'x1', 'y1', 'x2', 'y2'],
+				'triple': ['th1', 'w1', 'th2', 'w2', 'th3', 'w3', 'x1', 'y1', 'x2', 'y2', 'x3', 'y3'],
+				'esferico': ['th', 'wth', 'ph', 'wph', 'x', 'y', 'z']}
+
+# ---Clases---
+class Almacen:
+	'''
+	Almacen de trayectorias en una carpeta. Se crea indicando las columnas y los tiempos, o se abre
+	una carpeta existente indicando solo la ruta.
+
+	---Parametros---
+	* carpeta: carpeta del almacen
+	* columnas: lista de nombres de columnas, o nombre de un modelo de columnas_sol (None: se abre la carpeta)
+	* t: array de tiempos comun a todas las trayectorias
+	* dtype: tipo de los datos guardados ('float64' o 'float32')
+	* comprimir: si es True cada bloque se guarda en un .npz comprimido (no admite memmap)
+	'''
+	def __init__(self, carpeta, columnas = None, t = None, dtype = 'float64', comprimir = False):
+		self.carpeta = carpeta
+		ruta = os.path.join(carpeta, 'meta.json')
+
+		# Se abre un almacen existente
+		if columnas is None:
+			with open(ruta) as archivo: self.meta = json.load(archivo)
+			self.t = np.load(os.path.join(carpeta, 't.npy'))
+
+		# Se crea un almacen nuevo
+		else:
+			if os.path.exists(ruta): raise ValueError('Ya existe un almacen en %s' % carpeta)
+			if isinstance(columnas, str): columnas = columnas_sol[columnas]
+			os.makedirs(carpeta, exist_ok=True)
+			self.t = np.asarray(t, dtype=float)
+			np.save(os.path.join(carpeta, 't.npy'), self.t)
+			self.meta = {'columnas': list(columnas), 'dtype': np.dtype(dtype).name, 'comprimir': comprimir, 'bloques': []}
+			self._guarda_meta()
+
+		# Primera trayectoria de cada bloque y ultimo bloque leido de un .npz
+		self._inicios = np.cumsum([0] + self.meta['bloques'])
+		self._npz = (None, None)
+
+	def _guarda_meta(self):
+		'''
+		Escribe meta.json sustituyendo el anterior de una vez, para que no quede a medias
+		'''
+		ruta = os.path.join(self.carpeta, 'meta.json')
+		with open(ruta + '.tmp', 'w') as archivo: json.dump(self.meta, archivo, indent=1)
+		os.replace(ruta + '.tmp', ruta)
+
+	def __len__(self):
+		'''
+		---Return---
+		* <int>: numero de trayectorias guardadas
+		'''
+		return int(self._inicios[-1])
+
+	@property
+	def columnas(self):
+		'''
+		---Return---
+		* <lista>: nombres de las columnas
+		'''
+		return self.meta['columnas']
+
+	def _archivo(self, b, columna = None):
+		'''
+		---Parametros---
+		* b: numero de bloque
+		* columna: nombre de la columna (solo sin compresion)
+
+		---Return---
+		* <string>: ruta del archivo del bloque
+		'''
+		if self.meta['comprimir']: return os.path.join(self.carpeta, 'bloque_%05d.npz' % b)
+		return os.path.join(self.carpeta, 'bloque_%05d_%s.npy' % (b, columna))
+
+	def agrega(self, datos):
+		'''
+		Guarda un bloque de trayectorias al final del almacen
+
+		---Parametros---
+		* datos: array (N, columnas, T), por ejemplo np.stack de las salidas de Sol_*,
+		  o diccionario {columna: array (N, T)}
+		'''
+		if not isinstance(datos, dict): datos = dict(zip(self.columnas, np.moveaxis(np.asarray(datos), 1, 0)))
+		faltan = set(self.columnas) - set(datos)
+		if faltan: raise ValueError('Faltan columnas: %s' % ', '.join(sorted(faltan)))
+
+		# Se pasa cada columna al tipo del almacen y se comprueba la forma
+		datos = {c: np.asarray(datos[c], dtype=self.meta['dtype']) for c in self.columnas}
+		n = len(datos[self.columnas[0]])
+		for c, d in datos.items():
+			if d.shape != (n, len(self.t)): raise ValueError('La columna %s tiene forma %s y se esperaba %s' % (c, d.shape, (n, len(self.t))))
+
+		# Se escriben los archivos del bloque y despues se registra en meta.json
+		b = len(self.meta['bloques'])
+		if self.meta['comprimir']: np.savez_compressed(self._archivo(b), **datos)
+		else:
+			for c, d in datos.items(): np.save(self._archivo(b, c), d)
+		self.meta['bloques'].append(n)
+		self._inicios = np.append(self._inicios, len(self) + n)
+		self._guarda_meta()
+
+	def _bloque(self, b, columna):
+		'''
+		---Parametros---
+		* b: numero de bloque
+		* columna: nombre de la columna
+
+		---Return---
+		* <np.array>: columna del bloque, de forma (N del bloque, T) (memmap sin compresion)
+		'''
+		if not self.meta['comprimir']: return np.load(self._archivo(b, columna), mmap_mode='r')
+
+		# Se mantiene abierto el ultimo .npz para no descomprimir su indice en cada lectura
+		if self._npz[0] != b: self._npz = (b, np.load(self._archivo(b)))
+		return self._npz[1][columna]
+
+	def lee(self, columna, trayectorias = slice(None), tiempos = slice(None)):
+		'''
+		Lee una columna de un conjunto de trayectorias y de tiempos; solo se leen de disco los bloques necesarios
+
+		---Parametros---
+		* columna: nombre de la columna
+		* trayectorias: indice entero, slice o array de indices de trayectorias
+		* tiempos: indice, slice o array de indices de tiempos
+
+		---Return---
+		* <np.array>: array (trayectorias, tiempos) con los datos (sin la primera dimension si trayectorias es un entero)
+		'''
+		if columna not in self.columnas: raise ValueError('Columna desconocida: %s (validas: %s)' % (columna, ', '.join(self.columnas)))
+		indices = np.arange(len(self))[trayectorias]
+		unico = np.ndim(indices) == 0
+		indices = np.atleast_1d(indices)
+
+		# Se agrupan los indices por bloque y se lee cada bloque una vez
+		bloques = np.searchsorted(self._inicios, indices, side='right') - 1
+		partes = []
+		for b in np.unique(bloques):
+			locales = indices[bloques == b] - self._inicios[b]
+			partes.append((np.flatnonzero(bloques == b), self._bloque(b, columna)[locales][:, tiempos]))
+
+		# Se colocan los resultados en el orden pedido
+		forma = (len(indices),) + np.shape(self.t[tiempos])
+		salida = np.empty(forma, dtype=self.meta['dtype'])
+		for posiciones, datos in partes: salida[posiciones] = datos
+
+		return salida[0] if unico else salida
+
+	def trayectoria(self, i, tiempos = slice(None)):
+		'''
+		Lee todas las columnas de una trayectoria
+
+		---Parametros---
+		* i: indice de la trayectoria
+		* tiempos: indice, slice o array de indices de tiempos
+
+		---Return---
+		* <dict>: array de cada columna por su nombre
+		'''
+		return {c: self.lee(c, i, tiempos) for c in self.columnas}
+
+# ---Funciones---
+def Desde_Barrido(origen, destino, dtype = 'float32', comprimir = False):
+	'''
+	Pasa los bloques de un barrido de func_barrido a un almacen
+
+	---Parametros---
+	* origen: carpeta de salida de func_barrido.Barrido
+	* destino: carpeta del almacen nuevo
+	* dtype: tipo de los datos guardados
+	* comprimir: si es True cada bloque se guarda comprimido
+
+	---Return---
+	* <Almacen>: almacen con las trayectorias; los valores de cada muestra se guardan en destino/valores.npy
+	'''
+	muestras = np.load(os.path.join(origen, 'muestras.npz'))
+	almacen = Almacen(destino, str(muestras['modelo']), muestras['t'], dtype, comprimir)
+
+	# Se copian los bloques en orden, uno a uno para no cargar todo el barrido en memoria
+	valores = []
+	for nombre in sorted(os.listdir(origen)):
+		if nombre.startswith('bloque_') and nombre.endswith('.npz'):
+			bloque = np.load(os.path.join(origen, nombre))
+			almacen.agrega(bloque['columnas'])
+			valores.append(bloque['valores'])
+	np.save(os.path.join(destino, 'valores.npy'), np.concatenate(valores))
+
+	return almacen
\ No newline at end of file
@@ -3,98 +3,180 @@ Implementa funciones que permiten animar pendulos con matplotlib.
 '''
 
 # ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
 # matplotlib.pyplot (plt): impresion grafica 2D
 import matplotlib.pyplot as plt
 # matplotlib.animation (anim): animacion grafica
 import matplotlib.animation as anim
+# matplotlib.artist.Artist: objetos graficos propios
+from matplotlib.artist import Artist
 # mpl_toolkits.mplot3d.Axes3D: impresion grafica 3D
 from mpl_toolkits.mplot3d import Axes3D
+# func_perfil (fpe): instrumentacion opcional
+import func_perfil as fpe
 
 
+# ---Clases---
+class Traza(Artist):
+	'''
+	Traza del espacio de fases guardada como una imagen con el tamaño en pixeles de los ejes. Al dibujarla
+	solo se pintan en la imagen los puntos nuevos y se copia la imagen a la figura, asi que su coste no
+	crece con el numero de puntos ya recorridos. La imagen se vuelve a pintar entera solo si cambian el
+	tamaño o los limites de los ejes o si se vuelve a un instante anterior.
+	'''
+	def __init__(self, ax, fasex, fasey):
+		'''
+		---Parametros---
+		* ax: ejes del espacio de fases
+		* fasex: array de variable en el eje x
+		* fasey: array de variable en el eje y
+		'''
+		super().__init__()
+		self.puntos = np.column_stack((fasex, fasey))
+		self.instante = 0
+		self.pintados = 0
+		self.pixeles = None
+		self.vista = None
+		ax.add_artist(self)
+
+	def set_instante(self, i):
+		'''
+		Fija el instante de la traza: se dibujan los puntos anteriores a i
+
+		---Parametros---
+		* i: indice del instante
+		'''
+		self.instante = i
+		self.stale = True
+
+	def draw(self, renderer):
+		'''
+		Pinta los puntos nuevos y copia la imagen de la traza sobre los ejes
+
+		---Parametros---
+		* renderer: renderer de matplotlib
+		'''
+		if not self.get_visible(): return
+		caja = self.axes.bbox
+		x0, y0 = int(caja.x0), int(caja.y0)
+		ancho, alto = max(int(caja.width), 1), max(int(caja.height), 1)
+
+		# Si cambian los ejes o se vuelve atras se empieza una imagen nueva
+		vista = (x0, y0, ancho, alto, tuple(self.axes.viewLim.bounds))
+		if vista != self.vista or self.instante < self.pintados:
+			self.pixeles = np.zeros((alto, ancho, 4), dtype=np.uint8)
+			self.vista = vista
+			self.pintados = 0
+
+		# Se pasan a pixeles solo los puntos nuevos y se pintan en negro los que caen dentro de los ejes
+		nuevos = self.axes.transData.transform(self.puntos[self.pintados:self.instante]) - (x0, y0)
+		dentro = np.all(np.isfinite(nuevos), axis=1)
+		columnas, filas = nuevos[dentro].astype(int).T
+		dentro = (columnas >= 0) & (columnas < ancho) & (filas >= 0) & (filas < alto)
+		self.pixeles[alto - 1 - filas[dentro], columnas[dentro], 3] = 255
+		self.pintados = self.instante
+
+		gc = renderer.new_gc()
+		gc.set_clip_rectangle(caja)
+		renderer.draw_image(gc, x0, y0, self.pixeles)
+		gc.restore()
+		self.stale = False
+
 # ---Funciones---
-def Animacion2D(t, size, x, y, fasex, fasey, fasex_label = '', fasey_label = '', m = [1]):
+def escena2D(fig, t, size, x, y, fasex, fasey, fasex_label = '', fasey_label = '', m = [1]):
 	'''
-	Realiza una animacion en 2D con matplotlib de pendulos iterados.
+	Crea en una figura los objetos graficos de la animacion en 2D y la funcion que los actualiza.
+	Los objetos se crean una unica vez; en cada frame solo se cambian sus datos.
 
 	---Parametros---
-	* t: array de tiempos
-	* size: radio del espacio que ocupa el pendulo
-	* x: lista que contiene arrays de posiciones x para cada bola a animar
-	* y: lista que contiene arrays de posiciones y para cada bola a animar
-	* fasex: array de variable para representar en espacio de fases en eje x
-	* fasey: array de variable para representar en espacio de fases en eje y
-	* fasex_label: label del eje x en el espacio de fases
-	* fasey_label: label del eje y en el espacio de fases
-	* m: lista con las masas de cada bola
+	* fig: figura de matplotlib en la que dibujar
+	* t, size, x, y, fasex, fasey, fasex_label, fasey_label, m: ver Animacion2D
 
 	---Return---
-	* <ArtistAnimation>: realiza la animacion
+	* <funcion>: actualiza(i) coloca los objetos en el instante i y devuelve la lista de objetos
 	'''
-	# Creacion de la figura y los axes y configuraciones esteticas
-	fig, ax = plt.subplots(1,2,figsize = (10,10))
+	# Creacion de los axes y configuraciones esteticas
+	ax = fig.subplots(1,2)
 	ax[0].set_aspect('equal')
 	ax[0].set_xlim(-size, size)
 	ax[0].set_ylim(-size, size)
 	ax[1].set_xlabel(fasex_label)
 	ax[1].set_ylabel(fasey_label)
 
+	# Con blitting los ejes no se reescalan solos: se fijan los limites del espacio de fases
+	ax[1].update_datalim(np.column_stack((fasex, fasey)))
+	ax[1].autoscale_view()
+
 	# Se crea una lista con colores para usarse en la animacion
 	colores = ['red','blue','green']
 
-	# Se inicializa la lista que contendra el pendulo y el temporizador
-	objetos = []
-
-	# Se itera para cada instante de tiempo
-	for i, ti in enumerate(t):
-
-		# Se inicializa la lista que contendra las distintas secciones del pendulo
-		pendulo = []
+	# Se crean una unica vez las barras, las bolas, la traza en el espacio de fases y el temporizador
+	barras, = ax[0].plot([], [], '-', color='black')
+	bolas = ax[0].scatter(np.zeros(len(x)), np.zeros(len(x)), s=[100 * m[j] for j in range(len(x))], color=[colores[j % len(colores)] for j in range(len(x))], zorder=3)
+	fases = Traza(ax[1], fasex, fasey)
+	tempo = ax[0].text(0.05, 0.9, '', transform=ax[0].transAxes)
+	objetos = [barras, bolas, fases, tempo]
 
-		# Se itera para cada bola tomando sus componentes x e y
-		for j, xj in enumerate(x):
+	# Se define la actualizacion de los objetos para el instante i
+	def actualiza(i):
 
-			# Se crea la barra correspondiente y se añade a la lista
-			barra, = ax[0].plot((0,xj[i]), (0,y[j][i]), '-', color='black') if j == 0 else ax[0].plot((x[j-1][i],xj[i]), (y[j-1][i],y[j][i]), '-', color='black')
-			pendulo.append(barra)
+		# Posiciones de las articulaciones desde el origen hasta la ultima bola
+		xi = [0] + [xj[i] for xj in x]
+		yi = [0] + [yj[i] for yj in y]
+		barras.set_data(xi, yi)
+		bolas.set_offsets(np.column_stack((xi[1:], yi[1:])))
 
-			# Se crea la bola correspondiente y se añade a la lista
-			bola = ax[0].scatter(xj[i], y[j][i], s=100 * m[j], color=colores[j % len(colores)], zorder=3)
-			pendulo.append(bola)
+		# En la traza solo se pintaran los puntos nuevos desde el frame anterior
+		fases.set_instante(i)
 
-			# Se crea la traza en el espacio de fases y se añade a la lista
-			fases, = ax[1].plot(fasex[:i],fasey[:i],'k.', markersize=1)
-			pendulo.append(fases)
+		tempo.set_text('t = %.2fs' % (t[i]))
 
-		# Se crea el temporizador y se añade a la lista
-		tempo = ax[0].text(0.05, 0.9, 't = %.2fs' % (ti), transform=ax[0].transAxes)
-		pendulo.append(tempo)
+		return objetos
 
-		# Se añaden la instantanea del pendulo a la lista
-		objetos.append(pendulo)
+	return fpe.cronometro('frame 2D')(actualiza)
 
-	# Se realiza la animacion al retornar un ArtistAnimation
-	return anim.ArtistAnimation(fig, objetos, interval=1)
-
-def Animacion3D(t, size, x, y, z, fasex, fasey, fasex_label = '', fasey_label = ''):
+def Animacion2D(t, size, x, y, fasex, fasey, fasex_label = '', fasey_label = '', m = [1]):
 	'''
-	Realiza una animacion en 3D con matplotlib de pendulos esfericos iterados.
+	Realiza una animacion en 2D con matplotlib de pendulos iterados.
+	Los objetos graficos se crean una unica vez y en cada frame solo se actualizan sus datos,
+	redibujando unicamente lo que cambia (blitting).
 
 	---Parametros---
 	* t: array de tiempos
 	* size: radio del espacio que ocupa el pendulo
 	* x: lista que contiene arrays de posiciones x para cada bola a animar
 	* y: lista que contiene arrays de posiciones y para cada bola a animar
-	* z: lista que contiene arrays de posiciones y para cada bola a animar
 	* fasex: array de variable para representar en espacio de fases en eje x
 	* fasey: array de variable para representar en espacio de fases en eje y
 	* fasex_label: label del eje x en el espacio de fases
 	* fasey_label: label del eje y en el espacio de fases
+	* m: lista con las masas de cada bola
 
 	---Return---
-	* <ArtistAnimation>: realiza la animacion
+	* <FuncAnimation>: realiza la animacion
 	'''
-	# Creacion de la figura y los axes y configuraciones esteticas
-	fig = plt.figure()
+	# Se crea la figura y en ella la escena
+	fig = plt.figure(figsize = (10,10))
+	actualiza = escena2D(fig, t, size, x, y, fasex, fasey, fasex_label, fasey_label, m)
+	fpe.figura(fig, 'animacion 2D')
+
+	# Se realiza la animacion al retornar un FuncAnimation
+	return anim.FuncAnimation(fig, actualiza, frames=len(t), interval=1, blit=True)
+
+def escena3D(fig, t, size, x, y, z, fasex, fasey, fasex_label = '', fasey_label = ''):
+	'''
+	Crea en una figura los objetos graficos de la animacion en 3D y la funcion que los actualiza.
+	Los objetos se crean una unica vez; en cada frame solo se cambian sus datos.
+
+	---Parametros---
+	* fig: figura de matplotlib en la que dibujar
+	* t, size, x, y, z, fasex, fasey, fasex_label, fasey_label: ver Animacion3D
+
+	---Return---
+	* <funcion>: actualiza(i) coloca los objetos en el instante i y devuelve la lista de objetos
+	'''
+	# Creacion de los axes y configuraciones esteticas
 	ax1 = fig.add_subplot(1, 2, 1, projection = '3d')
 	ax2 = fig.add_subplot(1, 2, 2)
 	ax1.set_xlim((-size, size))
@@ -103,39 +185,63 @@ def Animacion3D(t, size, x, y, z, fasex, fasey, fasex_label = '', fasey_label =
 	ax2.set_xlabel(fasex_label)
 	ax2.set_ylabel(fasey_label)
 
+	# Se fijan los limites del espacio de fases, que no se reescala al actualizar los datos
+	ax2.update_datalim(np.column_stack((fasex, fasey)))
+	ax2.autoscale_view()
+
 	# Se crea una lista con colores para usarse en la animacion
 	colores = ['red','blue','green']
 
-	# Se inicializa la lista que contendra el pendulo y el temporizador
-	objetos = []
+	# Se crean una unica vez las barras, las bolas, la traza en el espacio de fases y el temporizador
+	barras, = ax1.plot([], [], [], '-', color='black')
+	bolas = [ax1.plot([], [], [], 'o', color=colores[j%len(colores)])[0] for j in range(len(x))]
+	fases = Traza(ax2, fasex, fasey)
+	tempo = ax1.text2D(0.05, 0.9, '', transform=ax1.transAxes)
 
-	# Se itera para cada instante de tiempo
-	for i, ti in enumerate(t):
+	# Se define la actualizacion de los objetos para el instante i
+	def actualiza(i):
 
-		# Se inicializa la lista que contendra las distintas secciones del pendulo
-		pendulo = []
+		# Posiciones de las articulaciones desde el origen hasta la ultima bola
+		xi = [0] + [xj[i] for xj in x]
+		yi = [0] + [yj[i] for yj in y]
+		zi = [0] + [zj[i] for zj in z]
+		barras.set_data_3d(xi, yi, zi)
+		for j, bola in enumerate(bolas):
+			bola.set_data_3d([xi[j+1]], [yi[j+1]], [zi[j+1]])
 
-		# Se itera para cada bola tomando sus componentes x, y, z
-		for j, xj in enumerate(x):
+		# En la traza solo se pintaran los puntos nuevos desde el frame anterior
+		fases.set_instante(i)
 
-			# Se crea la barra correspondiente y se añade a la lista
-			barra, = ax1.plot((0,xj[i]), (0,y[j][i]), (0,z[j][i]), '-', color='black') if j == 0 else ax1.plot((x[j-1][i],xj[i]), (y[j-1][i],y[j][i]), (z[j-1][i],z[j][i]),'-', color='black')
-			pendulo.append(barra)
+		tempo.set_text('t = %.2fs' % (t[i]))
 
-			# Se crea la bola correspondiente y se añade a la lista
-			bola, = ax1.plot((xj[i],xj[i]), (y[j][i],y[j][i]), (z[j][i],z[j][i]), 'o', color=colores[j%len(colores)])
-			pendulo.append(bola)
+		return [barras, fases, tempo] + bolas
 
-			# Se crea la traza en el espacio de fases y se añade a la lista
-			fases, = ax2.plot(fasex[:i],fasey[:i],'k.', markersize=1)
-			pendulo.append(fases)
+	return fpe.cronometro('frame 3D')(actualiza)
 
-		# Se crea el temporizador y se añade a la lista
-		tempo = ax1.text(0.05, 0.9, 0.05, 't = %.2fs' % (ti), transform=ax1.transAxes)
-		pendulo.append(tempo)
+def Animacion3D(t, size, x, y, z, fasex, fasey, fasex_label = '', fasey_label = ''):
+	'''
+	Realiza una animacion en 3D con matplotlib de pendulos esfericos iterados.
+	Los objetos graficos se crean una unica vez y en cada frame solo se actualizan sus datos
+	(los ejes 3D no admiten blitting, por lo que se redibuja la figura).
 
-		# Se añade la instantanea del pendulo a la lista
-		objetos.append(pendulo)
+	---Parametros---
+	* t: array de tiempos
+	* size: radio del espacio que ocupa el pendulo
+	* x: lista que contiene arrays de posiciones x para cada bola a animar
+	* y: lista que contiene arrays de posiciones y para cada bola a animar
+	* z: lista que contiene arrays de posiciones y para cada bola a animar
+	* fasex: array de variable para representar en espacio de fases en eje x
+	* fasey: array de variable para representar en espacio de fases en eje y
+	* fasex_label: label del eje x en el espacio de fases
+	* fasey_label: label del eje y en el espacio de fases
+
+	---Return---
+	* <FuncAnimation>: realiza la animacion
+	'''
+	# Se crea la figura y en ella la escena
+	fig = plt.figure()
+	actualiza = escena3D(fig, t, size, x, y, z, fasex, fasey, fasex_label, fasey_label)
+	fpe.figura(fig, 'animacion 3D')
 
 	# Se realiza la animacion
-	return anim.ArtistAnimation(fig, objetos, interval=1)
+	return anim.FuncAnimation(fig, actualiza, frames=len(t), interval=1)
\ No newline at end of file
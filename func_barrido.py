@@ -0,0 +1,158 @@
+'''
+Implementa un barrido de parametros sobre las tablas de variables de func_sliders.
+Las muestras se generan en malla, al azar o por hipercubo latino entre los limites de cada variable,
+se resuelven con las funciones Sol_* de func_pendulo repartidas en bloques entre un conjunto de procesos
+y cada bloque se guarda en disco en cuanto termina, de forma que un barrido interrumpido se puede retomar.
+'''
+
+# ---Imports---
+# os: rutas de archivos y numero de nucleos
+import os
+# time: medicion de tiempos
+import time
+# multiprocessing (mp): conjunto de procesos
+import multiprocessing as mp
+# numpy (np): manejo de arrays
+import numpy as np
+# func_sliders (fs): tablas de variables
+import func_sliders as fs
+# func_pendulo (fp): funciones para trabajar con pendulos
+import func_pendulo as fp
+
+# ---Funciones---
+def muestras(modelo, n, modo = 'aleatorio', variables = None, fijos = None, semilla = 0):
+	'''
+	Genera las muestras de un barrido entre los limites de la tabla de variables de un modelo
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico' (ver fp.modelos)
+	* n: en 'malla', puntos por variable; en 'aleatorio' y 'lhs', numero total de muestras
+	* modo: 'malla' (producto cartesiano), 'aleatorio' (uniforme) o 'lhs' (hipercubo latino)
+	* variables: nombres de las variables que se barren (None: todas); el resto toma su valor inicial
+	* fijos: diccionario {nombre: valor} con valores distintos del inicial para las variables no barridas
+	* semilla: semilla del generador aleatorio
+
+	---Return---
+	* <np.array>: array (N, variables de la tabla) con los valores de cada muestra en el orden de la tabla
+	'''
+	tabla = fp.modelos[modelo][0]
+	nombres = [fs.nombre(fila) for fila in tabla]
+	if variables is None: variables = nombres
+	desconocidas = set(variables) - set(nombres)
+	if desconocidas: raise ValueError('Variables desconocidas: %s (validas: %s)' % (', '.join(sorted(desconocidas)), ', '.join(nombres)))
+
+	# Limites de las variables barridas
+	columnas = [nombres.index(v) for v in variables]
+	minimo = np.array([float(tabla[c][2]) for c in columnas])
+	maximo = np.array([float(tabla[c][3]) for c in columnas])
+	rng = np.random.default_rng(semilla)
+
+	# Valores en el hipercubo unidad [0,1]^d de las variables barridas
+	if modo == 'malla':
+		ejes = np.meshgrid(*[np.linspace(0, 1, n)] * len(columnas), indexing='ij')
+		u = np.stack([eje.ravel() for eje in ejes], axis=1)
+	elif modo == 'aleatorio':
+		u = rng.random((n, len(columnas)))
+	elif modo == 'lhs':
+		# Cada variable se divide en n estratos y cada muestra cae en un estrato distinto de cada variable
+		u = (np.argsort(rng.random((len(columnas), n)), axis=1).T + rng.random((n, len(columnas)))) / n
+	else: raise ValueError('Modo desconocido: %s (validos: malla, aleatorio, lhs)' % modo)
+
+	# Se parte de los valores iniciales (comprobados con fs.obtener_valores) y se colocan las muestras
+	valores = np.tile(fs.obtener_valores(tabla, fijos or {}), (len(u), 1))
+	valores[:, columnas] = minimo + u * (maximo - minimo)
+
+	return valores
+
+def _resuelve(tarea):
+	'''
+	Resuelve un bloque de muestras y lo guarda en disco
+
+	---Parametros---
+	* tarea: tupla (modelo, valores del bloque, array de tiempos, ruta del archivo .npz)
+
+	---Return---
+	* <int>: numero de trayectorias resueltas
+	'''
+	modelo, valores, t, ruta = tarea
+	_, Prepara, Sol = fp.modelos[modelo]
+
+	# Columnas de Sol_* de cada trayectoria, con forma (muestras, columnas, T)
+	columnas = np.stack([np.array(Sol(t, *Prepara(fila))) for fila in valores])
+
+	# Se escribe en un archivo temporal y se renombra, para no dejar bloques a medias si se interrumpe
+	temporal = ruta + '.tmp'
+	with open(temporal, 'wb') as archivo: np.savez(archivo, valores=valores, columnas=columnas)
+	os.replace(temporal, ruta)
+
+	return len(valores)
+
+def Barrido(modelo, valores, t, carpeta, bloque = 32, procesos = None, verbose = True):
+	'''
+	Resuelve en paralelo las trayectorias de un conjunto de muestras y guarda cada bloque en la carpeta
+	indicada (bloque_00000.npz, ...). Los bloques que ya existen no se recalculan, por lo que al volver a
+	llamarlo con las mismas muestras se retoma un barrido interrumpido.
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico' (ver fp.modelos)
+	* valores: array (N, variables de la tabla) con las muestras (ver muestras)
+	* t: array de tiempos
+	* carpeta: carpeta de salida
+	* bloque: numero de trayectorias de cada tarea y de cada archivo (al retomar debe ser el mismo)
+	* procesos: numero de procesos (None: todos los nucleos)
+	* verbose: si es True se imprime el progreso
+
+	---Return---
+	* <dict>: trayectorias calculadas, tiempo (s), trayectorias por segundo y lista de archivos
+	'''
+	valores = np.asarray(valores, dtype=float)
+	os.makedirs(carpeta, exist_ok=True)
+
+	# Se guardan las muestras, los tiempos y el tamaño de bloque; al retomar deben coincidir con los
+	# guardados, porque cada archivo se nombra por su indice de bloque y otro tamaño mezclaria muestras
+	ruta_muestras = os.path.join(carpeta, 'muestras.npz')
+	if os.path.exists(ruta_muestras):
+		anterior = np.load(ruta_muestras)
+		if anterior['modelo'] != modelo or not (np.array_equal(anterior['valores'], valores) and np.array_equal(anterior['t'], t)):
+			raise ValueError('La carpeta %s contiene un barrido distinto' % carpeta)
+		if 'bloque' not in anterior.files or int(anterior['bloque']) != bloque:
+			raise ValueError('La carpeta %s contiene un barrido con bloques de %s trayectorias: se debe retomar con el mismo bloque'
+				% (carpeta, int(anterior['bloque']) if 'bloque' in anterior.files else 'tamaño desconocido'))
+	else: np.savez(ruta_muestras, modelo=modelo, valores=valores, t=t, bloque=bloque)
+
+	# Se reparten las muestras en bloques y se descartan los que ya estan en disco
+	archivos = [os.path.join(carpeta, 'bloque_%05d.npz' % (i // bloque)) for i in range(0, len(valores), bloque)]
+	tareas = [(modelo, valores[i*bloque:(i+1)*bloque], t, ruta) for i, ruta in enumerate(archivos) if not os.path.exists(ruta)]
+	pendientes = sum(len(tarea[1]) for tarea in tareas)
+	if verbose: print('%d trayectorias: %d ya calculadas, %d pendientes' % (len(valores), len(valores) - pendientes, pendientes))
+
+	# Se resuelven los bloques en paralelo segun van quedando procesos libres
+	hechas = 0
+	inicio = time.perf_counter()
+	with mp.Pool(procesos or os.cpu_count()) as pool:
+		for n in pool.imap_unordered(_resuelve, tareas):
+			hechas += n
+			if verbose:
+				transcurrido = time.perf_counter() - inicio
+				print('\r%d/%d trayectorias, %.1f tray/s' % (hechas, pendientes, hechas / transcurrido), end='', flush=True)
+	tiempo = time.perf_counter() - inicio
+	if verbose and tareas: print()
+
+	return {'trayectorias': hechas, 'tiempo': tiempo, 'tray/s': hechas / tiempo if hechas else 0., 'archivos': archivos}
+
+def Carga(carpeta):
+	'''
+	Carga los resultados de un barrido guardado en disco
+
+	---Parametros---
+	* carpeta: carpeta de salida de Barrido
+
+	---Return---
+	* <np.array>: valores de las muestras calculadas, de forma (N, variables de la tabla)
+	* <np.array>: columnas de Sol_* de cada muestra, de forma (N, columnas, T)
+	* <np.array>: array de tiempos
+	'''
+	t = np.load(os.path.join(carpeta, 'muestras.npz'))['t']
+	bloques = [np.load(os.path.join(carpeta, nombre)) for nombre in sorted(os.listdir(carpeta)) if nombre.startswith('bloque_') and nombre.endswith('.npz')]
+
+	return np.concatenate([b['valores'] for b in bloques]), np.concatenate([b['columnas'] for b in bloques]), t
\ No newline at end of file
@@ -0,0 +1,193 @@
+'''
+Implementa una cache de resultados de la resolucion de trayectorias.
+Cada resultado se identifica por el hash sha256 de todo lo que lo determina (modelo, valores iniciales,
+constantes, array de tiempos y ajustes del metodo) y se guarda en dos niveles: un diccionario en memoria
+con los ultimos resultados usados y una carpeta en disco limitada en tamaño, de la que se borran primero
+los archivos usados hace mas tiempo. Otros modulos pueden guardar arrays .npy en subcarpetas (por ejemplo
+las mallas de func_energias); cuentan en el mismo limite de tamaño y se borran con el mismo criterio.
+La carpeta es ~/.cache/pendulo o la indicada en la variable de entorno PENDULO_CACHE (vacia: sin disco).
+'''
+
+# ---Imports---
+# os: rutas de archivos y variables de entorno
+import os
+# json: informe guardado junto a cada resultado
+import json
+# hashlib: hash de las claves
+import hashlib
+# collections.OrderedDict: nivel en memoria ordenado por uso
+from collections import OrderedDict
+# numpy (np): manejo de arrays
+import numpy as np
+
+# ---Clases---
+class Cache:
+	'''
+	Cache de resultados (array, informe) con un nivel en memoria y otro en disco
+
+	---Parametros---
+	* carpeta: carpeta del nivel en disco (None: solo memoria)
+	* max_disco: tamaño maximo en bytes de la carpeta
+	* max_memoria: numero maximo de resultados en memoria
+	'''
+	def __init__(self, carpeta, max_disco = 512 * 2**20, max_memoria = 32):
+		self.carpeta = carpeta
+		self.max_disco = max_disco
+		self.max_memoria = max_memoria
+		self.memoria = OrderedDict()
+		self.estadisticas = {'memoria': 0, 'disco': 0, 'fallos': 0, 'borrados': 0}
+
+	def _ruta(self, clave):
+		'''
+		---Parametros---
+		* clave: hash del resultado
+
+		---Return---
+		* <string>: ruta del archivo del resultado
+		'''
+		return os.path.join(self.carpeta, clave + '.npz')
+
+	def _recuerda(self, clave, valor):
+		'''
+		Guarda un resultado en memoria y olvida el usado hace mas tiempo si se supera max_memoria
+
+		---Parametros---
+		* clave: hash del resultado
+		* valor: tupla (array, informe)
+		'''
+		self.memoria[clave] = valor
+		self.memoria.move_to_end(clave)
+		while len(self.memoria) > self.max_memoria: self.memoria.popitem(last=False)
+
+	def obtiene(self, clave):
+		'''
+		Busca un resultado, primero en memoria y despues en disco
+
+		---Parametros---
+		* clave: hash del resultado
+
+		---Return---
+		* <tupla>: (array de solo lectura, informe), o None si no esta en la cache
+		'''
+		# Nivel en memoria
+		if clave in self.memoria:
+			self.memoria.move_to_end(clave)
+			self.estadisticas['memoria'] += 1
+			return self.memoria[clave]
+
+		# Nivel en disco: se marca como usado actualizando la fecha de modificacion
+		if self.carpeta:
+			ruta = self._ruta(clave)
+			try:
+				with np.load(ruta) as datos: valor = (datos['sol'], json.loads(str(datos['informe'])))
+				os.utime(ruta)
+			except (OSError, KeyError, ValueError): valor = None
+			if valor is not None:
+				valor[0].flags.writeable = False
+				self._recuerda(clave, valor)
+				self.estadisticas['disco'] += 1
+				return valor
+
+		self.estadisticas['fallos'] += 1
+		return None
+
+	def guarda(self, clave, sol, informe):
+		'''
+		Guarda un resultado en memoria y en disco, y borra de disco los mas antiguos si se supera max_disco
+
+		---Parametros---
+		* clave: hash del resultado
+		* sol: array con el resultado
+		* informe: diccionario serializable en JSON
+
+		---Return---
+		* <tupla>: (array de solo lectura, informe) guardados
+		'''
+		sol = np.array(sol)
+		sol.flags.writeable = False
+		self._recuerda(clave, (sol, informe))
+		if not self.carpeta: return sol, informe
+
+		# Se escribe en un archivo temporal y se renombra, para que otro proceso no lea un archivo a medias
+		os.makedirs(self.carpeta, exist_ok=True)
+		ruta = self._ruta(clave)
+		with open(ruta + '.tmp', 'wb') as archivo: np.savez(archivo, sol=sol, informe=json.dumps(informe))
+		os.replace(ruta + '.tmp', ruta)
+		self.limita()
+
+		return sol, informe
+
+	def _archivos(self):
+		'''
+		---Return---
+		* <lista>: archivos de la carpeta: los resultados (.npz) y los arrays (.npy) de sus subcarpetas
+		'''
+		if not (self.carpeta and os.path.isdir(self.carpeta)): return []
+		archivos = []
+		for a in os.scandir(self.carpeta):
+			if a.name.endswith('.npz'): archivos.append(a)
+			elif a.is_dir(): archivos += [b for b in os.scandir(a.path) if b.name.endswith('.npy')]
+		return archivos
+
+	def limita(self):
+		'''
+		Borra de disco los archivos usados hace mas tiempo hasta que la carpeta cabe en max_disco.
+		Los modulos que guardan arrays en subcarpetas la llaman despues de escribirlos.
+		'''
+		archivos = self._archivos()
+		total = sum(a.stat().st_size for a in archivos)
+		for a in sorted(archivos, key=lambda a: a.stat().st_mtime):
+			if total <= self.max_disco: break
+			total -= a.stat().st_size
+			try: os.remove(a.path)
+			except OSError: pass
+			self.estadisticas['borrados'] += 1
+
+	def vacia(self):
+		'''
+		Borra todos los resultados de memoria y todos los archivos de disco
+		'''
+		self.memoria.clear()
+		for a in self._archivos():
+			try: os.remove(a.path)
+			except OSError: pass
+
+	def informe(self):
+		'''
+		---Return---
+		* <dict>: aciertos en memoria y en disco, fallos, resultados borrados, tasa de aciertos,
+		  resultados en memoria y bytes ocupados en disco
+		'''
+		aciertos = self.estadisticas['memoria'] + self.estadisticas['disco']
+		consultas = aciertos + self.estadisticas['fallos']
+		disco = sum(a.stat().st_size for a in self._archivos())
+
+		return dict(self.estadisticas, aciertos=aciertos / consultas if consultas else 0., en_memoria=len(self.memoria), bytes_disco=disco)
+
+# ---Funciones---
+def clave(*partes):
+	'''
+	Calcula el hash sha256 de un conjunto de valores (numeros, strings, tuplas, arrays o None)
+
+	---Parametros---
+	* partes: valores que determinan el resultado
+
+	---Return---
+	* <string>: hash en hexadecimal
+	'''
+	h = hashlib.sha256()
+	for parte in partes:
+
+		# Los arrays (y tuplas de numeros) se identifican por su forma y contenido; el resto por su repr
+		try:
+			if not isinstance(parte, (np.ndarray, list, tuple)): raise TypeError
+			a = np.ascontiguousarray(parte, dtype=float)
+			h.update(repr(a.shape).encode())
+			h.update(a.tobytes())
+		except (TypeError, ValueError): h.update(repr(parte).encode())
+		h.update(b'|')
+
+	return h.hexdigest()
+
+# ---Cache por defecto---
+cache = Cache(os.environ.get('PENDULO_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'pendulo')))
\ No newline at end of file
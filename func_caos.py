@@ -0,0 +1,180 @@
+'''
+Implementa mapas de caos de los pendulos doble y triple sobre una malla de angulos iniciales (th1_0, th2_0):
+el mayor exponente de Lyapunov, obtenido integrando las ecuaciones variacionales junto al estado con
+los jacobianos exactos de jac_pendulo, y el tiempo de volteo (primer instante con |th2| > pi).
+La malla se divide en teselas que se resuelven como lotes vectorizados en un conjunto de procesos;
+cada tesela se guarda en disco al terminar, de forma que un calculo interrumpido se retoma sin repetirlas.
+'''
+
+# ---Imports---
+# os: rutas de archivos y numero de nucleos
+import os
+# time: medicion de tiempos
+import time
+# multiprocessing (mp): conjunto de procesos
+import multiprocessing as mp
+# numpy (np): manejo de arrays
+import numpy as np
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+# jac_pendulo (jac): jacobianos exactos de las ecuaciones diferenciales
+import jac_pendulo as jac
+
+# ---Modelos---
+# Para cada modelo: (generador de la ecuacion, jacobiano, dimension del estado)
+modelos = {'doble': (ode.Doble_gen, jac.Doble, 4),
+				'triple': (ode.Triple_gen, jac.Triple, 6)}
+
+# ---Funciones---
+def Lyapunov(modelo, params, argms, t_f, dt = 0.01, renormaliza = 10):
+	'''
+	Calcula a la vez para un lote de trayectorias el mayor exponente de Lyapunov y el tiempo de volteo.
+	El vector tangente se integra con el mismo Runge-Kutta de orden 4 que el estado y se renormaliza
+	cada pocos pasos, acumulando el logaritmo de su crecimiento.
+
+	---Parametros---
+	* modelo: 'doble' o 'triple'
+	* params: array (estado, N) con los valores iniciales de cada trayectoria
+	* argms: tupla con las constantes del problema
+	* t_f: tiempo final
+	* dt: paso temporal
+	* renormaliza: numero de pasos entre dos renormalizaciones del vector tangente
+
+	---Return---
+	* <np.array>: mayor exponente de Lyapunov de cada trayectoria, de forma (N,)
+	* <np.array>: tiempo de volteo de cada trayectoria (nan si no voltea antes de t_f), de forma (N,)
+	'''
+	gen, J, n = modelos[modelo]
+	f = gen(*argms)
+	y = np.array(params, dtype=float)
+	N = y.shape[1]
+
+	# Ecuaciones variacionales: d(delta)/dt = J(y) delta, con J de forma (n, n, N)
+	def F(y, d):
+		return np.asarray(f(y)), np.einsum('ijk,jk->ik', J(y, 0, *argms), d)
+
+	# Vector tangente inicial unitario, igual para todas las trayectorias
+	d = np.zeros_like(y)
+	d[:] = (np.ones(n) / np.sqrt(n))[:, None]
+	suma = np.zeros(N)
+	volteo = np.full(N, np.nan)
+
+	pasos = int(round(t_f / dt))
+	for i in range(1, pasos + 1):
+
+		# Paso de Runge-Kutta de orden 4 del estado y del vector tangente
+		k1y, k1d = F(y, d)
+		k2y, k2d = F(y + dt/2*k1y, d + dt/2*k1d)
+		k3y, k3d = F(y + dt/2*k2y, d + dt/2*k2d)
+		k4y, k4d = F(y + dt*k3y, d + dt*k3d)
+		y = y + dt/6*(k1y + 2*k2y + 2*k3y + k4y)
+		d = d + dt/6*(k1d + 2*k2d + 2*k3d + k4d)
+
+		# Primer volteo del segundo pendulo
+		volteo = np.where(np.isnan(volteo) & (np.abs(y[2]) > np.pi), i*dt, volteo)
+
+		# Renormalizacion del vector tangente
+		if i % renormaliza == 0 or i == pasos:
+			norma = np.sqrt(np.sum(d*d, axis=0))
+			suma += np.log(norma)
+			d /= norma
+
+	return suma / (pasos * dt), volteo
+
+def _tesela(tarea):
+	'''
+	Calcula una tesela del mapa y la guarda en disco
+
+	---Parametros---
+	* tarea: tupla (ruta, modelo, th1_0, th2_0, estado fijo, argms, t_f, dt, renormaliza), con th1_0 y th2_0
+	  los angulos iniciales de la tesela en arrays 1D y el estado fijo con el resto de valores iniciales
+
+	---Return---
+	* <int>: numero de trayectorias calculadas
+	'''
+	ruta, modelo, th1, th2, fijo, argms, t_f, dt, renormaliza = tarea
+
+	# Lote con todas las combinaciones de angulos de la tesela
+	TH1, TH2 = np.meshgrid(th1, th2, indexing='ij')
+	params = np.repeat(np.asarray(fijo, dtype=float)[:, None], TH1.size, axis=1)
+	params[0] = TH1.ravel()
+	params[2] = TH2.ravel()
+	lyapunov, volteo = Lyapunov(modelo, params, argms, t_f, dt, renormaliza)
+
+	# Se escribe en un archivo temporal y se renombra, para no dejar teselas a medias si se interrumpe
+	with open(ruta + '.tmp', 'wb') as archivo: np.savez(archivo, lyapunov=lyapunov.reshape(TH1.shape), volteo=volteo.reshape(TH1.shape))
+	os.replace(ruta + '.tmp', ruta)
+
+	return TH1.size
+
+def Mapa(modelo, argms, carpeta, resolucion = 1000, t_f = 20, dt = 0.01, rango = (-np.pi, np.pi), fijo = None, tesela = 50, renormaliza = 10, procesos = None, verbose = True):
+	'''
+	Calcula los mapas del mayor exponente de Lyapunov y del tiempo de volteo sobre una malla (th1_0, th2_0).
+	Las teselas ya guardadas en la carpeta no se recalculan.
+
+	---Parametros---
+	* modelo: 'doble' o 'triple'
+	* argms: tupla con las constantes del problema
+	* carpeta: carpeta de las teselas y de los mapas
+	* resolucion: numero de puntos de la malla en cada eje
+	* t_f: tiempo final
+	* dt: paso temporal
+	* rango: tupla (minimo, maximo) de los angulos iniciales
+	* fijo: valores iniciales del resto del estado (None: todo en reposo y th3 = 0)
+	* tesela: lado de cada tesela en puntos de la malla
+	* renormaliza: numero de pasos entre renormalizaciones del vector tangente
+	* procesos: numero de procesos (None: todos los nucleos)
+	* verbose: si es True se imprime el progreso
+
+	---Return---
+	* <np.array>: mapa del exponente de Lyapunov, de forma (resolucion, resolucion) con th1_0 en filas
+	* <np.array>: mapa del tiempo de volteo (nan: no voltea), de la misma forma
+	* <np.array>: angulos iniciales de la malla
+	'''
+	n = modelos[modelo][2]
+	if fijo is None: fijo = np.zeros(n)
+	th = np.linspace(rango[0], rango[1], resolucion)
+	os.makedirs(carpeta, exist_ok=True)
+
+	# Se guardan los parametros del mapa; al retomar deben coincidir con los guardados
+	parametros = {'modelo': modelo, 'argms': argms, 'th': th, 't_f': t_f, 'dt': dt, 'fijo': fijo, 'tesela': tesela, 'renormaliza': renormaliza}
+	ruta = os.path.join(carpeta, 'parametros.npz')
+	if os.path.exists(ruta):
+		with np.load(ruta) as anterior:
+			if any(not np.array_equal(anterior[k], np.asarray(v)) for k, v in parametros.items()):
+				raise ValueError('La carpeta %s contiene un mapa con otros parametros' % carpeta)
+	else: np.savez(ruta, **parametros)
+
+	# Teselas pendientes (las ya guardadas se saltan)
+	tareas = []
+	for i in range(0, resolucion, tesela):
+		for j in range(0, resolucion, tesela):
+			ruta = os.path.join(carpeta, 'tesela_%05d_%05d.npz' % (i, j))
+			if not os.path.exists(ruta):
+				tareas.append((ruta, modelo, th[i:i+tesela], th[j:j+tesela], fijo, argms, t_f, dt, renormaliza))
+	total = len(tareas)
+	if verbose: print('%d teselas pendientes de %d' % (total, int(np.ceil(resolucion / tesela))**2))
+
+	# Se calculan las teselas en paralelo segun van quedando procesos libres
+	inicio = time.perf_counter()
+	hechas = 0
+	if tareas:
+		with mp.Pool(procesos or os.cpu_count()) as pool:
+			for k, N in enumerate(pool.imap_unordered(_tesela, tareas)):
+				hechas += N
+				if verbose:
+					print('\r%d/%d teselas, %.0f tray/s' % (k + 1, total, hechas / (time.perf_counter() - inicio)), end='', flush=True)
+		if verbose: print()
+
+	# Se unen las teselas en los mapas y se guardan listos para representar
+	lyapunov = np.empty((resolucion, resolucion))
+	volteo = np.empty((resolucion, resolucion))
+	for i in range(0, resolucion, tesela):
+		for j in range(0, resolucion, tesela):
+			with np.load(os.path.join(carpeta, 'tesela_%05d_%05d.npz' % (i, j))) as datos:
+				lyapunov[i:i+tesela, j:j+tesela] = datos['lyapunov']
+				volteo[i:i+tesela, j:j+tesela] = datos['volteo']
+	np.save(os.path.join(carpeta, 'lyapunov.npy'), lyapunov)
+	np.save(os.path.join(carpeta, 'volteo.npy'), volteo)
+
+	return lyapunov, volteo, th
\ No newline at end of file
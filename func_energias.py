@@ -1,14 +1,99 @@
 '''
 Implementa funciones que permiten hacer representaciones graficas de los estados energeticos que pueden
 tomar los pendulos como sistemas que conservan la energia.
+Cada energia se escribe como una constante mas terminos que dependen de un solo eje y, en el doble y
+el triple, un termino cos(y - x): las funciones trigonometricas de la malla no dependen de los parametros,
+por lo que se calculan una vez y se reutilizan, y el campo se evalua por teselas sin arrays intermedios.
+La malla cos(y - x) se guarda ademas en disco, en la subcarpeta energias de la carpeta de func_cache, y
+se abre mapeada en memoria, de forma que cada resolucion solo se calcula una vez entre ejecuciones. Estas
+mallas cuentan en el limite de tamaño de la cache y se borran con ella (ver func_cache.Cache.limita).
 '''
 # ---Imports---
+# os: rutas de archivos
+import os
 # numpy (np): manejo de arrays
 import numpy as np
 # matplotlib.pyplot (plt): impresion grafica 2D
 import matplotlib.pyplot as plt
+# functools.lru_cache: cache de las mallas trigonometricas
+from functools import lru_cache
 # func_sliders (fs): sliders
 import func_sliders as fs
+# func_cache (fc): carpeta de la cache en disco
+import func_cache as fc
+# func_perfil (fpe): instrumentacion opcional
+import func_perfil as fpe
+
+# Carpeta de las mallas guardadas en disco (None: solo memoria)
+carpeta = os.path.join(fc.cache.carpeta, 'energias') if fc.cache.carpeta else None
+
+# ---Mallas---
+@lru_cache(maxsize=16)
+def eje(minimo, maximo, resolucion, tipo):
+	'''
+	Eje de la malla y sus funciones trigonometricas, calculados una vez por resolucion y tipo
+
+	---Parametros---
+	* minimo: valor minimo del eje
+	* maximo: valor maximo del eje
+	* resolucion: numero de puntos
+	* tipo: tipo de los arrays ('float64' o 'float32')
+
+	---Return---
+	* <dict>: arrays (de solo lectura) 'v' con los valores, 'cos' y 'sin'
+	'''
+	v = np.linspace(minimo, maximo, resolucion)
+	arrays = {'v': v.astype(tipo), 'cos': np.cos(v).astype(tipo), 'sin': np.sin(v).astype(tipo)}
+	for a in arrays.values(): a.flags.writeable = False
+	return arrays
+
+@lru_cache(maxsize=4)
+def coseno_diferencia(resolucion, tipo, tesela = 256):
+	'''
+	Malla cuadrada de cos(y - x) con x, y en [-pi, pi], calculada una vez por resolucion y tipo.
+	Se rellena por teselas de filas con cos(y)cos(x) + sin(y)sin(x) para no crear arrays intermedios completos.
+	Si hay carpeta se guarda en un .npy y se devuelve mapeada en memoria desde el archivo; las siguientes
+	ejecuciones la abren sin calcularla y el sistema solo lee del disco las filas que se usan. Los .npy
+	se borran, empezando por los usados hace mas tiempo, cuando la cache supera su tamaño maximo.
+
+	---Parametros---
+	* resolucion: numero de puntos de cada eje
+	* tipo: tipo del array ('float64' o 'float32')
+	* tesela: numero de filas de cada tesela
+
+	---Return---
+	* <np.array>: array (de solo lectura) de forma (resolucion, resolucion), con y en filas
+	'''
+	# Malla ya guardada en disco
+	if carpeta:
+		ruta = os.path.join(carpeta, 'coseno_diferencia_%d_%s.npy' % (resolucion, np.dtype(tipo).name))
+		try:
+			C = np.load(ruta, mmap_mode='r')
+			if C.shape == (resolucion, resolucion) and C.dtype == tipo:
+				# Se marca como usada para que la cache borre antes las mallas que no se usan
+				os.utime(ruta)
+				return C
+		except (OSError, ValueError): pass
+
+	a = eje(-np.pi, np.pi, resolucion, tipo)
+	C = np.empty((resolucion, resolucion), dtype=tipo)
+	for i in range(0, resolucion, tesela):
+		s = slice(i, i + tesela)
+		np.multiply(a['cos'][s, None], a['cos'][None, :], out=C[s])
+		C[s] += a['sin'][s, None] * a['sin'][None, :]
+	C.flags.writeable = False
+
+	# Se escribe en un archivo temporal y se renombra, para que otro proceso no lea un archivo a medias
+	if carpeta:
+		try:
+			os.makedirs(carpeta, exist_ok=True)
+			with open(ruta + '.tmp', 'wb') as archivo: np.save(archivo, C)
+			os.replace(ruta + '.tmp', ruta)
+			C = np.load(ruta, mmap_mode='r')
+			fc.cache.limita()
+		except OSError: pass
+
+	return C
 
 # ---Funciones---
 def set_angle_label(ax,pos,nombre):
@@ -54,44 +139,253 @@ def Fases(fig, ax, x, y, z, nivel, label = ''):
 	* nivel: niveles a considerar en la representacion
 	+ label: label a colocar en la colorbar
 	'''
-	# Se dibujan las curvas de nivel
-	cs = plt.contour(x, y, z, levels=nivel, colors='k')
-
 	# Se colorea segun el nivel
-	cf = plt.contourf(x, y, z, levels=nivel, cmap = 'rainbow')
+	cf = ax.contourf(x, y, z, levels=nivel, cmap = 'rainbow')
+
+	# Se dibujan las curvas de nivel
+	cs = ax.contour(x, y, z, levels=nivel, colors='k')
 
 	# Se coloca la colorbar y se pone su label
 	cbar = fig.colorbar(cf)
 	cbar.ax.set_ylabel(label)
 
-def Simple():
+def resolucion_auto(ax, maximo):
 	'''
-	Proceso que realiza una representacion grafica de niveles energeticos del pendulo simple.
-	Permite elegir parametros iniciales con sliders.
+	Elige el numero de puntos de cada eje segun el tamaño de los axes en pixeles: no se calculan mas
+	puntos de los que se pueden ver.
+
+	---Parametros---
+	* ax: axes de plt
+	* maximo: numero maximo de puntos
+
+	---Return---
+	* <int>: numero de puntos de cada eje
 	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(np.array(fs.simple)[:-3,:].tolist())
-	button.on_clicked(reset_func)
-	plt.show()
+	caja = ax.get_window_extent()
+	return int(min(maximo, max(50, caja.width, caja.height)))
+
+def Campo(u, v, a = 0, C = None, tipo = 'float64', tesela = 256):
+	'''
+	Evalua por teselas de filas el campo E[i,j] = u[j] + v[i] + a*C[i,j] sin arrays intermedios completos
+
+	---Parametros---
+	* u: array con los terminos que dependen solo del eje x (incluida la constante)
+	* v: array con los terminos que dependen solo del eje y
+	* a: coeficiente del termino C
+	* C: malla (len(v), len(u)) del termino que depende de los dos ejes, o None
+	* tipo: tipo del resultado ('float64' o 'float32')
+	* tesela: numero de filas de cada tesela
+
+	---Return---
+	* <np.array>: array (len(v), len(u)) con el campo
+	'''
+	u = np.asarray(u, dtype=tipo); v = np.asarray(v, dtype=tipo)
+	E = np.empty((len(v), len(u)), dtype=tipo)
+	for i in range(0, len(v), tesela):
+		s = slice(i, i + tesela)
+		if C is not None and a != 0:
+			np.multiply(C[s], np.dtype(tipo).type(a), out=E[s])
+			E[s] += u
+		else: E[s] = u
+		E[s] += v[s, None]
+	return E
+
+@fpe.cronometro('Campo_Simple')
+def Campo_Simple(m, g, L, resolucion = 100, tipo = 'float64'):
+	'''
+	Energia del pendulo simple en una malla (th, w)
+
+	---Parametros---
+	* m, g, L: constantes del pendulo simple
+	* resolucion: numero de puntos de cada eje
+	* tipo: tipo del campo ('float64' o 'float32')
+
+	---Return---
+	* <np.array>: eje x (th)
+	* <np.array>: eje y (w)
+	* <np.array>: energia, de forma (resolucion, resolucion)
+	* <np.array>: niveles de energia desde 0 hasta la energia maxima posible
+	'''
+	x = eje(-np.pi, np.pi, resolucion, tipo)
+	y = eje(-10, 10, resolucion, tipo)
+
+	E = Campo(-m*g*L*x['cos'].astype(float) + m*g*L, m*L**2*y['v'].astype(float)**2/2, tipo=tipo)
+	nivel = np.linspace(0, m*L**2*50+2*m*g*L, 40)
+	return x['v'], y['v'], E, nivel
+
+@fpe.cronometro('Campo_Doble')
+def Campo_Doble(g, m1, m2, L1, L2, w1, w2, resolucion = 1000, tipo = 'float64'):
+	'''
+	Energia del pendulo doble en una malla (th1, th2) con velocidades angulares fijas
 
-	# Se toman los valores iniciales desde los sliders
-	m, g, L = [slider.val for slider in sliders]
+	---Parametros---
+	* g, m1, m2, L1, L2: constantes del pendulo doble
+	* w1, w2: velocidades angulares
+	* resolucion: numero de puntos de cada eje
+	* tipo: tipo del campo ('float64' o 'float32')
+
+	---Return---
+	* <np.array>: eje x (th1)
+	* <np.array>: eje y (th2)
+	* <np.array>: energia, de forma (resolucion, resolucion)
+	* <np.array>: niveles de energia desde 0 hasta la energia maxima posible
+	'''
+	a = eje(-np.pi, np.pi, resolucion, tipo)
+	c = a['cos'].astype(float)
 
-	# Se generan arrays para las variables
-	th = np.linspace(-np.pi, np.pi, 100)
-	w = np.linspace(-10, 10, 100)
+	# Constante, terminos en th1 y en th2 y coeficiente de cos(th2-th1)
+	K = (m1+m2)*L1**2*w1**2/2 + m2*L2**2*w2**2/2 + g*((m1+m2)*L1+m2*L2)
+	A = m2*L1*L2*abs(w1)*abs(w2)
+	E = Campo(K - g*(m1+m2)*L1*c, - g*m2*L2*c, A, coseno_diferencia(resolucion, tipo), tipo)
 
-	# Se realiza un np.meshgrid de las variables que nos servira para calcular la energia en cada punto
-	TH, W = np.meshgrid(th, w)
+	nivel = np.linspace(0, (m1+m2)*L1**2*w1**2/2 + m2*L2**2*w2**2/2 + A + 2*g*((m1+m2)*L1+m2*L2), 40)
+	return a['v'], a['v'], E, nivel
 
-	# Energia del pendulo simple
-	E = m*L**2*W**2/2-m*g*L*np.cos(TH)+m*g*L
+@fpe.cronometro('Campo_Triple')
+def Campo_Triple(g, m1, m2, m3, L1, L2, L3, w1, w2, w3, th1, resolucion = 1000, tipo = 'float64'):
+	'''
+	Energia del pendulo triple en una malla (th2, th3) con th1 y las velocidades angulares fijas
+
+	---Parametros---
+	* g, m1, m2, m3, L1, L2, L3: constantes del pendulo triple
+	* w1, w2, w3: velocidades angulares
+	* th1: angulo de la primera barra (rad)
+	* resolucion: numero de puntos de cada eje
+	* tipo: tipo del campo ('float64' o 'float32')
+
+	---Return---
+	* <np.array>: eje x (th2)
+	* <np.array>: eje y (th3)
+	* <np.array>: energia, de forma (resolucion, resolucion)
+	* <np.array>: niveles de energia desde 0 hasta la energia maxima posible
+	'''
+	a = eje(-np.pi, np.pi, resolucion, tipo)
+	c = a['cos'].astype(float); s = a['sin'].astype(float)
+
+	# cos(th - th1) = cos(th)cos(th1) + sin(th)sin(th1) solo depende de un eje
+	c_1 = c*np.cos(th1) + s*np.sin(th1)
+	M = g*((m1+m2+m3)*L1+(m2+m3)*L2+m3*L3)
+	K = (m1+m2+m3)*L1**2*w1**2/2 + (m2+m3)*L2**2*w2**2/2 + m3*L3**2*w3**2/2 - g*(m1+m2+m3)*L1*np.cos(th1) + M
+	u = K + (m2+m3)*L1*L2*abs(w1)*abs(w2)*c_1 - g*(m2+m3)*L2*c
+	v = m3*L3*abs(w3)*L1*abs(w1)*c_1 - g*m3*L3*c
+	A = m3*L3*abs(w3)*L2*abs(w2)
+	E = Campo(u, v, A, coseno_diferencia(resolucion, tipo), tipo)
+
+	nivel = np.linspace(0, (m1+m2+m3)*L1**2*w1**2/2 + (m2+m3)*L2**2*w2**2/2 +m3*L3**2*w3**2/2 + (m2+m3)*L1*L2*abs(w1)*abs(w2)+m3*L3*abs(w3)*(L1*abs(w1)+L2*abs(w2)) + 2*M, 40)
+	return a['v'], a['v'], E, nivel
+
+@fpe.cronometro('Campo_Esferico')
+def Campo_Esferico(m, g, L, wph, wth, resolucion = 1000, tipo = 'float64'):
+	'''
+	Energia del pendulo esferico en una malla (ph, th) con velocidades angulares fijas
+
+	---Parametros---
+	* m, g, L: constantes del pendulo esferico
+	* wph, wth: velocidades angulares
+	* resolucion: numero de puntos de cada eje
+	* tipo: tipo del campo ('float64' o 'float32')
+
+	---Return---
+	* <np.array>: eje x (ph)
+	* <np.array>: eje y (th)
+	* <np.array>: energia, de forma (resolucion, resolucion)
+	* <np.array>: niveles de energia desde 0 hasta la energia maxima posible
+	'''
+	x = eje(-np.pi, np.pi, resolucion, tipo)
+	y = eje(-2*np.pi, 2*np.pi, resolucion, tipo)
+
+	# La energia no depende de th: solo hay terminos en ph
+	c = x['cos'].astype(float); s = x['sin'].astype(float)
+	E = Campo(m*L**2/2*(wph**2+wth**2*s**2) - m*g*L*c + m*g*L, np.zeros(resolucion), tipo=tipo)
+
+	nivel = np.linspace(0, m*L**2/2*(wph**2+wth**2)+2*m*g*L, 40)
+	return x['v'], y['v'], E, nivel
+
+# ---Modelos---
+# Para cada pendulo: (variables de func_sliders que intervienen, funcion que calcula el campo a partir de
+# sus valores, resolucion y tipo, nombres de los ejes x e y, resolucion maxima)
+modelos = {'simple': (np.array(fs.simple)[:-3,:].tolist(), lambda v, r, t: Campo_Simple(*v, r, t), (r'\theta', r'\omega'), 100),
+				'doble': (np.array(fs.doble)[:-2,:].tolist(), lambda v, r, t: Campo_Doble(*v, r, t), (r'\theta_1', r'\theta_2'), 1000),
+				'triple': (np.array(fs.triple)[:-2,:].tolist(), lambda v, r, t: Campo_Triple(*v[:-1], np.radians(v[-1]), r, t), (r'\theta_2', r'\theta_3'), 1000),
+				'esferico': (np.array(fs.esferico)[:-2,:].tolist(), lambda v, r, t: Campo_Esferico(*v, r, t), (r'\phi', r'\theta'), 1000)}
+
+def Interactivo(modelo, resolucion = None, tipo = 'float64', espera = 60):
+	'''
+	Representacion de niveles energeticos que se actualiza al mover los sliders, en una sola ventana.
+	Los cambios de los sliders se agrupan: cada cambio reinicia un temporizador y solo se recalcula y
+	se dibuja con los ultimos valores cuando los sliders llevan espera ms sin moverse, de forma que
+	no se acumulan dibujos obsoletos. Cada recalculo rehace con los valores actuales todos los terminos
+	de un solo eje y la suma por teselas del campo; la malla cos(y - x), que es lo costoso y no depende
+	de los parametros, no se recalcula sino que se reutiliza (ver Campo y coseno_diferencia).
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* resolucion: numero de puntos de cada eje (None: segun el tamaño de la figura)
+	* tipo: tipo del campo de energia ('float32' ocupa la mitad y se recalcula antes)
+	* espera: tiempo en ms sin cambios antes de recalcular
+	'''
+	matriz, campo, (nombre_x, nombre_y), maximo = modelos[modelo]
+
+	# Figura con la grafica arriba, su colorbar a la derecha y los sliders y el boton de reset debajo
+	fig = plt.figure(figsize=(7, 9))
+	ax = fig.add_axes([.12, .45, .65, .5])
+	cax = fig.add_axes([.82, .45, .03, .5])
+	sliders = fs.slider_gen(matriz, .35, .09)
+	button, reset = fs.reset_gen(sliders)
+	button.on_clicked(reset)
+	if resolucion is None: resolucion = resolucion_auto(ax, maximo)
+
+	@fpe.cronometro('energias redibujo')
+	def dibuja():
+		# Se calcula el campo con los valores actuales y se sustituyen los contornos anteriores
+		x, y, E, nivel = campo([slider.val for slider in sliders], resolucion, tipo)
+		ax.clear(); cax.clear()
+		cf = ax.contourf(x, y, E, levels=nivel, cmap = 'rainbow')
+		ax.contour(x, y, E, levels=nivel, colors='k')
+		fig.colorbar(cf, cax=cax).ax.set_ylabel('E (J)')
+
+		# Se detalla informacion sobre la representacion
+		set_angle_label(ax, 'x', nombre_x)
+		if modelo == 'simple': ax.set_ylabel('$\omega$ (rad/s)')
+		else: set_angle_label(ax, 'y', nombre_y)
+		fig.canvas.draw_idle()
+
+	# Temporizador de un solo disparo que se reinicia con cada cambio de un slider
+	temporizador = fig.canvas.new_timer(interval=espera)
+	temporizador.single_shot = True
+	temporizador.add_callback(dibuja)
+
+	def cambio(valor):
+		temporizador.stop()
+		temporizador.start()
+
+	for slider in sliders: slider.on_changed(cambio)
+
+	dibuja()
+	plt.show()
+
+def Simple(valores = None, archivo = None, resolucion = None, tipo = 'float64'):
+	'''
+	Proceso que realiza una representacion grafica de niveles energeticos del pendulo simple.
+	Permite elegir parametros iniciales con sliders y la representacion se actualiza al moverlos.
+
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None (y no hay archivo) se eligen con sliders
+	* archivo: si se indica, la figura se guarda en el archivo en lugar de mostrarse
+	* resolucion: numero de puntos de cada eje (None: segun el tamaño de la figura, hasta 100)
+	* tipo: tipo del campo de energia ('float32' ocupa la mitad)
+	'''
+	# Sin valores ni archivo se abre la representacion interactiva, que se actualiza al mover los sliders
+	if valores is None and archivo is None: return Interactivo('simple', resolucion, tipo)
+
+	# Se toman los valores indicados, completados con los valores iniciales de func_sliders
+	m, g, L = fs.obtener_valores(np.array(fs.simple)[:-3,:].tolist(), valores)
 
 	# Se crean la figura y los axes
 	fig, ax = plt.subplots()
 
-	# Se toman los niveles de energia que distinguira la representacion desde 0 hasta la energia maxima posible
-	nivel = np.linspace(0, m*L**2*50+2*m*g*L, 40)
+	# Energia del pendulo simple en la malla (th, w) y niveles de energia que distinguira la representacion
+	th, w, E, nivel = Campo_Simple(m, g, L, resolucion or resolucion_auto(ax, 100), tipo)
 
 	# Se usa Fases para realizar la representacion
 	Fases(fig, ax, th, w, E, nivel, 'E (J)')
@@ -100,37 +394,32 @@ def Simple():
 	set_angle_label(ax, 'x', r'\theta')
 	ax.set_ylabel('$\omega$ (rad/s)')
 
-	# Se muestra
-	plt.show()
+	# Se guarda o se muestra
+	if archivo is not None: fig.savefig(archivo); plt.close(fig)
+	else: plt.show()
 
-def Doble():
+def Doble(valores = None, archivo = None, resolucion = None, tipo = 'float64'):
 	'''
 	Proceso que realiza una representacion grafica de niveles energeticos del pendulo doble.
-	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(np.array(fs.doble)[:-2,:].tolist())
-	button.on_clicked(reset_func)
-	plt.show()
-
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, L1, L2, w1, w2 = [slider.val for slider in sliders]
-
-	# Se generan arrays para las variables
-	th1 = np.linspace(-np.pi, np.pi, 1000)
-	th2 = np.linspace(-np.pi, np.pi, 1000)
+	Permite elegir parametros iniciales con sliders y la representacion se actualiza al moverlos.
 
-	# Se realiza un np.meshgrid de las variables que nos servira para calcular la energia en cada punto
-	TH1, TH2 = np.meshgrid(th1, th2)
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None (y no hay archivo) se eligen con sliders
+	* archivo: si se indica, la figura se guarda en el archivo en lugar de mostrarse
+	* resolucion: numero de puntos de cada eje (None: segun el tamaño de la figura, hasta 1000)
+	* tipo: tipo del campo de energia ('float32' ocupa la mitad)
+	'''
+	# Sin valores ni archivo se abre la representacion interactiva, que se actualiza al mover los sliders
+	if valores is None and archivo is None: return Interactivo('doble', resolucion, tipo)
 
-	# Energia del pendulo doble
-	E = (m1+m2)*L1**2*w1**2/2 + m2*L2**2*w2**2/2 + m2*L1*L2*abs(w1)*abs(w2)*np.cos(TH2-TH1)-g*((m1+m2)*L1*np.cos(TH1)+m2*L2*np.cos(TH2)) + g*((m1+m2)*L1+m2*L2)
+	# Se toman los valores indicados, completados con los valores iniciales de func_sliders
+	g, m1, m2, L1, L2, w1, w2 = fs.obtener_valores(np.array(fs.doble)[:-2,:].tolist(), valores)
 
 	# Se crean la figura y los axes
 	fig, ax = plt.subplots()
 
-	# Se toman los niveles de energia que distinguira la representacion desde 0 hasta la energia maxima posible
-	nivel = np.linspace(0, (m1+m2)*L1**2*w1**2/2 + m2*L2**2*w2**2/2 + m2*L1*L2*abs(w1)*abs(w2)+2*g*((m1+m2)*L1+m2*L2), 40)
+	# Energia del pendulo doble en la malla (th1, th2) y niveles de energia que distinguira la representacion
+	th1, th2, E, nivel = Campo_Doble(g, m1, m2, L1, L2, w1, w2, resolucion or resolucion_auto(ax, 1000), tipo)
 
 	# Se usa Fases para realizar la representacion
 	Fases(fig, ax, th1, th2, E, nivel, 'E (J)')
@@ -139,37 +428,32 @@ def Doble():
 	set_angle_label(ax, 'x', r'\theta_1')
 	set_angle_label(ax, 'y', r'\theta_2')
 
-	# Se muestra
-	plt.show()
+	# Se guarda o se muestra
+	if archivo is not None: fig.savefig(archivo); plt.close(fig)
+	else: plt.show()
 
-def Triple():
+def Triple(valores = None, archivo = None, resolucion = None, tipo = 'float64'):
 	'''
 	Proceso que realiza una representacion grafica de niveles energeticos del pendulo triple.
-	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(np.array(fs.triple)[:-2,:].tolist())
-	button.on_clicked(reset_func)
-	plt.show()
-
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, m3, L1, L2, L3, w1, w2, w3, th1 = [slider.val for slider in sliders]
+	Permite elegir parametros iniciales con sliders y la representacion se actualiza al moverlos.
 
-	# Se generan arrays para las variables
-	th2 = np.linspace(-np.pi, np.pi, 1000)
-	th3 = np.linspace(-np.pi, np.pi, 1000)
-
-	# Se realiza un np.meshgrid de las variables que nos servira para calcular la energia en cada punto
-	TH2, TH3 = np.meshgrid(th2, th3)
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None (y no hay archivo) se eligen con sliders
+	* archivo: si se indica, la figura se guarda en el archivo en lugar de mostrarse
+	* resolucion: numero de puntos de cada eje (None: segun el tamaño de la figura, hasta 1000)
+	* tipo: tipo del campo de energia ('float32' ocupa la mitad)
+	'''
+	# Sin valores ni archivo se abre la representacion interactiva, que se actualiza al mover los sliders
+	if valores is None and archivo is None: return Interactivo('triple', resolucion, tipo)
 
-	# Energia del pendulo triple
-	E = (m1+m2+m3)*L1**2*w1**2/2 + (m2+m3)*L2**2*w2**2/2 +m3*L3**2*w3**2/2 + (m2+m3)*L1*L2*abs(w1)*abs(w2)*np.cos(TH2-th1)+m3*L3*abs(w3)*(L1*abs(w1)*np.cos(TH3-th1)+L2*abs(w2)*np.cos(TH3-TH2))-g*((m1+m2+m3)*L1*np.cos(th1)+(m2+m3)*L2*np.cos(TH2)+m3*L3*np.cos(TH3)) + g*((m1+m2+m3)*L1+(m2+m3)*L2+m3*L3)
+	# Se toman los valores indicados, completados con los valores iniciales de func_sliders
+	g, m1, m2, m3, L1, L2, L3, w1, w2, w3, th1 = fs.obtener_valores(np.array(fs.triple)[:-2,:].tolist(), valores)
 
 	# Se crean la figura y los axes
 	fig, ax = plt.subplots()
 
-	# Se toman los niveles de energia que distinguira la representacion desde 0 hasta la energia maxima posible
-	nivel = np.linspace(0, (m1+m2+m3)*L1**2*w1**2/2 + (m2+m3)*L2**2*w2**2/2 +m3*L3**2*w3**2/2 + (m2+m3)*L1*L2*abs(w1)*abs(w2)+m3*L3*abs(w3)*(L1*abs(w1)+L2*abs(w2))+g*((m1+m2+m3)*L1+(m2+m3)*L2+m3*L3) + g*((m1+m2+m3)*L1+(m2+m3)*L2+m3*L3), 40)
+	# Energia del pendulo triple en la malla (th2, th3) y niveles de energia que distinguira la representacion
+	th2, th3, E, nivel = Campo_Triple(g, m1, m2, m3, L1, L2, L3, w1, w2, w3, np.radians(th1), resolucion or resolucion_auto(ax, 1000), tipo)
 
 	# Se usa Fases para realizar la representacion
 	Fases(fig, ax, th2, th3, E, nivel, 'E (J)')
@@ -178,37 +462,32 @@ def Triple():
 	set_angle_label(ax, 'x', r'\theta_2')
 	set_angle_label(ax, 'y', r'\theta_3')
 
-	# Se muestra
-	plt.show()
+	# Se guarda o se muestra
+	if archivo is not None: fig.savefig(archivo); plt.close(fig)
+	else: plt.show()
 
-def Esferico():
+def Esferico(valores = None, archivo = None, resolucion = None, tipo = 'float64'):
 	'''
 	Proceso que realiza una representacion grafica de niveles energeticos del pendulo esferico.
-	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(np.array(fs.esferico)[:-2,:].tolist())
-	button.on_clicked(reset_func)
-	plt.show()
-
-	# Se toman los valores iniciales desde los sliders
-	m, g, L, wph, wth = [slider.val for slider in sliders]
+	Permite elegir parametros iniciales con sliders y la representacion se actualiza al moverlos.
 
-	# Se generan arrays para las variables
-	ph = np.linspace(-np.pi, np.pi, 1000)
-	th = np.linspace(-2*np.pi, 2*np.pi, 1000)
-
-	# Se realiza un np.meshgrid de las variables que nos servira para calcular la energia en cada punto
-	PH, TH = np.meshgrid(ph, th)
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None (y no hay archivo) se eligen con sliders
+	* archivo: si se indica, la figura se guarda en el archivo en lugar de mostrarse
+	* resolucion: numero de puntos de cada eje (None: segun el tamaño de la figura, hasta 1000)
+	* tipo: tipo del campo de energia ('float32' ocupa la mitad)
+	'''
+	# Sin valores ni archivo se abre la representacion interactiva, que se actualiza al mover los sliders
+	if valores is None and archivo is None: return Interactivo('esferico', resolucion, tipo)
 
-	# Energia del pendulo esferico
-	E = m*L**2/2*(wph**2+wth**2*np.sin(PH)**2)-m*g*L*np.cos(PH) +m*g*L
+	# Se toman los valores indicados, completados con los valores iniciales de func_sliders
+	m, g, L, wph, wth = fs.obtener_valores(np.array(fs.esferico)[:-2,:].tolist(), valores)
 
 	# Se crean la figura y los axes
 	fig, ax = plt.subplots()
 
-	# Se toman los niveles de energia que distinguira la representacion desde 0 hasta la energia maxima posible
-	nivel = np.linspace(0, m*L**2/2*(wph**2+wth**2)+2*m*g*L, 40)
+	# Energia del pendulo esferico en la malla (ph, th) y niveles de energia que distinguira la representacion
+	ph, th, E, nivel = Campo_Esferico(m, g, L, wph, wth, resolucion or resolucion_auto(ax, 1000), tipo)
 
 	# Se usa Fases para realizar la representacion
 	Fases(fig, ax, ph, th, E, nivel, 'E (J)')
@@ -217,5 +496,6 @@ def Esferico():
 	set_angle_label(ax, 'x', r'\phi')
 	set_angle_label(ax, 'y', r'\theta')
 
-	# Se muestra
-	plt.show()
+	# Se guarda o se muestra
+	if archivo is not None: fig.savefig(archivo); plt.close(fig)
+	else: plt.show()
\ No newline at end of file
@@ -0,0 +1,232 @@
+'''
+Implementa funciones que exportan las animaciones de pendulos a video (MP4/GIF) o a secuencias de PNG
+sin necesidad de pantalla. Los frames se rasterizan con Agg repartidos en un conjunto de procesos y se
+envian en orden al codificador segun van estando listos.
+Sin ffmpeg solo se puede exportar a GIF: los procesos codifican ellos mismos cada frame con Pillow y el
+archivo se escribe a medida que llegan los bloques, con una resolucion y unos frames por segundo
+limitados (gif_pixeles, gif_fps) para que la exportacion tarde segundos.
+'''
+
+# ---Imports---
+# os: rutas de archivos
+import os
+# shutil: busqueda de ffmpeg
+import shutil
+# subprocess: comunicacion con ffmpeg
+import subprocess
+# multiprocessing (mp): conjunto de procesos
+import multiprocessing as mp
+# math.ceil: paso entre frames del GIF
+from math import ceil
+# PIL.Image: escritura de imagenes
+from PIL import Image
+# PIL.GifImagePlugin (gif): codificacion de GIF frame a frame
+from PIL import GifImagePlugin as gif
+# matplotlib.figure.Figure: figuras sin pyplot
+from matplotlib.figure import Figure
+# matplotlib.backends.backend_agg.FigureCanvasAgg: rasterizado sin pantalla
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+# func_animacion (fa): escenas de las animaciones en matplotlib
+import func_animacion as fa
+
+# ---Constantes---
+# Sin ffmpeg, tamaño maximo en pixeles del lado mayor del GIF y frames por segundo maximos
+gif_pixeles = 500
+gif_fps = 25
+
+# ---Estado de cada proceso---
+# Figura y funcion de actualizacion que crea _inicia en cada proceso del conjunto
+_escena = {}
+
+# ---Funciones---
+def _inicia(tipo, argumentos, figsize, dpi):
+	'''
+	Crea en el proceso actual la figura Agg y la escena de la animacion
+
+	---Parametros---
+	* tipo: '2D' o '3D'
+	* argumentos: tupla con los argumentos de fa.escena2D o fa.escena3D (sin la figura)
+	* figsize: tamaño de la figura en pulgadas
+	* dpi: puntos por pulgada
+	'''
+	fig = Figure(figsize=figsize, dpi=dpi)
+	canvas = FigureCanvasAgg(fig)
+	escena = fa.escena2D if tipo == '2D' else fa.escena3D
+	actualiza = escena(fig, *argumentos)
+
+	# Se dibuja una vez la figura sin los objetos animados y se guarda como fondo
+	for objeto in actualiza(0): objeto.set_animated(True)
+	canvas.draw()
+	_escena['fondo'] = canvas.copy_from_bbox(fig.bbox)
+	_escena['fig'] = fig
+	_escena['actualiza'] = actualiza
+
+def _rasteriza(tarea):
+	'''
+	Rasteriza un bloque de frames en el proceso actual
+
+	---Parametros---
+	* tarea: tupla (frames, patron, duracion) con los indices de los frames, el patron del nombre de
+	  los archivos si se exporta a PNG (None en otro caso) y la duracion en ms de cada frame si se
+	  codifica el GIF con Pillow (None en otro caso)
+
+	---Return---
+	* <lista>: bytes de cada frame, RGBA o ya codificados en GIF (vacia si se escriben PNG)
+	'''
+	frames, patron, duracion = tarea
+	fig = _escena['fig']
+	canvas = fig.canvas
+	imagenes = []
+
+	for n, i in frames:
+
+		# Se restaura el fondo y solo se dibujan encima los objetos animados
+		canvas.restore_region(_escena['fondo'])
+		for objeto in _escena['actualiza'](i): fig.draw_artist(objeto)
+		imagen = canvas.buffer_rgba()
+
+		# Los PNG se escriben directamente desde el proceso
+		if patron is not None: Image.frombuffer('RGBA', canvas.get_width_height(), imagen, 'raw', 'RGBA', 0, 1).save(patron % n, compress_level=1)
+
+		# Sin ffmpeg el frame se codifica en GIF en el proceso, con la paleta fija del archivo
+		elif duracion is not None: imagenes.append(b''.join(gif.getdata(_paleta(Image.frombuffer('RGBA', canvas.get_width_height(), imagen, 'raw', 'RGBA', 0, 1)), duration=duracion)))
+		else: imagenes.append(bytes(imagen))
+
+	return imagenes
+
+def _paleta(imagen):
+	'''
+	---Parametros---
+	* imagen: imagen de Pillow
+
+	---Return---
+	* <Image>: imagen con la paleta fija WEB, la misma en todos los frames del GIF
+	'''
+	return imagen.convert('RGB').convert('P', palette=Image.Palette.WEB, dither=Image.Dither.NONE)
+
+def _codificador(archivo, ancho, alto, fps):
+	'''
+	Abre el codificador de video para el archivo indicado
+
+	---Parametros---
+	* archivo: ruta del video (.mp4 o .gif)
+	* ancho: ancho de los frames en pixeles
+	* alto: alto de los frames en pixeles
+	* fps: frames por segundo del video
+
+	---Return---
+	* <funcion>: escribe(frame) recibe los bytes de un frame (RGBA con ffmpeg, GIF sin ffmpeg)
+	* <funcion>: cierra() termina el archivo
+	'''
+	ffmpeg = shutil.which('ffmpeg')
+
+	# Con ffmpeg los frames se envian en crudo por una tuberia, sin guardarlos en memoria
+	if ffmpeg is not None:
+		orden = [ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+			'-s', '%dx%d' % (ancho, alto), '-r', str(fps), '-i', '-']
+		if archivo.lower().endswith('.mp4'):
+			orden += ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+		orden.append(archivo)
+		proceso = subprocess.Popen(orden, stdin=subprocess.PIPE)
+
+		def cierra():
+			proceso.stdin.close()
+			if proceso.wait() != 0: raise RuntimeError('ffmpeg no pudo escribir %s' % archivo)
+
+		return proceso.stdin.write, cierra
+
+	# Sin ffmpeg se escribe el GIF con Pillow: la cabecera con la paleta fija y, segun llegan, los frames
+	# ya codificados por los procesos, sin guardarlos en memoria
+	if not archivo.lower().endswith('.gif'):
+		raise RuntimeError('Se necesita ffmpeg para exportar %s' % archivo)
+
+	salida = open(archivo, 'wb')
+	cabecera, _ = gif.getheader(_paleta(Image.new('RGB', (ancho, alto))), info={'loop': 0, 'optimize': False})
+	salida.write(b''.join(cabecera))
+
+	def cierra():
+		salida.write(b';')
+		salida.close()
+
+	return salida.write, cierra
+
+def _exporta(archivo, tipo, argumentos, figsize, t, fps, paso, procesos, dpi, bloque):
+	'''
+	Exporta una animacion rasterizando los frames en paralelo
+
+	---Parametros---
+	* archivo: ruta de salida (.mp4, .gif o .png para una secuencia)
+	* tipo: '2D' o '3D'
+	* argumentos: tupla con los argumentos de fa.escena2D o fa.escena3D (sin la figura)
+	* figsize: tamaño de la figura en pulgadas
+	* t: array de tiempos
+	* fps: frames por segundo (None: tiempo real segun t y paso)
+	* paso: se exporta uno de cada paso instantes de t
+	* procesos: numero de procesos (None: todos los nucleos)
+	* dpi: puntos por pulgada
+	* bloque: numero de frames que rasteriza cada tarea
+	'''
+	# Sin ffmpeg el GIF se codifica con Pillow, limitando el tamaño y, si el video va a tiempo real,
+	# los frames por segundo
+	pillow = archivo.lower().endswith('.gif') and shutil.which('ffmpeg') is None
+	if pillow:
+		dpi = min(dpi, gif_pixeles / max(figsize))
+		if fps is None: paso = max(paso, ceil(1 / ((t[1] - t[0]) * gif_fps)))
+
+	# Se eligen los frames y se reparten en bloques (numero de frame, indice en t)
+	frames = list(enumerate(range(0, len(t), paso)))
+	if fps is None: fps = 1 / ((t[1] - t[0]) * paso)
+	duracion = 1000 / fps if pillow else None
+
+	# Las secuencias PNG usan un patron con el numero de frame
+	patron = None
+	if archivo.lower().endswith('.png'):
+		patron = archivo if '%' in archivo else archivo[:-4] + '_%05d.png'
+		carpeta = os.path.dirname(patron)
+		if carpeta: os.makedirs(carpeta, exist_ok=True)
+	tareas = [(frames[i:i+bloque], patron, duracion) for i in range(0, len(frames), bloque)]
+
+	# Tamaño de los frames tal y como lo da el canvas de Agg (trunca, no redondea)
+	ancho, alto = FigureCanvasAgg(Figure(figsize=figsize, dpi=dpi)).get_width_height()
+
+	# Se rasterizan los bloques en paralelo y se envian en orden al codificador
+	with mp.Pool(procesos, initializer=_inicia, initargs=(tipo, argumentos, figsize, dpi)) as pool:
+		if patron is not None:
+			for _ in pool.imap(_rasteriza, tareas): pass
+		else:
+			escribe, cierra = _codificador(archivo, ancho, alto, fps)
+			for imagenes in pool.imap(_rasteriza, tareas):
+				for imagen in imagenes: escribe(imagen)
+			cierra()
+
+def Exportar2D(archivo, t, size, x, y, fasex, fasey, fasex_label = '', fasey_label = '', m = [1], fps = None, paso = 1, procesos = None, dpi = 100, bloque = 25):
+	'''
+	Exporta sin pantalla la animacion de Animacion2D a MP4, GIF o una secuencia de PNG.
+
+	---Parametros---
+	* archivo: ruta de salida (.mp4, .gif o .png; en PNG se añade el numero de frame)
+	* t, size, x, y, fasex, fasey, fasex_label, fasey_label, m: ver fa.Animacion2D
+	* fps: frames por segundo (None: tiempo real segun t y paso)
+	* paso: se exporta uno de cada paso instantes de t
+	* procesos: numero de procesos (None: todos los nucleos)
+	* dpi: puntos por pulgada
+	* bloque: numero de frames que rasteriza cada tarea
+	'''
+	argumentos = (t, size, x, y, fasex, fasey, fasex_label, fasey_label, m)
+	_exporta(archivo, '2D', argumentos, (10, 10), t, fps, paso, procesos, dpi, bloque)
+
+def Exportar3D(archivo, t, size, x, y, z, fasex, fasey, fasex_label = '', fasey_label = '', fps = None, paso = 1, procesos = None, dpi = 100, bloque = 25):
+	'''
+	Exporta sin pantalla la animacion de Animacion3D a MP4, GIF o una secuencia de PNG.
+
+	---Parametros---
+	* archivo: ruta de salida (.mp4, .gif o .png; en PNG se añade el numero de frame)
+	* t, size, x, y, z, fasex, fasey, fasex_label, fasey_label: ver fa.Animacion3D
+	* fps: frames por segundo (None: tiempo real segun t y paso)
+	* paso: se exporta uno de cada paso instantes de t
+	* procesos: numero de procesos (None: todos los nucleos)
+	* dpi: puntos por pulgada
+	* bloque: numero de frames que rasteriza cada tarea
+	'''
+	argumentos = (t, size, x, y, z, fasex, fasey, fasex_label, fasey_label)
+	_exporta(archivo, '3D', argumentos, (6.4, 4.8), t, fps, paso, procesos, dpi, bloque)
\ No newline at end of file
@@ -0,0 +1,205 @@
+'''
+Implementa simulaciones de larga duracion con memoria acotada.
+Flujo es un generador que integra con paso fijo y entrega el estado por bloques de tamaño fijo; los
+reductores (deriva de energia, seccion de Poincare, histograma) consumen cada bloque al vuelo y solo
+guardan su resultado, de forma que la memoria no crece con el tiempo simulado.
+Los estados pueden ser de una trayectoria (estado,) o de un lote (estado, N), como en func_integradores.
+'''
+
+# ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
+# func_trayectoria (ft): energias y reduccion de angulos
+import func_trayectoria as ft
+# func_pendulo (fp): ecuaciones de cada modelo
+import func_pendulo as fp
+# func_jit (fj): bucle de Runge-Kutta compilado con numba si esta instalado
+import func_jit as fj
+
+# ---Funciones---
+def Flujo(modelo, params, argms, t_f, dt, bloque = 10000, metodo = 'rk4', subpasos = 1, t_0 = 0):
+	'''
+	Generador que integra un pendulo con paso fijo y entrega el estado por bloques
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* params: valores iniciales, de forma (estado,) o (estado, N) para un lote
+	* argms: tupla con las constantes del problema (escalares o arrays (N,))
+	* t_f: tiempo final
+	* dt: intervalo temporal entre instantes entregados
+	* bloque: numero de instantes de cada bloque
+	* metodo: metodo de paso fijo de fp.metodos_fijos ('rk4', 'verlet')
+	* subpasos: pasos del metodo entre dos instantes entregados
+	* t_0: tiempo inicial
+
+	---Return (en cada iteracion)---
+	* <np.array>: tiempos del bloque, de forma (B,)
+	* <np.array>: estados del bloque, de forma (B, estado) o (B, estado, N)
+	'''
+	f, args, _ = fp.Ecuacion(modelo, argms, jacobiano=False)
+	paso = fp.metodos_fijos[metodo]
+	h = dt / subpasos
+
+	# Con numba, una trayectoria con rk4 avanza cada bloque entero en un unico bucle compilado
+	y = np.array(params, dtype=float)
+	compilado = fj.disponible and metodo == 'rk4' and y.ndim == 1 and modelo in fj.modelos
+
+	# El primer bloque empieza en el estado inicial; cada bloque siguiente, un paso despues del ultimo entregado
+	n = int(round((t_f - t_0) / dt)) + 1
+	i = 0
+	while i < n:
+		B = min(bloque, n - i)
+		t = t_0 + dt * np.arange(i, i + B)
+		if compilado:
+			Y = fj.rk4(modelo, argms, y, h, subpasos, B + (i > 0))[(i > 0):]
+			y = Y[-1]
+		else:
+			Y = np.empty((B,) + y.shape)
+			for k in range(B):
+				if i + k > 0:
+					for _ in range(subpasos): y = paso(f, y, 0, h, args)
+				Y[k] = y
+		i += B
+		yield t, Y
+
+def Recorre(flujo, *reductores):
+	'''
+	Pasa cada bloque de un flujo a todos los reductores
+
+	---Parametros---
+	* flujo: generador de bloques (ver Flujo)
+	* reductores: objetos con metodo consume(t, Y) y metodo resultado()
+
+	---Return---
+	* <lista>: resultado de cada reductor
+	'''
+	for t, Y in flujo:
+		for reductor in reductores: reductor.consume(t, Y)
+
+	return [reductor.resultado() for reductor in reductores]
+
+# ---Reductores---
+class Deriva:
+	'''
+	Deriva relativa maxima de la energia respecto a la inicial
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* argms: tupla con las constantes del problema
+	'''
+	def __init__(self, modelo, argms):
+		self.modelo = modelo
+		self.argms = argms
+		self.E0 = None
+		self.maximo = 0.
+
+	def consume(self, t, Y):
+		'''
+		---Parametros---
+		* t: tiempos del bloque
+		* Y: estados del bloque
+		'''
+		# Trayectoria espera el estado como (T, estado) o (N, T, estado)
+		estado = Y if Y.ndim == 2 else np.transpose(Y, (2, 0, 1))
+		E = ft.Trayectoria(self.modelo, t, estado, self.argms).energia
+		if self.E0 is None: self.E0 = E[..., 0]
+		self.maximo = np.maximum(self.maximo, np.max(np.abs(E - self.E0[..., None]), axis=-1))
+
+	def resultado(self):
+		'''
+		---Return---
+		* <float/np.array>: deriva relativa maxima (una por trayectoria en un lote)
+		'''
+		return self.maximo / np.maximum(np.abs(self.E0), np.finfo(float).tiny)
+
+class Poincare:
+	'''
+	Seccion de Poincare: guarda el estado cada vez que un angulo pasa por 0 (mod 2pi) en sentido positivo.
+	El punto de corte se interpola linealmente entre los dos instantes que lo rodean, tambien entre bloques.
+
+	---Parametros---
+	* angulo: posicion del angulo en el estado (0: th1, 2: th2, ...)
+	* tipo: tipo de los puntos guardados ('float32' ocupa la mitad)
+	'''
+	def __init__(self, angulo = 0, tipo = 'float64'):
+		self.angulo = angulo
+		self.tipo = tipo
+		self.anterior = None
+		self.puntos = []
+
+	def consume(self, t, Y):
+		'''
+		---Parametros---
+		* t: tiempos del bloque
+		* Y: estados del bloque
+		'''
+		# Se antepone el ultimo instante del bloque anterior para detectar cortes entre bloques
+		if self.anterior is not None:
+			t = np.concatenate([[self.anterior[0]], t])
+			Y = np.concatenate([self.anterior[1][None], Y])
+		self.anterior = (t[-1], Y[-1])
+
+		# Corte: sin(th) pasa de negativo a no negativo con cos(th) > 0
+		s = np.sin(Y[:, self.angulo])
+		corte = (s[:-1] < 0) & (s[1:] >= 0) & (np.cos(Y[1:, self.angulo]) > 0)
+		indices = np.nonzero(corte)
+		k = indices[0]
+		if not len(k): return
+
+		# Interpolacion lineal en el instante del corte
+		a, b = s[indices], s[(k + 1,) + indices[1:]]
+		u = - a / (b - a)
+		if len(indices) == 1: Ya, Yb = Y[k], Y[k + 1]
+		else: Ya, Yb = Y[k, :, indices[1]], Y[k + 1, :, indices[1]]
+		puntos = Ya + u[:, None] * (Yb - Ya)
+		tc = t[k] + u * (t[k + 1] - t[k])
+
+		# Cada punto: tiempo, indice de la trayectoria (en un lote) y estado
+		columnas = [tc[:, None]] + [np.asarray(i, dtype=float)[:, None] for i in indices[1:]] + [puntos]
+		self.puntos.append(np.hstack(columnas).astype(self.tipo))
+
+	def resultado(self):
+		'''
+		---Return---
+		* <np.array>: array (cortes, columnas) con el tiempo, el indice de la trayectoria (solo en un lote)
+		  y el estado en cada corte
+		'''
+		if not self.puntos: return np.empty((0, 0), dtype=self.tipo)
+		return np.concatenate(self.puntos)
+
+class Histograma:
+	'''
+	Histograma de una componente del estado acumulado por bloques
+
+	---Parametros---
+	* componente: posicion de la componente en el estado (0: th1, 1: w1, ...)
+	* bins: numero de intervalos
+	* rango: tupla (minimo, maximo) del histograma
+	* reducir: si es True la componente es un angulo y se reduce a (-pi,pi] (rango por defecto)
+	'''
+	def __init__(self, componente = 0, bins = 100, rango = None, reducir = True):
+		self.componente = componente
+		self.reducir = reducir
+		if rango is None:
+			if not reducir: raise ValueError('Hay que indicar el rango del histograma')
+			rango = (-np.pi, np.pi)
+		self.bordes = np.linspace(rango[0], rango[1], bins + 1)
+		self.cuentas = np.zeros(bins, dtype=np.int64)
+
+	def consume(self, t, Y):
+		'''
+		---Parametros---
+		* t: tiempos del bloque
+		* Y: estados del bloque
+		'''
+		x = Y[:, self.componente]
+		if self.reducir: x = ft.reduce_angulo(x)
+		self.cuentas += np.histogram(x, self.bordes)[0]
+
+	def resultado(self):
+		'''
+		---Return---
+		* <np.array>: cuentas de cada intervalo
+		* <np.array>: bordes de los intervalos
+		'''
+		return self.cuentas, self.bordes
\ No newline at end of file
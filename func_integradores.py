@@ -0,0 +1,191 @@
+'''
+Implementa metodos numericos de paso fijo para integrar las ecuaciones diferenciales de los pendulos.
+Los metodos trabajan con un estado de forma (estado,) o con un lote de estados apilados de forma (estado, N).
+'''
+
+# ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
+
+# ---Funciones---
+def rk4(f, y, t, dt, args=()):
+	'''
+	Realiza un paso del metodo Runge-Kutta clasico de orden 4
+
+	---Parametros---
+	* f: ecuacion diferencial con formato f(params, t, *args) (ver ode_pendulo)
+	* y: array con el estado actual, de forma (estado,) o (estado, N)
+	* t: tiempo actual
+	* dt: intervalo temporal del paso
+	* args: tupla con las constantes que aparecen en f
+
+	---Return---
+	* <np.array>: estado tras el paso, con la misma forma que y
+	'''
+	# Se evaluan las cuatro pendientes del metodo
+	k1 = np.asarray(f(y, t, *args))
+	k2 = np.asarray(f(y + dt/2*k1, t + dt/2, *args))
+	k3 = np.asarray(f(y + dt/2*k2, t + dt/2, *args))
+	k4 = np.asarray(f(y + dt*k3, t + dt, *args))
+
+	return y + dt/6*(k1 + 2*k2 + 2*k3 + k4)
+
+def verlet(f, y, t, dt, args=()):
+	'''
+	Realiza un paso del metodo de Stormer-Verlet (velocity Verlet) sobre un estado intercalado
+	(th1,w1,th2,w2,...). Es simplectico cuando la aceleracion solo depende de los angulos; si
+	depende tambien de las velocidades se evalua con la velocidad de medio paso.
+
+	---Parametros---
+	* f: ecuacion diferencial con formato f(params, t, *args) (ver ode_pendulo)
+	* y: array con el estado actual, de forma (estado,) o (estado, N)
+	* t: tiempo actual
+	* dt: intervalo temporal del paso
+	* args: tupla con las constantes que aparecen en f
+
+	---Return---
+	* <np.array>: estado tras el paso, con la misma forma que y
+	'''
+	y = np.array(y, dtype=float)
+
+	# Medio paso en velocidad, paso completo en posicion y otro medio paso en velocidad
+	y[1::2] += dt/2*np.asarray(f(y, t, *args))[1::2]
+	y[0::2] += dt*y[1::2]
+	y[1::2] += dt/2*np.asarray(f(y, t + dt, *args))[1::2]
+
+	return y
+
+# Numero de evaluaciones de la ecuacion diferencial por paso de cada metodo
+evaluaciones = {rk4: 4, verlet: 2}
+
+def integra(paso, f, y0, t, args=(), subpasos = 1):
+	'''
+	Integra una ecuacion diferencial con un metodo de paso fijo y devuelve el estado en cada tiempo de t
+
+	---Parametros---
+	* paso: metodo de paso fijo (rk4, verlet, ...)
+	* f: ecuacion diferencial con formato f(params, t, *args) (ver ode_pendulo)
+	* y0: estado inicial, de forma (estado,) o (estado, N)
+	* t: array de tiempos
+	* args: tupla con las constantes que aparecen en f
+	* subpasos: numero de pasos del metodo entre dos tiempos consecutivos de t
+
+	---Return---
+	* <np.array>: array de forma (T,) + forma de y0 con el estado en cada tiempo
+	'''
+	# Se reserva la salida y se coloca el estado inicial
+	y = np.array(y0, dtype=float)
+	sol = np.empty((len(t),) + y.shape)
+	sol[0] = y
+
+	# Se itera para cada intervalo de tiempo
+	for i in range(len(t) - 1):
+		dt = (t[i+1] - t[i]) / subpasos
+		ti = t[i]
+		for _ in range(subpasos):
+			y = paso(f, y, ti, dt, args)
+			ti += dt
+		sol[i+1] = y
+
+	return sol
+
+def paso_verlet(f, dt, x, v, ctes):
+	'''
+	Version de Stormer-Verlet con la misma interfaz que func_vpython.paso.
+	Actualiza los valores de posicion y velocidad segun una funcion aceleraciones.
+
+	---Parametros---
+	* f: expresion de la aceleracion en funcion de la posicion y la velocidad (ode.a_simple, ...)
+	* dt: intervalo temporal en el que se realiza la aproximacion numerica
+	* x: lista de valores de posicion
+	* v: lista de valores de velocidad
+	* ctes: constantes que aparecen en f
+
+	---Return---
+	* <lista>: nuevas posiciones
+	* <lista>: nuevas velocidades
+	'''
+	# Medio paso en velocidad
+	for i, ai in enumerate(f(x, v, ctes)):
+		v[i] += ai*dt/2
+
+	# Paso completo en posicion
+	for i, vi in enumerate(v):
+		x[i] += vi*dt
+
+	# Medio paso en velocidad con las nuevas posiciones
+	for i, ai in enumerate(f(x, v, ctes)):
+		v[i] += ai*dt/2
+
+	return x, v
+
+# Coeficientes de la composicion de Yoshida de orden 4
+_y1 = 1 / (2 - 2**(1/3))
+_y0 = - 2**(1/3) * _y1
+
+def paso_yoshida(f, dt, x, v, ctes):
+	'''
+	Metodo de Yoshida de orden 4 (composicion de tres pasos de Stormer-Verlet) con la misma
+	interfaz que func_vpython.paso.
+
+	---Parametros---
+	* f: expresion de la aceleracion en funcion de la posicion y la velocidad (ode.a_simple, ...)
+	* dt: intervalo temporal en el que se realiza la aproximacion numerica
+	* x: lista de valores de posicion
+	* v: lista de valores de velocidad
+	* ctes: constantes que aparecen en f
+
+	---Return---
+	* <lista>: nuevas posiciones
+	* <lista>: nuevas velocidades
+	'''
+	for c in (_y1, _y0, _y1):
+		x, v = paso_verlet(f, c*dt, x, v, ctes)
+
+	return x, v
+
+def paso_punto_medio(f, dt, x, v, ctes, tol = 1e-12, iteraciones = 20):
+	'''
+	Metodo implicito del punto medio con la misma interfaz que func_vpython.paso.
+	Es de orden 2 y simetrico (reversible en el tiempo), pero no conserva la estructura hamiltoniana
+	de doble, triple y esferico ni acota la deriva de energia. No es simplectico: se aplica sobre
+	(angulos, velocidades angulares), que no son coordenadas canonicas porque el momento es p = M(th)*w.
+	El sistema implicito se resuelve por iteracion de punto fijo.
+
+	---Parametros---
+	* f: expresion de la aceleracion en funcion de la posicion y la velocidad (ode.a_doble, ...)
+	* dt: intervalo temporal en el que se realiza la aproximacion numerica
+	* x: lista de valores de posicion
+	* v: lista de valores de velocidad
+	* ctes: constantes que aparecen en f
+	* tol: tolerancia de la iteracion de punto fijo
+	* iteraciones: numero maximo de iteraciones de punto fijo
+
+	---Return---
+	* <lista>: nuevas posiciones
+	* <lista>: nuevas velocidades
+	'''
+	# Se parte de un paso explicito de Euler como estimacion inicial
+	x0 = list(x); v0 = list(v)
+	a = f(x0, v0, ctes)
+	vn = [vi + ai*dt for vi, ai in zip(v0, a)]
+
+	# Se itera la ecuacion implicita del punto medio hasta que la velocidad converge
+	for _ in range(iteraciones):
+		vm = [(vi + vni)/2 for vi, vni in zip(v0, vn)]
+		xm = [xi + vmi*dt/2 for xi, vmi in zip(x0, vm)]
+		vnueva = [vi + ai*dt for vi, ai in zip(v0, f(xm, vm, ctes))]
+		error = max(abs(a - b) for a, b in zip(vnueva, vn))
+		vn = vnueva
+		if error < tol: break
+
+	# Se actualizan los valores de velocidad y posicion
+	for i in range(len(x)):
+		x[i] = x0[i] + (v0[i] + vn[i])*dt/2
+		v[i] = vn[i]
+
+	return x, v
+
+# ---Metodos de func_vpython---
+# Metodo de paso por defecto del bucle a tiempo real de cada pendulo de func_vpython
+metodos_vpython = {'simple': paso_yoshida, 'doble': paso_punto_medio, 'triple': paso_punto_medio, 'esferico': paso_punto_medio}
\ No newline at end of file
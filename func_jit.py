@@ -0,0 +1,178 @@
+'''
+Implementa una version compilada con numba de las ecuaciones de ode_pendulo y de los bucles de paso fijo.
+Si numba esta instalado, las ecuaciones de un unico estado (las que llaman odeint y solve_ivp en cada
+evaluacion) y los bucles de varios pasos (rk4 de func_flujo, Verlet y Yoshida de func_vpython) se
+ejecutan compilados, sin pasar por el interprete en cada paso. Las funciones compiladas se guardan en
+disco (cache=True, en __pycache__ o en NUMBA_CACHE_DIR), asi que solo se compilan la primera vez.
+Sin numba, o con la variable de entorno PENDULO_JIT=0, todo usa las funciones de numpy de siempre.
+'''
+
+# ---Imports---
+# os: variables de entorno
+import os
+# numpy (np): manejo de arrays
+import numpy as np
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+# jit_pendulo (jp): ecuaciones de ode_pendulo en codigo escalar, generadas por gen_jacobianos.py
+import jit_pendulo as jp
+# func_integradores (fi): metodos de paso fijo con la interfaz de func_vpython.paso
+import func_integradores as fi
+# numba: compilacion (opcional)
+try: import numba
+except ImportError: numba = None
+
+# Se usa la version compilada si numba esta instalado y no se desactiva con PENDULO_JIT=0
+disponible = numba is not None and os.environ.get('PENDULO_JIT', '1') != '0'
+
+def njit(f):
+	'''
+	Compila una funcion con numba y guarda el resultado en disco, o la deja igual si no hay numba
+
+	---Parametros---
+	* f: funcion a compilar
+
+	---Return---
+	* <funcion>: funcion compilada o la original
+	'''
+	return numba.njit(cache=True)(f) if disponible else f
+
+# ---Ecuaciones---
+# Ecuaciones de un unico estado generadas desde ode_pendulo por gen_jacobianos.py (jit_pendulo): las
+# constantes se pasan en un array c en el orden de ode_pendulo y el estado es un array intercalado
+_simple = njit(jp.Simple)
+_doble = njit(jp.Doble)
+_triple = njit(jp.Triple)
+_esferico = njit(jp.Esferico)
+
+@njit
+def _ecuacion(k, y, c):
+	'''
+	Derivada del estado del modelo k (0 simple, 1 doble, 2 triple, 3 esferico)
+	'''
+	if k == 0: return _simple(y, c)
+	elif k == 1: return _doble(y, c)
+	elif k == 2: return _triple(y, c)
+	return _esferico(y, c)
+
+# ---Bucles---
+@njit
+def _rk4(k, y, c, h, subpasos, n):
+	'''
+	n estados separados por subpasos pasos de Runge-Kutta de orden 4, empezando por y
+	'''
+	sol = np.empty((n, len(y)))
+	sol[0] = y
+	for i in range(1, n):
+		for _ in range(subpasos):
+			k1 = _ecuacion(k, y, c)
+			k2 = _ecuacion(k, y + h/2*k1, c)
+			k3 = _ecuacion(k, y + h/2*k2, c)
+			k4 = _ecuacion(k, y + h*k3, c)
+			y = y + h/6*(k1 + 2*k2 + 2*k3 + k4)
+		sol[i] = y
+	return sol
+
+@njit
+def _verlet(k, y, c, dt, coeficientes, pasos):
+	'''
+	pasos pasos compuestos de Stormer-Verlet (un coeficiente: Verlet; tres: Yoshida) sobre y, en el sitio
+	'''
+	for _ in range(pasos):
+		for cf in coeficientes:
+			h = cf*dt
+			a = _ecuacion(k, y, c)
+			for i in range(1, len(y), 2): y[i] += a[i]*h/2
+			for i in range(0, len(y), 2): y[i] += y[i+1]*h
+			a = _ecuacion(k, y, c)
+			for i in range(1, len(y), 2): y[i] += a[i]*h/2
+	return y
+
+# ---Modelos---
+# Para cada modelo: numero de la ecuacion compilada
+modelos = {'simple': 0, 'doble': 1, 'triple': 2, 'esferico': 3}
+
+# Para cada funcion de aceleraciones de ode_pendulo: (modelo, orden de sus constantes en las de ode_pendulo)
+aceleraciones = {ode.a_simple: ('simple', [0, 1, 2, 3]),
+					ode.a_doble: ('doble', [0, 3, 4, 1, 2]),
+					ode.a_triple: ('triple', [0, 4, 5, 6, 1, 2, 3]),
+					ode.a_esferico: ('esferico', [0, 1])}
+
+# Coeficientes de la composicion de cada metodo de paso de func_integradores
+composiciones = {fi.paso_verlet: np.array([1.]), fi.paso_yoshida: np.array([fi._y1, fi._y0, fi._y1])}
+
+# ---Funciones---
+def ecuacion(modelo, argms):
+	'''
+	Ecuacion diferencial de un modelo con las constantes ya fijadas, compilada si hay numba.
+	Un unico estado float64 (lo que pasan odeint y solve_ivp) va a la version compilada; un lote u
+	otro tipo de estado va a la version de numpy.
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* argms: tupla con las constantes del problema en el orden de ode_pendulo
+
+	---Return---
+	* <funcion>: f(params, t) con la interfaz de ode.Doble_gen
+	'''
+	if modelo in ('doble', 'triple'): f_np = getattr(ode, modelo.capitalize() + '_gen')(*argms)
+	else:
+		f_ode = getattr(ode, modelo.capitalize())
+		def f_np(params, t = 0): return f_ode(params, t, *argms)
+	if not disponible: return f_np
+
+	k = modelos[modelo]
+	c = np.array(argms, dtype=float)
+	def f(params, t = 0):
+		if isinstance(params, np.ndarray) and params.ndim == 1 and params.dtype == np.float64: return _ecuacion(k, params, c)
+		return f_np(params, t)
+
+	return f
+
+def rk4(modelo, argms, y, h, subpasos, n):
+	'''
+	Integra con Runge-Kutta de orden 4 en un unico bucle compilado
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* argms: tupla con las constantes del problema en el orden de ode_pendulo
+	* y: estado inicial, de forma (estado,)
+	* h: paso del metodo
+	* subpasos: pasos del metodo entre dos estados devueltos
+	* n: numero de estados devueltos, empezando por y
+
+	---Return---
+	* <np.array>: array (n, estado)
+	'''
+	return _rk4(modelos[modelo], np.array(y, dtype=float), np.array(argms, dtype=float), h, subpasos, n)
+
+def pasos(metodo, f, dt, x, v, ctes, n):
+	'''
+	Realiza n pasos de un metodo con la interfaz de func_vpython.paso. Si hay numba y el metodo
+	(Verlet o Yoshida) y la funcion de aceleraciones tienen version compilada, los n pasos se hacen
+	en un unico bucle compilado; si no, se llama n veces al metodo.
+
+	---Parametros---
+	* metodo: funcion de paso (fi.paso_yoshida, fi.paso_verlet, ...)
+	* f: expresion de la aceleracion en funcion de la posicion y la velocidad (ode.a_simple, ...)
+	* dt: intervalo temporal de cada paso
+	* x: lista de valores de posicion
+	* v: lista de valores de velocidad
+	* ctes: constantes que aparecen en f
+	* n: numero de pasos
+
+	---Return---
+	* <lista>: nuevas posiciones
+	* <lista>: nuevas velocidades
+	'''
+	if not (disponible and metodo in composiciones and f in aceleraciones):
+		for _ in range(n): x, v = metodo(f, dt, x, v, ctes)
+		return x, v
+
+	# Estado intercalado y constantes en el orden de ode_pendulo
+	modelo, orden = aceleraciones[f]
+	y = np.empty(2*len(x))
+	y[0::2] = x; y[1::2] = v
+	y = _verlet(modelos[modelo], y, np.array([ctes[i] for i in orden], dtype=float), dt, composiciones[metodo], n)
+
+	return y[0::2].tolist(), y[1::2].tolist()
\ No newline at end of file
@@ -0,0 +1,100 @@
+'''
+Implementa funciones que permiten resolver a la vez grandes conjuntos de trayectorias de pendulos.
+Todas las trayectorias avanzan juntas con las ecuaciones de ode_pendulo evaluadas sobre arrays,
+de forma que cada paso cuesta unas pocas operaciones vectoriales en lugar de N llamadas en Python.
+'''
+
+# ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+# func_integradores (fi): metodos numericos de paso fijo
+import func_integradores as fi
+
+# ---Funciones---
+def Sol_Lote(f, t, params, argms, subpasos = 1, bloque = 10000, archivo = None):
+	'''
+	Calcula un conjunto de trayectorias a la vez con un metodo Runge-Kutta de orden 4 vectorizado
+
+	---Parametros---
+	* f: ecuacion diferencial de ode_pendulo (ode.Doble, ode.Triple, ...)
+	* t: array de tiempos
+	* params: array de forma (N, estado) con los valores iniciales de cada trayectoria
+	* argms: tupla con las constantes del problema, cada una escalar o array de forma (N,),
+	  o bien un array de forma (N, constantes)
+	* subpasos: numero de pasos del metodo entre dos tiempos consecutivos de t
+	* bloque: numero maximo de trayectorias que se avanzan juntas en memoria
+	* archivo: si se indica, la salida se guarda en disco (.npy) y se devuelve como memmap
+
+	---Return---
+	* <np.array>: array (o memmap) de forma (N, T, estado) con las trayectorias
+	'''
+	# Se ordenan los valores iniciales en un array (N, estado)
+	params = np.atleast_2d(np.asarray(params, dtype=float))
+	N, n = params.shape
+
+	# Se separan las constantes en una tupla de arrays que admiten broadcasting con (N,)
+	if isinstance(argms, np.ndarray) and argms.ndim == 2: argms = tuple(argms.T)
+	argms = tuple(np.broadcast_to(np.asarray(a, dtype=float), (N,)) for a in argms)
+
+	# Se reserva la salida en memoria o en disco
+	if archivo is None: sol = np.empty((N, len(t), n))
+	else: sol = np.lib.format.open_memmap(archivo, mode='w+', dtype=float, shape=(N, len(t), n))
+
+	# Se avanzan las trayectorias por bloques para limitar la memoria de trabajo
+	for a in range(0, N, bloque):
+		b = min(a + bloque, N)
+		args = tuple(arg[a:b] for arg in argms)
+
+		# El estado del bloque se guarda como (estado, N) para que ode_pendulo lo desempaquete por filas
+		y = params[a:b].T.copy()
+		sol[a:b, 0, :] = y.T
+
+		# Se itera para cada intervalo de tiempo
+		for i in range(len(t) - 1):
+			dt = (t[i+1] - t[i]) / subpasos
+			ti = t[i]
+			for _ in range(subpasos):
+				y = fi.rk4(f, y, ti, dt, args)
+				ti += dt
+			sol[a:b, i+1, :] = y.T
+
+	# Se vuelcan a disco los datos pendientes
+	if archivo is not None: sol.flush()
+
+	return sol
+
+def Sol_Doble_Lote(t, params, argms, subpasos = 1, bloque = 10000, archivo = None):
+	'''
+	Utiliza Sol_Lote con ode.Doble para calcular un conjunto de trayectorias
+
+	---Parametros---
+	* t: array de tiempos
+	* params: array (N, 4) con los valores (th1,w1,th2,w2) de cada trayectoria
+	* argms: tupla con las constantes del problema (g,L1,L2,m1,m2), escalares o arrays (N,)
+	* subpasos: numero de pasos del metodo entre dos tiempos consecutivos de t
+	* bloque: numero maximo de trayectorias que se avanzan juntas en memoria
+	* archivo: si se indica, la salida se guarda en disco (.npy) y se devuelve como memmap
+
+	---Return---
+	* <np.array>: array de forma (N, T, 4) con las trayectorias
+	'''
+	return Sol_Lote(ode.Doble, t, params, argms, subpasos, bloque, archivo)
+
+def Sol_Triple_Lote(t, params, argms, subpasos = 1, bloque = 10000, archivo = None):
+	'''
+	Utiliza Sol_Lote con ode.Triple para calcular un conjunto de trayectorias
+
+	---Parametros---
+	* t: array de tiempos
+	* params: array (N, 6) con los valores (th1,w1,th2,w2,th3,w3) de cada trayectoria
+	* argms: tupla con las constantes del problema (g,L1,L2,L3,m1,m2,m3), escalares o arrays (N,)
+	* subpasos: numero de pasos del metodo entre dos tiempos consecutivos de t
+	* bloque: numero maximo de trayectorias que se avanzan juntas en memoria
+	* archivo: si se indica, la salida se guarda en disco (.npy) y se devuelve como memmap
+
+	---Return---
+	* <np.array>: array de forma (N, T, 6) con las trayectorias
+	'''
+	return Sol_Lote(ode.Triple, t, params, argms, subpasos, bloque, archivo)
\ No newline at end of file
@@ -3,23 +3,125 @@ Implementa funciones que permiten hacer calculos numericos precisos para la tray
 '''
 
 # ---Imports---
+# time: medicion del tiempo de calculo
+import time
 # numpy (np): manejo de arrays
 import numpy as np
 # scipy.optimize.odeint: resolucion de ecuaciones diferenciales
 from scipy.integrate import odeint
+# scipy.integrate.solve_ivp: resolucion de ecuaciones diferenciales con distintos metodos
+from scipy.integrate import solve_ivp
 # matplotlib.pyplot (plt): impresion grafica 2D
 import matplotlib.pyplot as plt
 # mpl_toolkits.mplot3d.Axes3D: impresion grafica 3D
 from mpl_toolkits.mplot3d import Axes3D
 # ode_pendulo (ode): ecuaciones diferenciales de pendulos
 import ode_pendulo as ode
+# jac_pendulo (jac): jacobianos exactos de las ecuaciones diferenciales
+import jac_pendulo as jac
 # func_sliders (fs): sliders
 import func_sliders as fs
 # func_animacion (fa): animaciones en matplotlib
 import func_animacion as fa
+# func_integradores (fi): metodos numericos de paso fijo
+import func_integradores as fi
+# func_exportar (fx): exportacion de animaciones sin pantalla
+import func_exportar as fx
+# func_cache (fc): cache de resultados
+import func_cache as fc
+# func_trayectoria (ft): resultados con magnitudes derivadas calculadas al pedirlas
+import func_trayectoria as ft
+# func_jit (fj): ecuaciones compiladas con numba si esta instalado
+import func_jit as fj
+# func_perfil (fpe): instrumentacion opcional
+import func_perfil as fpe
+
+# ---Metodos---
+# Metodos de paso fijo disponibles en Resolver; el resto de nombres se pasan a solve_ivp
+metodos_fijos = {'rk4': fi.rk4, 'verlet': fi.verlet}
+
+# Metodos de solve_ivp que usan el jacobiano
+metodos_implicitos = ['Radau', 'BDF', 'LSODA']
+
+# Version de las ecuaciones (ode_pendulo, jac_pendulo) y del formato de los resultados de Resolver.
+# Forma parte de la clave de la cache: se incrementa cada vez que cambian, para no devolver resultados
+# guardados en disco con las ecuaciones anteriores (2: termino a2 corregido de ode_pendulo.Triple)
+version = 2
 
 # ---Funciones---
-def Sol_Simple(t, params, argms):
+@fpe.cronometro('Resolver')
+def Resolver(f, t, params, args = (), Dfun = None, metodo = 'odeint', rtol = None, atol = None, energia = None, subpasos = 10, clave = None):
+	'''
+	Resuelve una ecuacion diferencial con el metodo elegido y mide el coste de la resolucion
+
+	---Parametros---
+	* f: ecuacion diferencial con formato f(params, t, *args) (ver ode_pendulo)
+	* t: array de tiempos
+	* params: tupla con los valores iniciales
+	* args: tupla con las constantes que aparecen en f
+	* Dfun: jacobiano de f con formato Dfun(params, t, *args) o None
+	* metodo: 'odeint', un metodo de solve_ivp ('LSODA', 'DOP853', 'RK45', 'Radau', ...)
+	  o un metodo de paso fijo de metodos_fijos ('rk4', 'verlet')
+	* rtol: tolerancia relativa (None: la del metodo)
+	* atol: tolerancia absoluta (None: la del metodo)
+	* energia: funcion energia(estado) para medir la deriva de energia, o None
+	* subpasos: pasos de un metodo de paso fijo entre dos tiempos consecutivos de t
+	* clave: tupla que identifica el modelo y las constantes de f (por ejemplo ('Doble', argms));
+	  si se indica, el resultado se busca y se guarda en la cache de func_cache
+
+	---Return---
+	* <np.array>: array (T, estado) con la solucion (de solo lectura si se usa la cache)
+	* <dict>: informe con el metodo, el tiempo de calculo (s), las evaluaciones de f, la deriva
+	  relativa maxima de energia y si el resultado viene de la cache
+	'''
+	# Si se indica una clave se busca el resultado en la cache
+	if clave is not None:
+		k = fc.clave(version, *clave, t, params, args, Dfun is not None, metodo, rtol, atol, subpasos if metodo in metodos_fijos else None, energia is not None)
+		inicio = time.perf_counter()
+		guardado = fc.cache.obtiene(k)
+		if guardado is not None: return guardado[0], dict(guardado[1], tiempo=time.perf_counter() - inicio, cache=True)
+
+	# Se agrupan las tolerancias indicadas
+	tol = {}
+	if rtol is not None: tol['rtol'] = rtol
+	if atol is not None: tol['atol'] = atol
+
+	inicio = time.perf_counter()
+
+	# odeint (LSODA de ODEPACK)
+	if metodo == 'odeint':
+		sol, info = odeint(f, params, t, args=args, Dfun=Dfun, full_output=True, **tol)
+		nfe = int(info['nfe'][-1])
+
+	# Metodos de paso fijo: no usan tolerancias
+	elif metodo in metodos_fijos:
+		paso = metodos_fijos[metodo]
+		sol = fi.integra(paso, f, params, t, args, subpasos)
+		nfe = fi.evaluaciones[paso] * subpasos * (len(t) - 1)
+
+	# Metodos de solve_ivp: el jacobiano solo se pasa a los implicitos
+	else:
+		if Dfun is not None and metodo in metodos_implicitos: tol['jac'] = lambda ti, y: Dfun(y, ti, *args)
+		res = solve_ivp(lambda ti, y: f(y, ti, *args), (t[0], t[-1]), params, method=metodo, t_eval=t, **tol)
+		# Una resolucion fallida no se devuelve ni se guarda en la cache
+		if not res.success: raise RuntimeError('solve_ivp no pudo resolver la ecuacion con %s: %s' % (metodo, res.message))
+		sol = res.y.T
+		nfe = int(res.nfev)
+
+	informe = {'metodo': metodo, 'tiempo': time.perf_counter() - inicio, 'nfe': nfe, 'deriva': None, 'cache': False}
+
+	# Deriva relativa maxima de energia respecto a la inicial
+	if energia is not None:
+		E = energia(sol.T)
+		informe['deriva'] = float(np.max(np.abs(E - E[0])) / max(abs(E[0]), np.finfo(float).tiny))
+
+	# Se guarda el resultado en la cache
+	if clave is not None: sol, informe = fc.cache.guarda(k, sol, informe)
+
+	return sol, informe
+
+@fpe.cronometro('Sol_Simple')
+def Sol_Simple(t, params, argms, jacobiano = True, metodo = 'odeint', rtol = None, atol = None, informe = False, cache = False, trayectoria = False):
 	'''
 	Utiliza ode.Simple para calcular la trayectoria
 
@@ -27,26 +129,33 @@ def Sol_Simple(t, params, argms):
 	* t: array de tiempos
 	* params: tupla con los valores iniciales (th,w)
 	* argms: tupla con las constantes del problema (g,L,b)
+	* jacobiano: si es True se pasa al metodo el jacobiano exacto de jac_pendulo
+	* metodo: metodo de resolucion (ver Resolver)
+	* rtol: tolerancia relativa (None: la del metodo)
+	* atol: tolerancia absoluta (None: la del metodo)
+	* informe: si es True se devuelve tambien el informe de Resolver
+	* cache: si es True el resultado se busca y se guarda en la cache de func_cache
+	* trayectoria: si es True se devuelve una func_trayectoria.Trayectoria en lugar de los arrays
 
 	---Return---
 	* <np.array>: angulo
 	* <np.array>: velocidad angular
 	* <np.array>: posicion x
 	* <np.array>: posicion y
+	* <dict>: informe de Resolver (solo si informe es True)
 	'''
-	# Se soluciona la ODE y se toman los datos del angulo y velocidad angular
-	sol = odeint(ode.Simple, params, t, args=argms)
-	th = sol[:, 0]
-	w = sol[:, 1]
+	# Se soluciona la ODE con las constantes ya fijadas
+	f, args, Dfun = Ecuacion('simple', argms, jacobiano)
+	sol, info = Resolver(f, t, params, args, Dfun, metodo, rtol, atol, lambda y: ode.Energia_Simple(y, *argms), clave=('Simple', argms) if cache else None)
 
-	# Se transforman las coordenadas polares en cartesianas
-	_, L, _, _ = argms
-	x = L * np.sin(th)
-	y = - L * np.cos(th)
+	# Se guarda el estado en una Trayectoria, que calcula las posiciones cartesianas al pedirlas
+	tr = ft.Trayectoria('simple', t, sol, argms, info)
+	if trayectoria: return tr
 
-	return th, w, x, y
+	return tr.columnas() + (info,) if informe else tr.columnas()
 
-def Sol_Doble(t, params, argms):
+@fpe.cronometro('Sol_Doble')
+def Sol_Doble(t, params, argms, jacobiano = True, metodo = 'odeint', rtol = None, atol = None, informe = False, cache = False, trayectoria = False):
 	'''
 	Utiliza ode.Doble para calcular la trayectoria
 
@@ -54,6 +163,13 @@ def Sol_Doble(t, params, argms):
 	* t: array de tiempos
 	* params: tupla con los valores (th1,w1,th2,w2)
 	* argms: tupla con las constantes del problema (g,L1,L2,m1,m2)
+	* jacobiano: si es True se pasa al metodo el jacobiano exacto de jac_pendulo
+	* metodo: metodo de resolucion (ver Resolver)
+	* rtol: tolerancia relativa (None: la del metodo)
+	* atol: tolerancia absoluta (None: la del metodo)
+	* informe: si es True se devuelve tambien el informe de Resolver
+	* cache: si es True el resultado se busca y se guarda en la cache de func_cache
+	* trayectoria: si es True se devuelve una func_trayectoria.Trayectoria en lugar de los arrays
 
 	---Return---
 	* <np.array>: angulo 1
@@ -64,24 +180,20 @@ def Sol_Doble(t, params, argms):
 	* <np.array>: posicion y 1
 	* <np.array>: posicion x 2
 	* <np.array>: posicion y 2
+	* <dict>: informe de Resolver (solo si informe es True)
 	'''
-	# Se soluciona la ODE y se toman los datos del angulo y velocidad angular para cada bola
-	sol = odeint(ode.Doble, params, t, args=argms)
-	th1 = sol[:, 0]
-	w1 = sol[:, 1]
-	th2 = sol[:, 2]
-	w2 = sol[:, 3]
-
-	# Se transforman las coordenadas polares en cartesianas
-	_, L1, L2, _, _ = argms
-	x1 = L1 * np.sin(th1)
-	y1 = - L1 * np.cos(th1)
-	x2 = x1 + L2 * np.sin(th2)
-	y2 = y1 - L2 * np.cos(th2)
-
-	return th1, w1, th2, w2, x1, y1, x2, y2
-
-def Sol_Triple(t, params, argms):
+	# Se soluciona la ODE con las constantes ya fijadas
+	f, args, Dfun = Ecuacion('doble', argms, jacobiano)
+	sol, info = Resolver(f, t, params, args, Dfun, metodo, rtol, atol, lambda y: ode.Energia_Doble(y, *argms), clave=('Doble', argms) if cache else None)
+
+	# Se guarda el estado en una Trayectoria, que calcula las posiciones cartesianas al pedirlas
+	tr = ft.Trayectoria('doble', t, sol, argms, info)
+	if trayectoria: return tr
+
+	return tr.columnas() + (info,) if informe else tr.columnas()
+
+@fpe.cronometro('Sol_Triple')
+def Sol_Triple(t, params, argms, jacobiano = True, metodo = 'odeint', rtol = None, atol = None, informe = False, cache = False, trayectoria = False):
 	'''
 	Utiliza ode.Triple para calcular la trayectoria
 
@@ -89,6 +201,13 @@ def Sol_Triple(t, params, argms):
 	* t: array de tiempos
 	* params: tupla con los valores (th1,w1,th2,w2,th3,w3)
 	* argms: tupla con las constantes del problema (g,L1,L2,L3,m1,m2,m3)
+	* jacobiano: si es True se pasa al metodo el jacobiano exacto de jac_pendulo
+	* metodo: metodo de resolucion (ver Resolver)
+	* rtol: tolerancia relativa (None: la del metodo)
+	* atol: tolerancia absoluta (None: la del metodo)
+	* informe: si es True se devuelve tambien el informe de Resolver
+	* cache: si es True el resultado se busca y se guarda en la cache de func_cache
+	* trayectoria: si es True se devuelve una func_trayectoria.Trayectoria en lugar de los arrays
 
 	---Return---
 	* <np.array>: angulo 1
@@ -103,28 +222,20 @@ def Sol_Triple(t, params, argms):
 	* <np.array>: posicion y 2
 	* <np.array>: posicion x 3
 	* <np.array>: posicion y 3
+	* <dict>: informe de Resolver (solo si informe es True)
 	'''
-	# Se soluciona la ODE y se toman los datos del angulo y velocidad angular para cada bola
-	sol = odeint(ode.Triple, params, t, args=argms)
-	th1 = sol[:, 0]
-	w1 = sol[:, 1]
-	th2 = sol[:, 2]
-	w2 = sol[:, 3]
-	th3 = sol[:, 4]
-	w3 = sol[:, 5]
-
-	# Se transforman las coordenadas polares en cartesianas
-	_, L1, L2, L3, _, _, _ = argms
-	x1 = L1 * np.sin(th1)
-	y1 = - L1 * np.cos(th1)
-	x2 = x1 + L2 * np.sin(th2)
-	y2 = y1 - L2 * np.cos(th2)
-	x3 = x2 + L3 * np.sin(th3)
-	y3 = y2 - L3 * np.cos(th3)
-
-	return th1, w1, th2, w2, th3, w3, x1, y1, x2, y2, x3, y3
-
-def Sol_Esferico(t, params, argms):
+	# Se soluciona la ODE con las constantes ya fijadas
+	f, args, Dfun = Ecuacion('triple', argms, jacobiano)
+	sol, info = Resolver(f, t, params, args, Dfun, metodo, rtol, atol, lambda y: ode.Energia_Triple(y, *argms), clave=('Triple', argms) if cache else None)
+
+	# Se guarda el estado en una Trayectoria, que calcula las posiciones cartesianas al pedirlas
+	tr = ft.Trayectoria('triple', t, sol, argms, info)
+	if trayectoria: return tr
+
+	return tr.columnas() + (info,) if informe else tr.columnas()
+
+@fpe.cronometro('Sol_Esferico')
+def Sol_Esferico(t, params, argms, jacobiano = True, metodo = 'odeint', rtol = None, atol = None, informe = False, cache = False, trayectoria = False):
 	'''
 	Utiliza ode.Esferico para calcular la trayectoria
 
@@ -132,6 +243,13 @@ def Sol_Esferico(t, params, argms):
 	* t: array de tiempos
 	* params: tupla con los valores (th,wth,ph,wph)
 	* argms: tupla con las constantes del problema (g,L)
+	* jacobiano: si es True se pasa al metodo el jacobiano exacto de jac_pendulo
+	* metodo: metodo de resolucion (ver Resolver)
+	* rtol: tolerancia relativa (None: la del metodo)
+	* atol: tolerancia absoluta (None: la del metodo)
+	* informe: si es True se devuelve tambien el informe de Resolver
+	* cache: si es True el resultado se busca y se guarda en la cache de func_cache
+	* trayectoria: si es True se devuelve una func_trayectoria.Trayectoria en lugar de los arrays
 
 	---Return---
 	* <np.array>: angulo th
@@ -141,176 +259,310 @@ def Sol_Esferico(t, params, argms):
 	* <np.array>: posicion x 1
 	* <np.array>: posicion y
 	* <np.array>: posicion z
+	* <dict>: informe de Resolver (solo si informe es True)
+	'''
+	# Se soluciona la ODE con las constantes ya fijadas
+	f, args, Dfun = Ecuacion('esferico', argms, jacobiano)
+	sol, info = Resolver(f, t, params, args, Dfun, metodo, rtol, atol, lambda y: ode.Energia_Esferico(y, *argms), clave=('Esferico', argms) if cache else None)
+
+	# Se guarda el estado en una Trayectoria, que calcula las posiciones cartesianas al pedirlas
+	tr = ft.Trayectoria('esferico', t, sol, argms, info)
+	if trayectoria: return tr
+
+	return tr.columnas() + (info,) if informe else tr.columnas()
+
+def Ecuacion(modelo, argms, jacobiano = True):
+	'''
+	Devuelve la ecuacion diferencial de un modelo y su jacobiano en el formato de Resolver
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple', 'esferico' o 'cadena' (argms = (g, L, m) con arrays de N barras)
+	* argms: tupla con las constantes del problema
+	* jacobiano: si es True se devuelve tambien el jacobiano exacto de jac_pendulo (la cadena no tiene)
+
+	---Return---
+	* <funcion>: ecuacion f(params, t, *args)
+	* <tupla>: constantes args que hay que pasar a f
+	* <funcion>: jacobiano Dfun(params, t, *args) o None
+	'''
+	# La cadena de N barras no tiene jacobiano exacto
+	if modelo == 'cadena': return fpe.cuenta('ecuacion cadena', ode.Cadena), tuple(argms), None
+
+	# Ecuacion con las constantes ya fijadas (compilada con numba si esta instalado)
+	J = getattr(jac, modelo.capitalize())
+	f = fpe.cuenta('ecuacion ' + modelo, fj.ecuacion(modelo, argms))
+	return f, (), (lambda y, t: J(y, t, *argms)) if jacobiano else None
+
+@fpe.cronometro('Sol_Denso')
+def Sol_Denso(modelo, t_f, params, argms, metodo = 'DOP853', rtol = 1e-10, atol = 1e-10, jacobiano = True, t_0 = 0):
+	'''
+	Resuelve un pendulo con paso adaptativo y salida densa. No se fija una malla de tiempos: se guardan
+	solo los nodos de los pasos del metodo y la trayectoria se evalua despues en los tiempos que se
+	necesiten (ver func_trayectoria.Densa.muestrea).
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* t_f: tiempo final
+	* params: tupla con los valores iniciales (ver Sol_*)
+	* argms: tupla con las constantes del problema (ver Sol_*)
+	* metodo: metodo de solve_ivp con salida densa ('DOP853', 'RK45', 'Radau', 'LSODA', ...)
+	* rtol: tolerancia relativa
+	* atol: tolerancia absoluta
+	* jacobiano: si es True se pasa a los metodos implicitos el jacobiano exacto de jac_pendulo
+	* t_0: tiempo inicial
+
+	---Return---
+	* <func_trayectoria.Densa>: solucion densa, con un informe con el metodo, el tiempo de calculo (s),
+	  las evaluaciones de f, el numero de nodos y la deriva relativa maxima de energia en los nodos
+	'''
+	f, args, Dfun = Ecuacion(modelo, argms, jacobiano)
+	tol = {'rtol': rtol, 'atol': atol}
+	if Dfun is not None and metodo in metodos_implicitos: tol['jac'] = lambda ti, y: Dfun(y, ti, *args)
+
+	inicio = time.perf_counter()
+	res = solve_ivp(lambda ti, y: f(y, ti, *args), (t_0, t_f), params, method=metodo, dense_output=True, **tol)
+	if not res.success: raise RuntimeError('solve_ivp no pudo resolver el pendulo %s: %s' % (modelo, res.message))
+	informe = {'metodo': metodo, 'tiempo': time.perf_counter() - inicio, 'nfe': int(res.nfev), 'nodos': len(res.t)}
+
+	# Deriva relativa maxima de energia en los nodos
+	E = ft.Trayectoria(modelo, res.t, res.y.T, argms).energia
+	informe['deriva'] = float(np.max(np.abs(E - E[0])) / max(abs(E[0]), np.finfo(float).tiny))
+
+	return ft.Densa(modelo, res.sol, argms, informe)
+
+def Prepara_Simple(valores):
+	'''
+	Convierte los valores de las variables de fs.simple (angulos en grados) en los argumentos de Sol_Simple
+
+	---Parametros---
+	* valores: lista con los valores en el orden de fs.simple
+
+	---Return---
+	* <tupla>: valores iniciales (th,w)
+	* <tupla>: constantes del problema (g,L,b,m)
+	'''
+	m, g, L, w_0, th_0, b = valores
+	th_0 = np.radians(th_0)
+
+	return (th_0, w_0), (g, L, b, m)
+
+def Prepara_Doble(valores):
+	'''
+	Convierte los valores de las variables de fs.doble (angulos en grados) en los argumentos de Sol_Doble
+
+	---Parametros---
+	* valores: lista con los valores en el orden de fs.doble
+
+	---Return---
+	* <tupla>: valores iniciales (th1,w1,th2,w2)
+	* <tupla>: constantes del problema (g,L1,L2,m1,m2)
+	'''
+	g, m1, m2, L1, L2, w1_0, w2_0, th1_0, th2_0 = valores
+	th1_0 = np.radians(th1_0)
+	th2_0 = np.radians(th2_0)
+
+	return (th1_0, w1_0, th2_0, w2_0), (g, L1, L2, m1, m2)
+
+def Prepara_Triple(valores):
+	'''
+	Convierte los valores de las variables de fs.triple (angulos en grados) en los argumentos de Sol_Triple
+
+	---Parametros---
+	* valores: lista con los valores en el orden de fs.triple
+
+	---Return---
+	* <tupla>: valores iniciales (th1,w1,th2,w2,th3,w3)
+	* <tupla>: constantes del problema (g,L1,L2,L3,m1,m2,m3)
+	'''
+	g, m1, m2, m3, L1, L2, L3, w1_0, w2_0, w3_0, th1_0, th2_0, th3_0 = valores
+	th1_0 = np.radians(th1_0)
+	th2_0 = np.radians(th2_0)
+	th3_0 = np.radians(th3_0)
+
+	return (th1_0, w1_0, th2_0, w2_0, th3_0, w3_0), (g, L1, L2, L3, m1, m2, m3)
+
+def Prepara_Esferico(valores):
+	'''
+	Convierte los valores de las variables de fs.esferico (angulos en grados) en los argumentos de Sol_Esferico
+
+	---Parametros---
+	* valores: lista con los valores en el orden de fs.esferico
+
+	---Return---
+	* <tupla>: valores iniciales (th,wth,ph,wph)
+	* <tupla>: constantes del problema (g,L)
 	'''
-	# Se soluciona la ODE y se toman los datos del angulo y velocidad angular
-	sol = odeint(ode.Esferico, params, t, args=argms)
-	th = sol[:, 0]
-	wth = sol[:, 1]
-	ph = sol[:, 2]
-	wph = sol[:, 3]
-
-	# Se transforman las coordenadas polares en cartesianas
-	_, L = argms
-	x = L * np.sin(ph) * np.cos(th)
-	y = L * np.sin(ph) * np.sin(th)
-	z = - L * np.cos(ph)
-
-	return th, wth, ph, wph, x, y, z
-
-def Simple():
+	m, g, L, wph_0, wth_0, ph_0, th_0 = valores
+	th_0 = np.radians(th_0)
+	ph_0 = np.radians(ph_0)
+
+	return (th_0, wth_0, ph_0, wph_0), (g, L)
+
+def Simple(valores = None, archivo = None):
 	'''
 	Proceso que realiza el experimento del pendulo simple.
 	Permite elegir parametros iniciales con sliders, calcula de forma numerica precisa la trayectoria y
 	realiza una animacion en 2D.
+
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* archivo: si se indica, la animacion se exporta sin pantalla (.mp4, .gif o .png) en lugar de mostrarse
 	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.simple)
-	button.on_clicked(reset_func)
-	plt.show()
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	valores = fs.obtener_valores(fs.simple, valores)
 
-	# Se toman los valores iniciales desde los sliders
-	m, g, L, w_0, th_0, b = [slider.val for slider in sliders]
-	th_0 = np.radians(th_0)
+	# Se pasan a las tuplas de parametros iniciales y constantes
+	params, args = Prepara_Simple(valores)
+	g, L, b, m = args
 
 	# Se establecen los parametros temporales
 	t_0, t_f = 0, 20
 	dt = 0.02
 
-	# Se crea el array de tiempos y las tuplas de parametros iniciales y constantes
+	# Se crea el array de tiempos
 	t = np.arange(t_0, t_f + dt, dt)
-	params = (th_0, w_0)
-	args = (g, L, b, m)
 
-	# Sol_Simple resuelve numericamente el problema
-	th, w, x, y = Sol_Simple(t, params, args)
+	# Sol_Simple resuelve numericamente el problema; se toman los angulos reducidos al intervalo (-pi,pi]
+	tr = Sol_Simple(t, params, args, cache=True, trayectoria=True)
+	x, y = list(tr.x), list(tr.y)
+	th_red, = tr.th_red
+	w, = tr.w
 
-	# Se reducen los angulos al intervalo (-pi,pi)
-	th_red = th%(2*np.pi)
-	th_red = np.where(th_red>np.pi,th_red-2*np.pi,th_red)
+	# Si se indica un archivo se exporta la animacion sin pantalla
+	if archivo is not None:
+		fx.Exportar2D(archivo, t, 1.1 * L, x, y, th_red, w, r'$\theta$ (rad)', r'$\omega$ (rad/s)')
+		return
 
 	# Animacion2D anima los datos obtenidos
-	an = fa.Animacion2D(t, 1.1 * L, [x], [y], th_red, w, r'$\theta$ (rad)', r'$\omega$ (rad/s)')
+	an = fa.Animacion2D(t, 1.1 * L, x, y, th_red, w, r'$\theta$ (rad)', r'$\omega$ (rad/s)')
 
 	# Se muestra
 	plt.show()
 
-def Doble():
+def Doble(valores = None, archivo = None):
 	'''
 	Proceso que realiza el experimento del pendulo doble.
 	Permite elegir parametros iniciales con sliders, calcula de forma numerica precisa la trayectoria y
 	realiza una animacion en 2D.
+
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* archivo: si se indica, la animacion se exporta sin pantalla (.mp4, .gif o .png) en lugar de mostrarse
 	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.doble)
-	button.on_clicked(reset_func)
-	plt.show()
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	valores = fs.obtener_valores(fs.doble, valores)
 
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, L1, L2, w1_0, w2_0, th1_0, th2_0 = [slider.val for slider in sliders]
-	th1_0 = np.radians(th1_0)
-	th2_0 = np.radians(th2_0)
+	# Se pasan a las tuplas de parametros iniciales y constantes
+	params, args = Prepara_Doble(valores)
+	g, L1, L2, m1, m2 = args
 
 	# Se establecen los parametros temporales
 	t_0, t_f = 0, 20
 	dt = 0.02
 
-	# Se crea el array de tiempos y las tuplas de parametros iniciales y constantes
+	# Se crea el array de tiempos
 	t = np.arange(t_0, t_f + dt, dt)
-	params = (th1_0, w1_0, th2_0, w2_0)
-	args = (g, L1, L2, m1, m2)
 
-	# Sol_Doble resuelve numericamente el problema
-	th1, w1, th2, w1, x1, y1, x2, y2 = Sol_Doble(t, params, args)
+	# Sol_Doble resuelve numericamente el problema; se toman los angulos reducidos al intervalo (-pi,pi]
+	tr = Sol_Doble(t, params, args, cache=True, trayectoria=True)
+	x, y = list(tr.x), list(tr.y)
+	th1_red, th2_red = tr.th_red
 
-	# Se reducen los angulos al intervalo (-pi,pi)
-	th1_red = th1%(2*np.pi)
-	th1_red = np.where(th1_red>np.pi,th1_red-2*np.pi,th1_red)
-	th2_red = th2%(2*np.pi)
-	th2_red = np.where(th2_red>np.pi,th2_red-2*np.pi,th2_red)
+	# Si se indica un archivo se exporta la animacion sin pantalla
+	if archivo is not None:
+		fx.Exportar2D(archivo, t, 1.1 * (L1 + L2), x, y, th2_red, th1_red, r'$\theta_2$ (rad)', r'$\theta_1$ (rad)', [m1,m2])
+		return
 
 	# Animacion2D anima los datos obtenidos
-	an = fa.Animacion2D(t, 1.1 * (L1 + L2), [x1,x2], [y1,y2], th2_red, th1_red, r'$\theta_2$ (rad)', r'$\theta_1$ (rad)', [m1,m2])
+	an = fa.Animacion2D(t, 1.1 * (L1 + L2), x, y, th2_red, th1_red, r'$\theta_2$ (rad)', r'$\theta_1$ (rad)', [m1,m2])
 
 	# Se muestra
 	plt.show()
 
-def Triple():
+def Triple(valores = None, archivo = None):
 	'''
 	Proceso que realiza el experimento del pendulo triple.
 	Permite elegir parametros iniciales con sliders, calcula de forma numerica precisa la trayectoria y
 	realiza una animacion en 2D.
+
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* archivo: si se indica, la animacion se exporta sin pantalla (.mp4, .gif o .png) en lugar de mostrarse
 	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.triple)
-	button.on_clicked(reset_func)
-	plt.show()
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	valores = fs.obtener_valores(fs.triple, valores)
 
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, m3, L1, L2, L3, w1_0, w2_0, w3_0, th1_0, th2_0, th3_0 = [slider.val for slider in sliders]
-	th1_0 = np.radians(th1_0)
-	th2_0 = np.radians(th2_0)
-	th3_0 = np.radians(th3_0)
+	# Se pasan a las tuplas de parametros iniciales y constantes
+	params, args = Prepara_Triple(valores)
+	g, L1, L2, L3, m1, m2, m3 = args
 
 	# Se establecen los parametros temporales
 	t_0, t_f = 0, 20
 	dt = 0.02
 
-	# Se crea el array de tiempos y las tuplas de parametros iniciales y constantes
+	# Se crea el array de tiempos
 	t = np.arange(t_0, t_f + dt, dt)
-	params = (th1_0, w1_0, th2_0, w2_0, th3_0, w3_0)
-	args = (g, L1, L2, L3, m1, m2, m3)
 
-	# Sol_Triple resuelve numericamente el problema
-	th1, w1, th2, w2, th3, w3, x1, y1, x2, y2, x3, y3 = Sol_Triple(t, params, args)
+	# Sol_Triple resuelve numericamente el problema; se toman los angulos reducidos al intervalo (-pi,pi]
+	tr = Sol_Triple(t, params, args, cache=True, trayectoria=True)
+	x, y = list(tr.x), list(tr.y)
+	_, th2_red, th3_red = tr.th_red
 
-	# Se reducen los angulos al intervalo (-pi,pi)
-	th2_red = th2%(2*np.pi)
-	th2_red = np.where(th2_red>np.pi,th2_red-2*np.pi,th2_red)
-	th3_red = th3%(2*np.pi)
-	th3_red = np.where(th3_red>np.pi,th3_red-2*np.pi,th3_red)
+	# Si se indica un archivo se exporta la animacion sin pantalla
+	if archivo is not None:
+		fx.Exportar2D(archivo, t, 1.1 * (L1 + L2 + L3), x, y, th2_red, th3_red, r'$\theta_2$ (rad)', r'$\theta_3$ (rad)', [m1,m2,m3])
+		return
 
 	# Animacion2D anima los datos obtenidos
-	an = fa.Animacion2D(t, 1.1 * (L1 + L2 + L3), [x1,x2,x3], [y1,y2,y3], th2_red, th3_red, r'$\theta_2$ (rad)', r'$\theta_3$ (rad)', [m1,m2,m3])
+	an = fa.Animacion2D(t, 1.1 * (L1 + L2 + L3), x, y, th2_red, th3_red, r'$\theta_2$ (rad)', r'$\theta_3$ (rad)', [m1,m2,m3])
 
 	# Se muestra
 	plt.show()
 
-def Esferico():
+def Esferico(valores = None, archivo = None):
 	'''
 	Proceso que realiza el experimento del pendulo esferico.
 	Permite elegir parametros iniciales con sliders, calcula de forma numerica precisa la trayectoria y
 	realiza una animacion en 3D.
+
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* archivo: si se indica, la animacion se exporta sin pantalla (.mp4, .gif o .png) en lugar de mostrarse
 	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.esferico)
-	button.on_clicked(reset_func)
-	plt.show()
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	valores = fs.obtener_valores(fs.esferico, valores)
 
-	# Se toman los valores iniciales desde los sliders
-	m, g, L, wph_0, wth_0, ph_0, th_0  = [slider.val for slider in sliders]
-	th_0 = np.radians(th_0)
-	ph_0 = np.radians(ph_0)
+	# Se pasan a las tuplas de parametros iniciales y constantes
+	params, args = Prepara_Esferico(valores)
+	g, L = args
 
 	# Se establecen los parametros temporales
 	t_0, t_f = 0, 20
 	dt = 0.02
 
-	# Se crea el array de tiempos y las tuplas de parametros iniciales y constantes
+	# Se crea el array de tiempos
 	t = np.arange(t_0, t_f + dt, dt)
-	params = (th_0, wth_0, ph_0, wph_0)
-	args = (g, L)
 
-	# Sol_Esferico resuelve numericamente el problema
-	th, wth, ph, wph, x, y, z = Sol_Esferico(t, params, args)
+	# Sol_Esferico resuelve numericamente el problema; se toman los angulos reducidos al intervalo (-pi,pi]
+	tr = Sol_Esferico(t, params, args, cache=True, trayectoria=True)
+	x, y, z = list(tr.x), list(tr.y), list(tr.z)
+	th_red, ph_red = tr.th_red
 
-	# Se reducen los angulos al intervalo (-pi,pi)
-	th_red = th%(2*np.pi)
-	th_red = np.where(th_red>np.pi,th_red-2*np.pi,th_red)
-	ph_red = ph%(2*np.pi)
-	ph_red = np.where(ph_red>np.pi,ph_red-2*np.pi,ph_red)
+	# Si se indica un archivo se exporta la animacion sin pantalla
+	if archivo is not None:
+		fx.Exportar3D(archivo, t, 1.1 * L, x, y, z, th_red, ph_red, r'$\theta$ (rad)', r'$\phi$ (rad)')
+		return
 
 	# Animacion3D anima los datos obtenidos
-	an = fa.Animacion3D(t, 1.1 * L, [x], [y], [z], th_red, ph_red, r'$\theta$ (rad)', r'$\phi$ (rad)')
+	an = fa.Animacion3D(t, 1.1 * L, x, y, z, th_red, ph_red, r'$\theta$ (rad)', r'$\phi$ (rad)')
 
 	# Se muestra
 	plt.show()
+
+
+# ---Modelos---
+# Para cada pendulo: (tabla de variables de func_sliders, funcion Prepara_*, funcion Sol_*)
+modelos = {'simple': (fs.simple, Prepara_Simple, Sol_Simple),
+				'doble': (fs.doble, Prepara_Doble, Sol_Doble),
+				'triple': (fs.triple, Prepara_Triple, Sol_Triple),
+				'esferico': (fs.esferico, Prepara_Esferico, Sol_Esferico)}
\ No newline at end of file
@@ -0,0 +1,166 @@
+'''
+Implementa la instrumentacion del programa: tiempos y numero de llamadas de las partes que pueden ser lentas
+(importaciones del menu, sliders, Sol_*, evaluaciones de la ecuacion diferencial, frames y dibujo de las
+animaciones y campos de energia) y un informe al terminar la ejecucion.
+Se activa con la variable de entorno PENDULO_PERFIL o con activa() (cli.py --perfil):
+	PENDULO_PERFIL=1: tiempos y contadores, con el informe en stderr al terminar
+	PENDULO_PERFIL=archivo.prof: ademas se perfila con cProfile y se vuelca en archivo.prof (ver pstats)
+Desactivada, los decoradores devuelven la funcion original, por lo que no tiene ningun coste; por eso hay
+que activarla antes de importar los modulos instrumentados.
+'''
+
+# ---Imports---
+# os: variables de entorno
+import os
+# sys: salida del informe
+import sys
+# time: medicion de tiempos
+import time
+# atexit: informe al terminar
+import atexit
+# cProfile: perfil completo opcional
+import cProfile
+# functools.wraps: conserva el nombre de las funciones instrumentadas
+from functools import wraps
+# contextlib.contextmanager: bloques de codigo medidos
+from contextlib import contextmanager
+# collections.defaultdict: registros por nombre
+from collections import defaultdict
+
+# ---Estado---
+activo = False
+# Para cada nombre: [llamadas, tiempo total en segundos]
+registros = defaultdict(lambda: [0, 0.])
+# Para cada nombre: numero de veces que se ha contado
+contadores = defaultdict(int)
+_perfil = None
+_inicio = None
+
+# ---Funciones---
+def activa(archivo = None):
+	'''
+	Activa la instrumentacion y programa el informe al terminar
+
+	---Parametros---
+	* archivo: si se indica, se perfila con cProfile y el resultado se vuelca en este archivo al terminar
+	'''
+	global activo, _perfil, _inicio
+	if activo: return
+	activo = True
+	_inicio = time.perf_counter()
+	if archivo:
+		_perfil = cProfile.Profile()
+		_perfil.enable()
+	atexit.register(termina, archivo)
+
+def termina(archivo = None):
+	'''
+	Vuelca el perfil de cProfile (si lo hay) y escribe el informe en stderr
+
+	---Parametros---
+	* archivo: archivo del volcado de cProfile
+	'''
+	if _perfil is not None:
+		_perfil.disable()
+		_perfil.dump_stats(archivo)
+	sys.stderr.write(informe())
+	if _perfil is not None: sys.stderr.write('Perfil de cProfile guardado en %s\n' % archivo)
+
+def cronometro(nombre):
+	'''
+	Decorador que acumula el numero de llamadas y el tiempo de una funcion (sin efecto si no esta activa)
+
+	---Parametros---
+	* nombre: nombre del registro
+
+	---Return---
+	* <funcion>: decorador
+	'''
+	def decorador(f):
+		if not activo: return f
+		registro = registros[nombre]
+
+		@wraps(f)
+		def medida(*args, **kwargs):
+			inicio = time.perf_counter()
+			try: return f(*args, **kwargs)
+			finally:
+				registro[0] += 1
+				registro[1] += time.perf_counter() - inicio
+		return medida
+
+	return decorador
+
+@contextmanager
+def bloque(nombre):
+	'''
+	Mide un bloque de codigo: with bloque('nombre'): ...
+
+	---Parametros---
+	* nombre: nombre del registro
+	'''
+	if not activo:
+		yield
+		return
+	inicio = time.perf_counter()
+	try: yield
+	finally:
+		registros[nombre][0] += 1
+		registros[nombre][1] += time.perf_counter() - inicio
+
+def cuenta(nombre, f):
+	'''
+	Cuenta las llamadas a una funcion sin medir su tiempo, para funciones muy cortas como la ecuacion
+	diferencial (sin efecto si no esta activa)
+
+	---Parametros---
+	* nombre: nombre del contador
+	* f: funcion a contar
+
+	---Return---
+	* <funcion>: funcion que cuenta y llama a f, o f si no esta activa
+	'''
+	if not activo: return f
+
+	@wraps(f)
+	def contada(*args, **kwargs):
+		contadores[nombre] += 1
+		return f(*args, **kwargs)
+	return contada
+
+def figura(fig, nombre):
+	'''
+	Mide el dibujo de una figura de matplotlib: el dibujo completo, el de cada objeto al hacer blitting
+	y la copia a pantalla (sin efecto si no esta activa)
+
+	---Parametros---
+	* fig: figura de matplotlib
+	* nombre: prefijo de los registros
+	'''
+	if not activo: return
+	canvas = fig.canvas
+	canvas.draw = cronometro(nombre + ' dibujo completo')(canvas.draw)
+	canvas.blit = cronometro(nombre + ' blit')(canvas.blit)
+	for ax in fig.axes: ax.draw_artist = cronometro(nombre + ' dibujo objetos')(ax.draw_artist)
+
+def informe():
+	'''
+	---Return---
+	* <string>: tabla con las llamadas, el tiempo total y medio y la fraccion del tiempo de la ejecucion
+	  de cada registro (de mayor a menor tiempo) y los contadores
+	'''
+	total = time.perf_counter() - _inicio if _inicio is not None else 0.
+	lineas = ['', '---Perfil (%.3f s)---' % total,
+		'%-40s %10s %12s %12s %7s' % ('registro', 'llamadas', 'total (s)', 'media (ms)', '%')]
+	for nombre, (llamadas, tiempo) in sorted(registros.items(), key=lambda r: -r[1][1]):
+		if not llamadas: continue
+		lineas.append('%-40s %10d %12.4f %12.3f %6.1f%%' % (nombre, llamadas, tiempo, tiempo / llamadas * 1e3, 100 * tiempo / total if total else 0))
+	if contadores:
+		lineas.append('%-40s %10s' % ('contador', 'llamadas'))
+		for nombre, n in sorted(contadores.items(), key=lambda c: -c[1]): lineas.append('%-40s %10d' % (nombre, n))
+
+	return '\n'.join(lineas) + '\n'
+
+# ---Activacion desde el entorno---
+_valor = os.environ.get('PENDULO_PERFIL', '')
+if _valor and _valor != '0': activa(_valor if _valor.endswith('.prof') else None)
\ No newline at end of file
@@ -0,0 +1,170 @@
+'''
+Implementa la obtencion de secciones de Poincare de los pendulos doble, triple y esferico.
+Los cortes con la seccion (un angulo que pasa por 0 en sentido positivo) se detectan como eventos de
+solve_ivp, que localiza cada corte buscando la raiz sobre la salida densa del paso en que ocurre, sin
+depender de una malla de tiempos. Muchas condiciones iniciales (por ejemplo a varias energias) se
+reparten entre un conjunto de procesos y los cortes se devuelven como una nube de puntos compacta.
+'''
+
+# ---Imports---
+# os: numero de nucleos
+import os
+# multiprocessing (mp): conjunto de procesos
+import multiprocessing as mp
+# numpy (np): manejo de arrays
+import numpy as np
+# scipy.integrate.solve_ivp: resolucion de ecuaciones diferenciales con eventos
+from scipy.integrate import solve_ivp
+# func_trayectoria (ft): energias de cada modelo
+import func_trayectoria as ft
+# func_pendulo (fp): ecuaciones de cada modelo
+import func_pendulo as fp
+
+# ---Funciones---
+def Seccion(modelo, params, argms, t_f, angulo = 0, metodo = 'DOP853', rtol = 1e-10, atol = 1e-10, segmento = 1000):
+	'''
+	Calcula los cortes de una trayectoria con la seccion angulo = 0 (mod 2pi) recorrida en sentido positivo
+
+	---Parametros---
+	* modelo: 'doble', 'triple' o 'esferico' (tambien 'simple')
+	* params: tupla con los valores iniciales (ver Sol_*)
+	* argms: tupla con las constantes del problema
+	* t_f: tiempo final
+	* angulo: posicion en el estado del angulo que define la seccion (0: th1, 2: th2, ...; en el
+	  esferico 0 es el azimut th, ya que ph = 0 es un punto singular de las coordenadas)
+	* metodo: metodo de solve_ivp
+	* rtol: tolerancia relativa
+	* atol: tolerancia absoluta
+	* segmento: duracion de cada tramo de integracion; solve_ivp guarda todos los pasos de un tramo,
+	  asi que integrar por tramos acota la memoria en simulaciones largas
+
+	---Return---
+	* <np.array>: tiempos de los cortes, de forma (cortes,)
+	* <np.array>: estados en los cortes, de forma (cortes, estado)
+	'''
+	f, args, Dfun = fp.Ecuacion(modelo, argms)
+	opciones = {'rtol': rtol, 'atol': atol}
+	if Dfun is not None and metodo in fp.metodos_implicitos: opciones['jac'] = lambda t, y: Dfun(y, t, *args)
+
+	# Evento: sin(angulo) pasa de negativo a positivo; con cos(angulo) > 0 el angulo pasa por 0 y no por pi
+	def evento(t, y): return np.sin(y[angulo])
+	evento.direction = 1
+
+	tiempos, estados = [], []
+	t0, y = 0, np.asarray(params, dtype=float)
+	while t0 < t_f:
+		t1 = min(t0 + segmento, t_f)
+		res = solve_ivp(lambda t, y: f(y, t, *args), (t0, t1), y, method=metodo, events=evento, **opciones)
+		if not res.success: raise RuntimeError('solve_ivp no pudo resolver el pendulo %s: %s' % (modelo, res.message))
+		tiempos.append(res.t_events[0])
+		estados.append(res.y_events[0].reshape(-1, len(y)))
+		t0, y = t1, res.y[:, -1]
+
+	t, Y = np.concatenate(tiempos), np.concatenate(estados)
+	validos = np.cos(Y[:, angulo]) > 0
+
+	return t[validos], Y[validos]
+
+def _seccion(tarea):
+	'''
+	Calcula la seccion de una condicion inicial dentro de un proceso del conjunto
+
+	---Parametros---
+	* tarea: tupla (indice, modelo, params, argms, t_f, angulo, metodo, rtol, atol, tipo)
+
+	---Return---
+	* <np.array>: puntos (cortes, 2 + estado) con el indice de la condicion inicial, el tiempo y el estado
+	'''
+	i, modelo, params, argms, t_f, angulo, metodo, rtol, atol, tipo = tarea
+	t, Y = Seccion(modelo, params, argms, t_f, angulo, metodo, rtol, atol)
+
+	return np.column_stack([np.full(len(t), i), t, Y]).astype(tipo)
+
+def Secciones(modelo, params, argms, t_f, angulo = 0, metodo = 'DOP853', rtol = 1e-10, atol = 1e-10, tipo = 'float32', procesos = None, archivo = None):
+	'''
+	Calcula en paralelo la seccion de Poincare de un conjunto de condiciones iniciales
+
+	---Parametros---
+	* modelo: 'doble', 'triple' o 'esferico'
+	* params: array (N, estado) con los valores iniciales
+	* argms: tupla con las constantes del problema
+	* t_f: tiempo final de cada trayectoria
+	* angulo: posicion en el estado del angulo que define la seccion
+	* metodo: metodo de solve_ivp
+	* rtol: tolerancia relativa
+	* atol: tolerancia absoluta
+	* tipo: tipo de los puntos devueltos ('float32' ocupa la mitad)
+	* procesos: numero de procesos (None: todos los nucleos)
+	* archivo: si se indica, la nube de puntos se guarda en ese .npy
+
+	---Return---
+	* <np.array>: nube de puntos (cortes, 2 + estado) con el indice de la condicion inicial, el tiempo
+	  y el estado en cada corte, ordenada por condicion inicial
+	'''
+	tareas = [(i, modelo, p, argms, t_f, angulo, metodo, rtol, atol, tipo) for i, p in enumerate(np.atleast_2d(params))]
+
+	# Las trayectorias tienen coste muy distinto: se reparten de una en una segun quedan procesos libres
+	with mp.Pool(procesos or os.cpu_count()) as pool:
+		partes = pool.map(_seccion, tareas, chunksize=1)
+	puntos = np.concatenate(partes) if partes else np.empty((0, 2 + len(tareas[0][2])), dtype=tipo)
+
+	if archivo is not None: np.save(archivo, puntos)
+
+	return puntos
+
+def Condiciones_Energia(modelo, argms, energias, n, angulo = 0, vmax = 5, semilla = 0):
+	'''
+	Genera condiciones iniciales sobre la seccion (angulo = 0, velocidad del angulo > 0) con la energia indicada.
+	El resto de angulos y velocidades se eligen al azar y la velocidad del angulo de la seccion se despeja de
+	la energia, que es cuadratica en ella; los puntos sin solucion se descartan.
+
+	---Parametros---
+	* modelo: 'doble', 'triple' o 'esferico'
+	* argms: tupla con las constantes del problema
+	* energias: energia o lista de energias (ver ode.Energia_*)
+	* n: numero de condiciones iniciales por energia
+	* angulo: posicion en el estado del angulo que define la seccion
+	* vmax: maximo valor absoluto de las velocidades elegidas al azar
+	* semilla: semilla del generador aleatorio
+
+	---Return---
+	* <np.array>: array (N, estado) con las condiciones iniciales
+	* <np.array>: energia de cada condicion inicial, de forma (N,)
+	'''
+	rng = np.random.default_rng(semilla)
+	dimension = {'simple': 2, 'doble': 4, 'triple': 6, 'esferico': 4}[modelo]
+	energia = lambda Y: ft.Trayectoria(modelo, None, Y, argms).energia
+
+	params, valores = [], []
+	for E in np.atleast_1d(energias):
+		encontradas = 0
+		for _ in range(1000):
+			if encontradas >= n: break
+
+			# Estados al azar con el angulo de la seccion en 0
+			Y = np.empty((4*n, dimension))
+			Y[:, 0::2] = rng.uniform(-np.pi, np.pi, (4*n, dimension // 2))
+			Y[:, 1::2] = rng.uniform(-vmax, vmax, (4*n, dimension // 2))
+			Y[:, angulo] = 0
+
+			# Coeficientes de la energia como polinomio de segundo grado en la velocidad de la seccion
+			v = angulo + 1
+			Y[:, v] = 0; c = energia(Y) - E
+			Y[:, v] = 1; E1 = energia(Y) - E
+			Y[:, v] = -1; Em = energia(Y) - E
+			a = (E1 + Em)/2 - c
+			b = (E1 - Em)/2
+
+			# Raiz positiva, si existe
+			disc = b*b - 4*a*c
+			validos = (disc >= 0) & (a > 0)
+			raiz = (-b[validos] + np.sqrt(disc[validos])) / (2*a[validos])
+			Y = Y[validos][raiz > 0]
+			Y[:, v] = raiz[raiz > 0]
+			Y = Y[:n - encontradas]
+			params.append(Y)
+			valores.append(np.full(len(Y), E))
+			encontradas += len(Y)
+		if encontradas < n: raise ValueError('No se encuentran estados con energia %g en la seccion' % E)
+
+	return np.concatenate(params), np.concatenate(valores)
\ No newline at end of file
@@ -11,6 +11,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 # matplotlib.widgets: sliders y botones
 from matplotlib.widgets import Slider, Button
+# func_perfil (fpe): instrumentacion opcional
+import func_perfil as fpe
 
 # ---Matrices---
 simple = [['$m$', 1, .5, 3],
@@ -53,12 +55,14 @@ esferico = [['$m$', 1, .5, 3],
 				 [r'$\theta_0$', 90, 0, 360]]
 
 # ---Funciones---
-def slider_gen(matriz):
+def slider_gen(matriz, arriba = .8, abajo = .1):
 	'''
 	Genera sliders a partir de una matriz
 
 	---Parametros---
 	* matriz: contiene la informacion sobre los sliders
+	* arriba: posicion vertical del primer slider (fraccion de la figura)
+	* abajo: posicion vertical del ultimo slider (fraccion de la figura)
 
 	---Return---
 	* <lista>: contiene los sliders creados
@@ -66,9 +70,9 @@ def slider_gen(matriz):
 	# Se definen las posiciones y tamaños que tendran los sliders
 	N = len(matriz)
 	posx = .1
-	posy = np.linspace(.8, .1, N)
+	posy = np.linspace(arriba, abajo, N)
 	sizex = .8
-	sizey = .75/N
+	sizey = .75/N * (arriba - abajo)/.7
 
 	# Se inicializa la lista que contendra los sliders
 	sliders = []
@@ -109,6 +113,7 @@ def reset_gen(sliders):
 
 	return button, reset
 
+@fpe.cronometro('sliders')
 def sliders_window(matriz):
 	'''
 	Crea una figura de matplotlib con sliders y boton de reset a partir de una matriz
@@ -125,3 +130,66 @@ def sliders_window(matriz):
 	sliders = slider_gen(matriz)
 	button, reset_func = reset_gen(sliders)
 	return button, reset_func, sliders
+
+
+def nombre(fila):
+	'''
+	Obtiene el nombre sencillo de una variable a partir de su label de LaTeX (r'$\omega_{\phi0}$' -> 'omega_phi0')
+
+	---Parametros---
+	* fila: fila de una matriz de variables
+
+	---Return---
+	* <string>: nombre sin simbolos de LaTeX
+	'''
+	return ''.join(c for c in fila[0] if c not in '$\\{}')
+
+def valores_defecto(matriz):
+	'''
+	Devuelve los valores iniciales de una matriz en un diccionario
+
+	---Parametros---
+	* matriz: contiene la informacion sobre las variables
+
+	---Return---
+	* <dict>: valor inicial de cada variable por su nombre
+	'''
+	return {nombre(fila): float(fila[1]) for fila in matriz}
+
+def obtener_valores(matriz, valores = None):
+	'''
+	Obtiene los valores de las variables de una matriz.
+	Si no se indican valores se abre la ventana de sliders y se leen al cerrarla; si se indican,
+	se completan con los valores iniciales de la matriz y se comprueba que esten entre los limites.
+
+	---Parametros---
+	* matriz: contiene la informacion sobre las variables
+	* valores: None, diccionario {nombre: valor} (ver nombre) o lista con un valor por fila
+
+	---Return---
+	* <lista>: valores de las variables en el orden de la matriz
+	'''
+	# Modo interactivo: ventana de sliders
+	if valores is None:
+		button, reset_func, sliders = sliders_window(matriz)
+		button.on_clicked(reset_func)
+		with fpe.bloque('sliders ventana'): plt.show()
+		return [slider.val for slider in sliders]
+
+	# Se pasan los valores a un diccionario completado con los valores iniciales
+	if not isinstance(valores, dict):
+		if len(valores) != len(matriz): raise ValueError('Se esperaban %d valores y se recibieron %d' % (len(matriz), len(valores)))
+		valores = {nombre(fila): v for fila, v in zip(matriz, valores)}
+	nombres = [nombre(fila) for fila in matriz]
+	desconocidos = set(valores) - set(nombres)
+	if desconocidos: raise ValueError('Variables desconocidas: %s (validas: %s)' % (', '.join(sorted(desconocidos)), ', '.join(nombres)))
+	completos = dict(valores_defecto(matriz), **valores)
+
+	# Se comprueba que cada valor este entre los limites de la matriz
+	lista = []
+	for fila, n in zip(matriz, nombres):
+		v = float(completos[n])
+		if not float(fila[2]) <= v <= float(fila[3]): raise ValueError('%s = %g fuera de los limites [%g, %g]' % (n, v, float(fila[2]), float(fila[3])))
+		lista.append(v)
+
+	return lista
\ No newline at end of file
@@ -0,0 +1,231 @@
+'''
+Implementa el tipo Trayectoria, que guarda solo el array de estado que devuelve la resolucion numerica
+y calcula a partir de el, la primera vez que se piden, las posiciones, los angulos reducidos, las
+velocidades cartesianas y la energia. Cada magnitud calculada se guarda para los siguientes accesos.
+Funciona igual para una trayectoria (estado de forma (T, estado)) que para un lote de func_lote
+(estado de forma (N, T, estado)).
+'''
+
+# ---Imports---
+# functools.cached_property: propiedades que se calculan una sola vez
+from functools import cached_property
+# numpy (np): manejo de arrays
+import numpy as np
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+
+# ---Modelos---
+# Para cada modelo: (posiciones de las longitudes en argms, funcion energia de ode_pendulo)
+modelos = {'simple': ([1], ode.Energia_Simple),
+				'doble': ([1, 2], ode.Energia_Doble),
+				'triple': ([1, 2, 3], ode.Energia_Triple),
+				'esferico': ([1], ode.Energia_Esferico)}
+
+# ---Funciones---
+def reduce_angulo(th):
+	'''
+	Reduce angulos al intervalo (-pi,pi]
+
+	---Parametros---
+	* th: angulo o array de angulos
+
+	---Return---
+	* <np.array>: angulos reducidos
+	'''
+	th_red = th%(2*np.pi)
+	return np.where(th_red>np.pi,th_red-2*np.pi,th_red)
+
+# ---Clases---
+class Trayectoria:
+	'''
+	Resultado de la resolucion de un pendulo. Las magnitudes por bola o por angulo tienen la bola o el
+	angulo como primera dimension: x[0] es la posicion x de la bola 1, de forma (T,) o (N, T).
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* t: array de tiempos
+	* estado: array (T, estado) o (N, T, estado) con los valores intercalados (th1,w1,th2,w2,...)
+	* argms: tupla con las constantes del problema (escalares o arrays (N,) en un lote)
+	* informe: informe de la resolucion (ver func_pendulo.Resolver) o None
+	'''
+	def __init__(self, modelo, t, estado, argms, informe = None):
+		self.modelo = modelo
+		self.t = t
+		self.estado = estado
+		self.argms = argms
+		self.informe = informe
+
+	def _cte(self, i):
+		'''
+		---Parametros---
+		* i: posicion de la constante en argms
+
+		---Return---
+		* <float/np.array>: constante, con forma (N, 1) en un lote para operar con arrays (N, T)
+		'''
+		c = np.asarray(self.argms[i], dtype=float)
+		return c[..., None] if c.ndim else c
+
+	@property
+	def th(self):
+		'''
+		---Return---
+		* <np.array>: angulos (th1,th2,...) o (th,ph) en el esferico, de forma (angulos, ..., T) (sin copia)
+		'''
+		return np.moveaxis(self.estado[..., 0::2], -1, 0)
+
+	@property
+	def w(self):
+		'''
+		---Return---
+		* <np.array>: velocidades angulares (w1,w2,...) o (wth,wph) en el esferico, de forma (angulos, ..., T) (sin copia)
+		'''
+		return np.moveaxis(self.estado[..., 1::2], -1, 0)
+
+	@cached_property
+	def th_red(self):
+		'''
+		---Return---
+		* <np.array>: angulos reducidos al intervalo (-pi,pi], de forma (angulos, ..., T)
+		'''
+		return reduce_angulo(self.th)
+
+	@cached_property
+	def _posiciones(self):
+		'''
+		---Return---
+		* <tupla>: arrays x, y (y z en el esferico) de forma (bolas, ..., T)
+		'''
+		# Pendulo esferico: una bola en coordenadas esfericas
+		if self.modelo == 'esferico':
+			th, ph = self.th
+			L = self._cte(1)
+			return np.array([L * np.sin(ph) * np.cos(th)]), np.array([L * np.sin(ph) * np.sin(th)]), np.array([- L * np.cos(ph)])
+
+		# Pendulos planos: cada bola se coloca a continuacion de la anterior
+		longitudes = modelos[self.modelo][0]
+		x = np.cumsum([self._cte(i) * np.sin(th) for i, th in zip(longitudes, self.th)], axis=0)
+		y = np.cumsum([- self._cte(i) * np.cos(th) for i, th in zip(longitudes, self.th)], axis=0)
+		return x, y
+
+	@property
+	def x(self):
+		'''
+		---Return---
+		* <np.array>: posiciones x de las bolas, de forma (bolas, ..., T)
+		'''
+		return self._posiciones[0]
+
+	@property
+	def y(self):
+		'''
+		---Return---
+		* <np.array>: posiciones y de las bolas, de forma (bolas, ..., T)
+		'''
+		return self._posiciones[1]
+
+	@property
+	def z(self):
+		'''
+		---Return---
+		* <np.array>: posiciones z de la bola del pendulo esferico, de forma (1, ..., T)
+		'''
+		if self.modelo != 'esferico': raise AttributeError('El pendulo %s es plano y no tiene z' % self.modelo)
+		return self._posiciones[2]
+
+	@cached_property
+	def velocidades(self):
+		'''
+		---Return---
+		* <tupla>: arrays vx, vy (y vz en el esferico) de forma (bolas, ..., T)
+		'''
+		# Pendulo esferico: derivada temporal de las coordenadas esfericas
+		if self.modelo == 'esferico':
+			(th, ph), (wth, wph) = self.th, self.w
+			L = self._cte(1)
+			vx = L * (np.cos(ph) * np.cos(th) * wph - np.sin(ph) * np.sin(th) * wth)
+			vy = L * (np.cos(ph) * np.sin(th) * wph + np.sin(ph) * np.cos(th) * wth)
+			vz = L * np.sin(ph) * wph
+			return np.array([vx]), np.array([vy]), np.array([vz])
+
+		# Pendulos planos: cada bola suma la velocidad de la barra a la de la bola anterior
+		longitudes = modelos[self.modelo][0]
+		vx = np.cumsum([self._cte(i) * np.cos(th) * w for i, th, w in zip(longitudes, self.th, self.w)], axis=0)
+		vy = np.cumsum([self._cte(i) * np.sin(th) * w for i, th, w in zip(longitudes, self.th, self.w)], axis=0)
+		return vx, vy
+
+	@cached_property
+	def energia(self):
+		'''
+		---Return---
+		* <np.array>: energia mecanica (por unidad de masa en el esferico), de forma (..., T)
+		'''
+		energia = modelos[self.modelo][1]
+		return energia(np.moveaxis(self.estado, -1, 0), *(self._cte(i) for i in range(len(self.argms))))
+
+	def columnas(self):
+		'''
+		---Return---
+		* <tupla>: arrays en el orden de las funciones Sol_* de func_pendulo
+		  (angulos y velocidades intercalados y despues las posiciones de cada bola)
+		'''
+		estado = tuple(self.estado[..., i] for i in range(self.estado.shape[-1]))
+		posiciones = tuple(p[k] for k in range(len(self.x)) for p in self._posiciones)
+		return estado + posiciones
+
+class Densa:
+	'''
+	Resultado de una resolucion con salida densa: guarda solo los nodos de los pasos adaptativos
+	del metodo y sus polinomios de interpolacion, y evalua el estado en cualquier tiempo sin volver a resolver.
+
+	---Parametros---
+	* modelo: 'simple', 'doble', 'triple' o 'esferico'
+	* solucion: scipy.integrate.OdeSolution (atributo sol de solve_ivp con dense_output=True)
+	* argms: tupla con las constantes del problema
+	* informe: informe de la resolucion (ver func_pendulo.Sol_Denso) o None
+	'''
+	def __init__(self, modelo, solucion, argms, informe = None):
+		self.modelo = modelo
+		self.solucion = solucion
+		self.argms = argms
+		self.informe = informe
+
+	@property
+	def nodos(self):
+		'''
+		---Return---
+		* <np.array>: tiempos de los pasos del metodo
+		'''
+		return self.solucion.ts
+
+	def __call__(self, t):
+		'''
+		Evalua el estado interpolando entre los nodos
+
+		---Parametros---
+		* t: tiempo o array de tiempos entre el primer y el ultimo nodo
+
+		---Return---
+		* <np.array>: estado de forma (estado,) o (T, estado)
+		'''
+		return np.asarray(self.solucion(t)).T
+
+	def muestrea(self, n = None, fps = None, t = None):
+		'''
+		Crea una Trayectoria con el estado interpolado en una malla de tiempos
+
+		---Parametros---
+		* n: numero de instantes equiespaciados entre el primer y el ultimo nodo
+		* fps: instantes por unidad de tiempo (alternativa a n)
+		* t: array de tiempos (alternativa a n y fps)
+
+		---Return---
+		* <Trayectoria>: trayectoria en los tiempos pedidos
+		'''
+		t_0, t_f = self.nodos[0], self.nodos[-1]
+		if t is None:
+			if n is None and fps is None: raise ValueError('Hay que indicar n, fps o t')
+			t = np.linspace(t_0, t_f, n) if n is not None else np.arange(t_0, t_f + 0.5/fps, 1/fps)
+			t = np.clip(t, min(t_0, t_f), max(t_0, t_f))
+
+		return Trayectoria(self.modelo, t, self(t), self.argms, self.informe)
\ No newline at end of file
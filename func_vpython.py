@@ -8,12 +8,16 @@ con vpython de diversos pendulos.
 import numpy as np
 # vpython: animaciones en 3D
 from vpython import *
-# matplotlib.pyplot (plt): impresion grafica 2D
-import matplotlib.pyplot as plt
+# time: reloj para el acumulador de tiempo (despues de vpython para que no lo oculte el import *)
+import time
 # func_sliders (fs): sliders
 import func_sliders as fs
 # ode_pendulo (ode): ecuaciones diferenciales de pendulos
 import ode_pendulo as ode
+# func_integradores (fi): metodos numericos de paso fijo
+import func_integradores as fi
+# func_jit (fj): bucle de pasos compilado con numba si esta instalado
+import func_jit as fj
 
 # ---Funciones---
 def paso(f, dt, x, v, ctes):
@@ -42,18 +46,81 @@ def paso(f, dt, x, v, ctes):
 
 	return x, v
 
-def Simple():
+def bucle(metodo, f, dt, x, v, ctes, dibuja, fps = 60, velocidad = 1, max_frame = 0.25):
+	'''
+	Bucle de simulacion a tiempo real con acumulador de paso fijo.
+	En cada frame se avanzan los pasos de fisica que corresponden al tiempo real transcurrido
+	(por la velocidad) y solo entonces se actualiza la escena. Como el paso dt es siempre el mismo,
+	la trayectoria no depende del ratio de frames.
+
+	---Parametros---
+	* metodo: funcion de paso con la interfaz de paso
+	* f: expresion de la aceleracion en funcion de la posicion y la velocidad
+	* dt: intervalo temporal de cada paso de fisica
+	* x: lista de valores de posicion
+	* v: lista de valores de velocidad
+	* ctes: constantes que aparecen en f
+	* dibuja: funcion dibuja(x) que actualiza la escena con las posiciones
+	* fps: ratio de frames de la escena
+	* velocidad: multiplicador inicial de la velocidad de la simulacion
+	* max_frame: tiempo real maximo (s) que se simula en un frame, para no acumular retraso
+	'''
+	# Se crean los controles de la velocidad y el texto con el factor de tiempo real
+	estado = {'velocidad': velocidad}
+	def cambia_velocidad(s):
+		estado['velocidad'] = s.value
+		texto_velocidad.text = ' velocidad x%.2f' % s.value
+	scene.append_to_caption('\n')
+	slider(bind=cambia_velocidad, min=0.1, max=5, value=velocidad)
+	texto_velocidad = wtext(text=' velocidad x%.2f' % velocidad)
+	scene.append_to_caption('\n')
+	texto_factor = wtext(text='')
+
+	# Se inicializan el reloj y el tiempo acumulado pendiente de simular
+	anterior = time.perf_counter()
+	acumulado = 0
+	t_sim = 0; t_real = 0
+
+	# Se realiza un bucle infinito para visualizar la animacion
+	while True:
+
+		# Se establece el ratio de frames de la escena
+		rate(fps)
+
+		# Se acumula el tiempo real transcurrido escalado por la velocidad
+		ahora = time.perf_counter()
+		transcurrido = min(ahora - anterior, max_frame)
+		anterior = ahora
+		acumulado += transcurrido * estado['velocidad']
+
+		# Se avanzan todos los pasos de fisica pendientes sin tocar la escena (en un bucle compilado si hay numba)
+		n = int(acumulado / dt)
+		acumulado -= n * dt
+		x, v = fj.pasos(metodo, f, dt, x, v, ctes, n)
+
+		# Se actualiza la escena una vez por frame
+		dibuja(x)
+
+		# Se actualiza el factor de tiempo real con una media de aproximadamente un segundo
+		t_sim += n * dt; t_real += transcurrido
+		if t_real > 1:
+			texto_factor.text = ' factor de tiempo real: %.2f' % (t_sim / t_real)
+			t_sim = 0; t_real = 0
+
+def Simple(valores = None, metodo = fi.metodos_vpython['simple'], dt = 1e-2, fps = 60, velocidad = 1):
 	'''
 	Realiza una animacion del pendulo simple.
 	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.simple)
-	button.on_clicked(reset_func)
-	plt.show()
 
-	# Se toman los valores iniciales desde los sliders
-	m, g, L, w, th, b = [slider.val for slider in sliders]
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* metodo: funcion de paso con la interfaz de paso (por defecto Yoshida de orden 4)
+	* dt: intervalo temporal de cada paso de fisica
+	* fps: ratio de frames de la escena
+	* velocidad: multiplicador inicial de la velocidad de la simulacion
+	'''
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	m, g, L, w, th, b = fs.obtener_valores(fs.simple, valores)
 	th = np.radians(th)
 	ctes = g, L, b, m
 
@@ -64,36 +131,30 @@ def Simple():
 	barra = cylinder(pos=vector(0, 0, 0), axis=xy, radius=rb)
 	esfera = sphere(pos=xy, radius=re, color = vector(1,0,0), make_trail = True)
 
-	# Se establece el intervalo temporal
-	dt = 1e-3
-
-	# Se realiza un bucle infinito para visualizar la animacion
-	while True:
-
-		# Se establece el ratio de frames
-		rate(1e3)
-
-		# Se actualizan posicion y velocidad por metodo numerico
-		th, w = paso(ode.a_simple, dt, [th], [w], ctes)
-		th = th[0]; w = w[0]
-
-		# Se actualiza la posicion de la esfera y la barra
+	# Se define la actualizacion de la posicion de la esfera y la barra
+	def dibuja(x):
+		th, = x
 		xy = vector(L * np.sin(th), - L *np.cos(th), 0)
 		esfera.pos = xy
 		barra.axis = xy
 
-def Doble():
+	# Se simula a tiempo real actualizando la escena a fps frames por segundo
+	bucle(metodo, ode.a_simple, dt, [th], [w], ctes, dibuja, fps, velocidad)
+
+def Doble(valores = None, metodo = fi.metodos_vpython['doble'], dt = 1e-2, fps = 60, velocidad = 1):
 	'''
 	Realiza una animacion del pendulo doble.
 	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.doble)
-	button.on_clicked(reset_func)
-	plt.show()
 
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, L1, L2, w1, w2, th1, th2 = [slider.val for slider in sliders]
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* metodo: funcion de paso con la interfaz de paso (por defecto punto medio implicito)
+	* dt: intervalo temporal de cada paso de fisica
+	* fps: ratio de frames de la escena
+	* velocidad: multiplicador inicial de la velocidad de la simulacion
+	'''
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	g, m1, m2, L1, L2, w1, w2, th1, th2 = fs.obtener_valores(fs.doble, valores)
 	th1 = np.radians(th1)
 	th2 = np.radians(th2)
 	ctes = g, m1, m2, L1, L2
@@ -109,20 +170,9 @@ def Doble():
 	barra2 = cylinder(pos=xy1, axis=xy2, radius=rb)
 	esfera2 = sphere(pos=xy1 + xy2, radius=re2, color = vector(0,1,0), make_trail = True)
 
-	# Se establece el intervalo temporal
-	dt = 1e-3
-
-	# Se realiza un bucle infinito para visualizar la animacion
-	while True:
-
-		# Se establece el ratio de frames
-		rate(1e3)
-
-		# Se actualizan posicion y velocidad por metodo numerico
-		th, w = paso(ode.a_doble, dt, [th1,th2], [w1,w2], ctes)
-		th1, th2 = th; w1, w2 = w
-
-		# Se actualizan la posiciones de las esferas y las barras
+	# Se define la actualizacion de las posiciones de las esferas y las barras
+	def dibuja(x):
+		th1, th2 = x
 		xy1 = vector(L1 * np.sin(th1), - L1 *np.cos(th1), 0)
 		xy2 = vector(L2 * np.sin(th2), - L2 *np.cos(th2), 0)
 		esfera1.pos = xy1
@@ -131,18 +181,23 @@ def Doble():
 		barra2.pos = xy1
 		barra2.axis = xy2
 
-def Triple():
+	# Se simula a tiempo real actualizando la escena a fps frames por segundo
+	bucle(metodo, ode.a_doble, dt, [th1,th2], [w1,w2], ctes, dibuja, fps, velocidad)
+
+def Triple(valores = None, metodo = fi.metodos_vpython['triple'], dt = 1e-2, fps = 60, velocidad = 1):
 	'''
 	Realiza una animacion del pendulo triple.
 	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.triple)
-	button.on_clicked(reset_func)
-	plt.show()
 
-	# Se toman los valores iniciales desde los sliders
-	g, m1, m2, m3, L1, L2, L3, w1, w2, w3, th1, th2, th3 = [slider.val for slider in sliders]
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* metodo: funcion de paso con la interfaz de paso (por defecto punto medio implicito)
+	* dt: intervalo temporal de cada paso de fisica
+	* fps: ratio de frames de la escena
+	* velocidad: multiplicador inicial de la velocidad de la simulacion
+	'''
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	g, m1, m2, m3, L1, L2, L3, w1, w2, w3, th1, th2, th3 = fs.obtener_valores(fs.triple, valores)
 	th1 = np.radians(th1)
 	th2 = np.radians(th2)
 	th3 = np.radians(th3)
@@ -163,20 +218,9 @@ def Triple():
 	barra3 = cylinder(pos=xy1 + xy2, axis=xy3, radius=rb)
 	esfera3 = sphere(pos=xy1 + xy2 + xy3, radius=re3, color = vector(0,0,1), make_trail = True)
 
-# Se establece el intervalo temporal
-	dt = 1e-3
-
-	# Se realiza un bucle infinito para visualizar la animacion
-	while True:
-
-		# Se establece el ratio de frames
-		rate(1e3)
-
-		# Se actualizan posicion y velocidad por metodo numerico
-		th, w = paso(ode.a_triple, dt, [th1,th2,th3], [w1,w2,w3], ctes)
-		th1, th2, th3 = th; w1, w2, w3 = w
-
-		# Se actualizan la posiciones de las esferas y las barras
+	# Se define la actualizacion de las posiciones de las esferas y las barras
+	def dibuja(x):
+		th1, th2, th3 = x
 		xy1 = vector(L1 * np.sin(th1), - L1 *np.cos(th1), 0)
 		xy2 = vector(L2 * np.sin(th2), - L2 *np.cos(th2), 0)
 		xy3 =  vector(L3 * np.sin(th3), - L3 *np.cos(th3), 0)
@@ -189,18 +233,23 @@ def Triple():
 		barra3.pos = xy1 + xy2
 		barra3.axis = xy3
 
-def Esferico():
+	# Se simula a tiempo real actualizando la escena a fps frames por segundo
+	bucle(metodo, ode.a_triple, dt, [th1,th2,th3], [w1,w2,w3], ctes, dibuja, fps, velocidad)
+
+def Esferico(valores = None, metodo = fi.metodos_vpython['esferico'], dt = 1e-2, fps = 60, velocidad = 1):
 	'''
 	Realiza una animacion del pendulo esferico.
 	Permite elegir parametros iniciales con sliders.
-	'''
-	# Se genera la ventana de sliders para seleccionar los parametros iniciales con func_sliders
-	button, reset_func, sliders = fs.sliders_window(fs.esferico)
-	button.on_clicked(reset_func)
-	plt.show()
 
-	# Se toman los valores iniciales desde los sliders
-	m, g, L, wph, wth, ph, th  = [slider.val for slider in sliders]
+	---Parametros---
+	* valores: valores de los parametros (ver fs.obtener_valores); si es None se eligen con sliders
+	* metodo: funcion de paso con la interfaz de paso (por defecto punto medio implicito)
+	* dt: intervalo temporal de cada paso de fisica
+	* fps: ratio de frames de la escena
+	* velocidad: multiplicador inicial de la velocidad de la simulacion
+	'''
+	# Se toman los valores iniciales desde los sliders de func_sliders, o desde valores si se indican
+	m, g, L, wph, wth, ph, th = fs.obtener_valores(fs.esferico, valores)
 	th = np.radians(th)
 	ph = np.radians(ph)
 	ctes = g, L
@@ -212,20 +261,12 @@ def Esferico():
 	barra = cylinder(pos=vector(0, 0, 0), axis=xyz, radius=rb)
 	esfera = sphere(pos=xyz, radius=re, color = vector(1,0,0), make_trail = True)
 
-# Se establece el intervalo temporal
-	dt = 1e-4
-
-	# Se realiza un bucle infinito para visualizar la animacion
-	while True:
-
-		# Se establece el ratio de frames
-		rate(1e4)
-
-		# Se actualizan posicion y velocidad por metodo numerico
-		ang, w = paso(ode.a_esferico, dt, [th,ph], [wth,wph], ctes)
-		th, ph = ang; wth, wph = w
-
-		# Se actualizan la posiciones de las esferas y las barras
+	# Se define la actualizacion de la posicion de la esfera y la barra
+	def dibuja(x):
+		th, ph = x
 		xyz = vector(L * np.sin(ph) * np.sin(th), -L * np.cos(ph) ,L * np.sin(ph) * np.cos(th))
 		esfera.pos = xyz
 		barra.axis = xyz
+
+	# Se simula a tiempo real actualizando la escena a fps frames por segundo
+	bucle(metodo, ode.a_esferico, dt, [th,ph], [wth,wph], ctes, dibuja, fps, velocidad)
\ No newline at end of file
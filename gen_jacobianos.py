@@ -0,0 +1,193 @@
+'''
+Programa que deriva simbolicamente los jacobianos de las ecuaciones de ode_pendulo y los
+escribe como codigo numpy en jac_pendulo.py. Escribe ademas las mismas ecuaciones como codigo
+escalar en jit_pendulo.py, que func_jit compila con numba, de forma que todas las versiones
+salen de una unica fuente (ode_pendulo).
+Solo es necesario ejecutarlo (python gen_jacobianos.py) si cambian las ecuaciones; requiere sympy.
+'''
+
+# ---Imports---
+# types: espacio de nombres sustituto de numpy
+import types
+# sympy (sp): calculo simbolico
+import sympy as sp
+# sympy.printing.numpy.NumPyPrinter: traduccion de expresiones a codigo numpy
+from sympy.printing.numpy import NumPyPrinter
+# sympy.printing.pycode.PythonCodePrinter: traduccion de expresiones a codigo escalar con math
+from sympy.printing.pycode import PythonCodePrinter
+# ode_pendulo (ode): ecuaciones diferenciales de pendulos
+import ode_pendulo as ode
+
+# ---Modelos---
+# Cada fila: [nombre, variables de estado, constantes, descripcion del estado]
+modelos = [['Simple', 'th w', 'g L b m', '(th,w)'],
+				['Doble', 'th1 w1 th2 w2', 'g L1 L2 m1 m2', '(th1,w1,th2,w2)'],
+				['Triple', 'th1 w1 th2 w2 th3 w3', 'g L1 L2 L3 m1 m2 m3', '(th1,w1,th2,w2,th3,w3)'],
+				['Esferico', 'th wth ph wph', 'g L', '(th,wth,ph,wph)']]
+
+# ---Funciones---
+def ecuacion(nombre, estado, ctes):
+	'''
+	Evalua simbolicamente una ecuacion de ode_pendulo
+
+	---Parametros---
+	* nombre: nombre de la funcion en ode_pendulo
+	* estado: string con las variables de estado separadas por espacios
+	* ctes: string con las constantes separadas por espacios
+
+	---Return---
+	* <lista>: simbolos de estado
+	* <lista>: simbolos de las constantes
+	* <sp.Matrix>: derivadas f_i del estado
+	'''
+	# Se crean los simbolos
+	y = sp.symbols(estado, real=True)
+	c = sp.symbols(ctes, positive=True)
+
+	# Se evalua la ecuacion de ode_pendulo sustituyendo numpy por funciones simbolicas
+	np_original = ode.np
+	ode.np = types.SimpleNamespace(sin=sp.sin, cos=sp.cos, tan=sp.tan)
+	try: f = sp.Matrix([sp.nsimplify(fi) for fi in getattr(ode, nombre)(y, 0, *c)])
+	finally: ode.np = np_original
+
+	return y, c, f
+
+def jacobiano(nombre, estado, ctes):
+	'''
+	Calcula el jacobiano simbolico de una ecuacion de ode_pendulo
+
+	---Parametros---
+	* nombre: nombre de la funcion en ode_pendulo
+	* estado: string con las variables de estado separadas por espacios
+	* ctes: string con las constantes separadas por espacios
+
+	---Return---
+	* <lista>: simbolos de estado
+	* <sp.Matrix>: jacobiano d(f_i)/d(y_j)
+	'''
+	y, _, f = ecuacion(nombre, estado, ctes)
+	return y, f.jacobian(y)
+
+def codigo(nombre, estado, ctes, descripcion):
+	'''
+	Escribe el codigo numpy de la funcion jacobiano de un modelo
+
+	---Parametros---
+	* nombre: nombre de la funcion en ode_pendulo
+	* estado: string con las variables de estado separadas por espacios
+	* ctes: string con las constantes separadas por espacios
+	* descripcion: tupla del estado para el docstring
+
+	---Return---
+	* <string>: codigo de la funcion
+	'''
+	y, J = jacobiano(nombre, estado, ctes)
+	n = len(y)
+
+	# Se extraen las subexpresiones comunes de los elementos no nulos
+	entradas = [(i, j) for i in range(n) for j in range(n) if J[i, j] != 0]
+	comunes, reducidas = sp.cse([J[i, j] for i, j in entradas], symbols=sp.numbered_symbols('x'))
+	printer = NumPyPrinter({'fully_qualified_modules': False})
+
+	# Cabecera y docstring de la funcion
+	lineas = ['def %s(params, t, %s):' % (nombre, ctes.replace(' ', ', ')),
+		"\t'''",
+		'\tJacobiano de ode_pendulo.%s (generado por gen_jacobianos.py)' % nombre,
+		'',
+		'\t---Parametros---',
+		'\t* params: tupla con los valores %s, escalares o arrays' % descripcion,
+		'\t* t: tiempo',
+		'\t* %s: constantes de ode_pendulo.%s' % (ctes.replace(' ', ', '), nombre),
+		'',
+		'\t---Return---',
+		'\t* <np.array>: matriz (%d, %d) con d(f_i)/d(y_j), con una dimension extra si params es un lote' % (n, n),
+		"\t'''",
+		'\t%s = params' % ', '.join(str(s) for s in y)]
+
+	# Subexpresiones comunes, elementos no nulos y retorno
+	lineas += ['\t%s = %s' % (s, printer.doprint(e)) for s, e in comunes]
+	lineas.append('\tJ = np.zeros((%d, %d) + np.shape(%s))' % (n, n, y[0]))
+	lineas += ['\tJ[%d, %d] = %s' % (i, j, printer.doprint(e)) for (i, j), e in zip(entradas, reducidas)]
+	lineas.append('\treturn J')
+
+	return '\n'.join(lineas)
+
+def codigo_escalar(nombre, estado, ctes, descripcion):
+	'''
+	Escribe el codigo escalar (math, compilable con numba) de la ecuacion de un modelo para un unico estado
+
+	---Parametros---
+	* nombre: nombre de la funcion en ode_pendulo
+	* estado: string con las variables de estado separadas por espacios
+	* ctes: string con las constantes separadas por espacios
+	* descripcion: tupla del estado para el docstring
+
+	---Return---
+	* <string>: codigo de la funcion
+	'''
+	y, c, f = ecuacion(nombre, estado, ctes)
+	n = len(y)
+
+	# Se extraen las subexpresiones comunes de las derivadas
+	comunes, reducidas = sp.cse(list(f), symbols=sp.numbered_symbols('x'))
+	printer = PythonCodePrinter({'fully_qualified_modules': False})
+
+	# Cabecera y docstring de la funcion; el estado y las constantes se leen elemento a elemento
+	lineas = ['def %s(y, c):' % nombre,
+		"\t'''",
+		'\tode_pendulo.%s para un unico estado (generado por gen_jacobianos.py)' % nombre,
+		'',
+		'\t---Parametros---',
+		'\t* y: array con los valores %s' % descripcion,
+		'\t* c: array con las constantes (%s) de ode_pendulo.%s' % (ctes.replace(' ', ','), nombre),
+		'',
+		'\t---Return---',
+		'\t* <np.array>: derivadas del estado, de forma (%d,)' % n,
+		"\t'''",
+		'\t%s = %s' % (', '.join(str(s) for s in y), ', '.join('y[%d]' % i for i in range(n))),
+		'\t%s = %s' % (', '.join(str(s) for s in c), ', '.join('c[%d]' % i for i in range(len(c))))]
+
+	# Subexpresiones comunes, derivadas y retorno
+	lineas += ['\t%s = %s' % (s, printer.doprint(e)) for s, e in comunes]
+	lineas.append('\tdy = np.empty(%d)' % n)
+	lineas += ['\tdy[%d] = %s' % (i, printer.doprint(e)) for i, e in enumerate(reducidas)]
+	lineas.append('\treturn dy')
+
+	return '\n'.join(lineas)
+
+if __name__ == '__main__':
+
+	# Se escribe el modulo con la cabecera y una funcion por modelo
+	cabecera = ["'''",
+		'Jacobianos exactos de las ecuaciones diferenciales de ode_pendulo.',
+		'Archivo generado por gen_jacobianos.py: no editar a mano.',
+		"'''",
+		'',
+		'# ---Imports---',
+		'# numpy (np): manejo de arrays',
+		'import numpy as np',
+		'# numpy (sin, cos, tan): funciones trigonometricas usadas por el codigo generado',
+		'from numpy import sin, cos, tan',
+		'',
+		'# ---Funciones---']
+	funciones = [codigo(*modelo) for modelo in modelos]
+	with open('jac_pendulo.py', 'w') as archivo:
+		archivo.write('\n'.join(cabecera) + '\n' + '\n\n'.join(funciones))
+
+	# Se escribe el modulo de ecuaciones escalares que compila func_jit
+	cabecera = ["'''",
+		'Ecuaciones diferenciales de ode_pendulo para un unico estado, en codigo escalar que func_jit',
+		'compila con numba.',
+		'Archivo generado por gen_jacobianos.py: no editar a mano.',
+		"'''",
+		'',
+		'# ---Imports---',
+		'# numpy (np): manejo de arrays',
+		'import numpy as np',
+		'# math (sin, cos, tan): funciones trigonometricas sobre escalares usadas por el codigo generado',
+		'from math import sin, cos, tan',
+		'',
+		'# ---Funciones---']
+	funciones = [codigo_escalar(*modelo) for modelo in modelos]
+	with open('jit_pendulo.py', 'w') as archivo:
+		archivo.write('\n'.join(cabecera) + '\n' + '\n\n'.join(funciones))
\ No newline at end of file
@@ -0,0 +1,279 @@
+'''
+Jacobianos exactos de las ecuaciones diferenciales de ode_pendulo.
+Archivo generado por gen_jacobianos.py: no editar a mano.
+'''
+
+# ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
+# numpy (sin, cos, tan): funciones trigonometricas usadas por el codigo generado
+from numpy import sin, cos, tan
+
+# ---Funciones---
+def Simple(params, t, g, L, b, m):
+	'''
+	Jacobiano de ode_pendulo.Simple (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* params: tupla con los valores (th,w), escalares o arrays
+	* t: tiempo
+	* g, L, b, m: constantes de ode_pendulo.Simple
+
+	---Return---
+	* <np.array>: matriz (2, 2) con d(f_i)/d(y_j), con una dimension extra si params es un lote
+	'''
+	th, w = params
+	J = np.zeros((2, 2) + np.shape(th))
+	J[0, 1] = 1
+	J[1, 0] = -g*cos(th)/L
+	J[1, 1] = -b/m
+	return J
+
+def Doble(params, t, g, L1, L2, m1, m2):
+	'''
+	Jacobiano de ode_pendulo.Doble (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* params: tupla con los valores (th1,w1,th2,w2), escalares o arrays
+	* t: tiempo
+	* g, L1, L2, m1, m2: constantes de ode_pendulo.Doble
+
+	---Return---
+	* <np.array>: matriz (4, 4) con d(f_i)/d(y_j), con una dimension extra si params es un lote
+	'''
+	th1, w1, th2, w2 = params
+	x0 = L1**(-1.0)
+	x1 = -2*th2
+	x2 = th1 + x1
+	x3 = sin(th1)
+	x4 = 2*m1 + m2
+	x5 = w2**2
+	x6 = L2*x5
+	x7 = th1 - th2
+	x8 = cos(x7)
+	x9 = L1*w1**2
+	x10 = 2*x6 + 2*x8*x9
+	x11 = sin(x7)
+	x12 = m2*x11
+	x13 = 2*m2
+	x14 = 2*th1 + x1
+	x15 = -m2*cos(x14) + x4
+	x16 = sin(x14)/x15**2
+	x17 = x0*x13*x16*(-g*(m2*sin(x2) + x3*x4) - x10*x12)
+	x18 = x15**(-1.0)
+	x19 = m2*cos(x2)
+	x20 = cos(th1)
+	x21 = m2*x8
+	x22 = x11**2*x13
+	x23 = x10*x21 - x22*x9
+	x24 = 4*w1*x18
+	x25 = x11*x21
+	x26 = x0*x18
+	x27 = 4*w2
+	x28 = m1 + m2
+	x29 = 2*x18
+	x30 = L2**(-1.0)
+	x31 = x11*x30
+	x32 = x30*(x21*x6 + x28*(g*x20 + x9))
+	x33 = x29*x32*x8
+	x34 = 4*x12*x16*x32
+	J = np.zeros((4, 4) + np.shape(th1))
+	J[0, 1] = 1
+	J[1, 0] = x0*x18*(-g*(x19 + x20*x4) - x23) - x17
+	J[1, 1] = -x24*x25
+	J[1, 2] = x17 + x26*(2*g*x19 + x23)
+	J[1, 3] = -L2*x12*x26*x27
+	J[2, 3] = 1
+	J[3, 0] = x29*x31*(-g*x28*x3 - x12*x6) + x33 - x34
+	J[3, 1] = L1*x24*x28*x31
+	J[3, 2] = x18*x22*x5 - x33 + x34
+	J[3, 3] = x18*x25*x27
+	return J
+
+def Triple(params, t, g, L1, L2, L3, m1, m2, m3):
+	'''
+	Jacobiano de ode_pendulo.Triple (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* params: tupla con los valores (th1,w1,th2,w2,th3,w3), escalares o arrays
+	* t: tiempo
+	* g, L1, L2, L3, m1, m2, m3: constantes de ode_pendulo.Triple
+
+	---Return---
+	* <np.array>: matriz (6, 6) con d(f_i)/d(y_j), con una dimension extra si params es un lote
+	'''
+	th1, w1, th2, w2, th3, w3 = params
+	x0 = 2*th2
+	x1 = 2*th3
+	x2 = -x1
+	x3 = x0 + x2
+	x4 = cos(x3)
+	x5 = m2 + m3
+	x6 = 2*th1
+	x7 = -x0
+	x8 = x6 + x7
+	x9 = cos(x8)
+	x10 = 2*m1
+	x11 = m1 + m2
+	x12 = m2**2 + m2*x10 + m3*x11
+	x13 = m1*m3*x4 + m2*x5*x9 - x12
+	x14 = x13**(-1.0)
+	x15 = th1 + x7
+	x16 = cos(x15)
+	x17 = m2*x5
+	x18 = x1 + x15
+	x19 = cos(x18)
+	x20 = th1 + x3
+	x21 = cos(x20)
+	x22 = (1/2)*m1
+	x23 = m3*x22
+	x24 = L1**(-1.0)
+	x25 = g*x24
+	x26 = -th3
+	x27 = th1 + x26
+	x28 = cos(x27)
+	x29 = th3 + x15
+	x30 = cos(x29)
+	x31 = x28 + x30
+	x32 = w3**2
+	x33 = L3*m3
+	x34 = x32*x33
+	x35 = x24*x34
+	x36 = m2*x35
+	x37 = w1**2
+	x38 = 2*m2
+	x39 = x38*x5
+	x40 = x39*x9
+	x41 = -th2
+	x42 = th1 + x41
+	x43 = cos(x42)
+	x44 = w2**2
+	x45 = L2*x44
+	x46 = x24*x39*x45
+	x47 = x37*x40 + x43*x46
+	x48 = sin(x8)
+	x49 = x39*x48
+	x50 = x13**(-2.0)
+	x51 = x17*x48
+	x52 = sin(x42)
+	x53 = sin(x27)
+	x54 = sin(x29)
+	x55 = x53 + x54
+	x56 = x25*(x12*sin(th1) + x17*sin(x15) + x23*(-sin(x18) - sin(x20))) + x36*x55 + x37*x51 + x46*x52
+	x57 = x50*x56
+	x58 = w1*x14
+	x59 = 2*x19 - 2*x21
+	x60 = sin(x3)
+	x61 = m3*x10
+	x62 = x60*x61
+	x63 = x50*(-x49 + x62)
+	x64 = 4*L2*w2*x14
+	x65 = -x28 + x30
+	x66 = w3*x14
+	x67 = th2 + th3 - x6
+	x68 = cos(x67)
+	x69 = L2**(-1.0)
+	x70 = x34*x69
+	x71 = th2 + x2
+	x72 = x6 + x71
+	x73 = cos(x72)
+	x74 = m1*m3
+	x75 = x73*x74
+	x76 = x41 + x6
+	x77 = m2*x11 + m3*(m2 + x22)
+	x78 = x77*cos(x76)
+	x79 = g*x69
+	x80 = th1 + x71
+	x81 = cos(x80)
+	x82 = x74*x81
+	x83 = m2*(x10 + x38) + m3*(m1 + x38)
+	x84 = x43*x83
+	x85 = L1*x69
+	x86 = x37*x85
+	x87 = x60*x74
+	x88 = -x51 + x87
+	x89 = m2 + x10
+	x90 = th2 + x26
+	x91 = sin(x90)
+	x92 = m2*sin(x67) + x89*x91
+	x93 = -x52*x83 + x74*sin(x80)
+	x94 = x44*x88 + x70*x92 + x79*(x23*sin(x71) + x23*sin(x72) + x77*sin(th2) - x77*sin(x76)) + x86*x93
+	x95 = x50*x94
+	x96 = 2*x14
+	x97 = x4*x61
+	x98 = m2*x68
+	x99 = cos(x90)
+	x100 = x89*x99
+	x101 = cos(x71)
+	x102 = L3**(-1.0)
+	x103 = x102*x5
+	x104 = L1*x103
+	x105 = x104*x37
+	x106 = m1*x105
+	x107 = x26 + x6
+	x108 = cos(x107)
+	x109 = th3 + x8
+	x110 = cos(x109)
+	x111 = 2*x110
+	x112 = g*x103*x22
+	x113 = x103*x91
+	x114 = x10*x45
+	x115 = -x53 + x54
+	x116 = x0 + x26
+	x117 = x106*x115 + x112*(sin(th3) - sin(x107) + sin(x109) - sin(x116)) - x113*x114 - x32*x87
+	x118 = x117*x50
+	x119 = cos(x116)
+	x120 = x103*x114*x99 + x32*x97
+	J = np.zeros((6, 6) + np.shape(th1))
+	J[0, 1] = 1
+	J[1, 0] = x14*(x25*(x12*cos(th1) + x16*x17 + x23*(-x19 - x21)) + x31*x36 + x47) + x49*x57
+	J[1, 1] = x49*x58
+	J[1, 2] = x14*(g*x24*(-x16*x39 + x23*x59) - x30*x35*x38 - x47) + x56*x63
+	J[1, 3] = x17*x24*x52*x64
+	J[1, 4] = x14*(-x23*x25*x59 + x36*x65) - x57*x62
+	J[1, 5] = x24*x33*x38*x55*x66
+	J[2, 3] = 1
+	J[3, 0] = x14*(-x38*x68*x70 - x40*x44 + x79*(x75 - 2*x78) + x86*(x82 - x84)) + x49*x95
+	J[3, 1] = w1*x85*x93*x96
+	J[3, 2] = x14*(x44*(x40 + x97) + x70*(x100 + x98) + x79*(x101*x23 + x23*x73 + x77*cos(th2) + x78) + x86*(x82 + x84)) + x63*x94
+	J[3, 3] = w2*x88*x96
+	J[3, 4] = x14*(L3*m3*x32*x69*(-x100 + x98) + g*x69*(-x101*x74 - x75) - x44*x97 - x61*x81*x86) - x62*x95
+	J[3, 5] = w3*x33*x69*x92*x96
+	J[4, 5] = 1
+	J[5, 0] = x118*x49 + x14*(x106*x65 + x112*(-2*x108 + x111))
+	J[5, 1] = x10*x104*x115*x58
+	J[5, 2] = x117*x63 + x14*((1/2)*g*m1*x102*x5*(-x111 - 2*x119) - x10*x105*x30 - x120)
+	J[5, 3] = -m1*x113*x64
+	J[5, 4] = -x118*x62 + x14*(x106*x31 + x112*(x108 + x110 + x119 + cos(th3)) + x120)
+	J[5, 5] = -x62*x66
+	return J
+
+def Esferico(params, t, g, L):
+	'''
+	Jacobiano de ode_pendulo.Esferico (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* params: tupla con los valores (th,wth,ph,wph), escalares o arrays
+	* t: tiempo
+	* g, L: constantes de ode_pendulo.Esferico
+
+	---Return---
+	* <np.array>: matriz (4, 4) con d(f_i)/d(y_j), con una dimension extra si params es un lote
+	'''
+	th, wth, ph, wph = params
+	x0 = tan(ph)
+	x1 = 2/x0
+	x2 = x0**2
+	x3 = 2*wth
+	x4 = cos(ph)
+	x5 = sin(ph)
+	x6 = wth**2
+	J = np.zeros((4, 4) + np.shape(th))
+	J[0, 1] = 1
+	J[1, 1] = -wph*x1
+	J[1, 2] = -wph*x3*(-x2 - 1)/x2
+	J[1, 3] = -wth*x1
+	J[2, 3] = 1
+	J[3, 1] = x3*x4*x5
+	J[3, 2] = x4**2*x6 - x5**2*x6 - g*x4/L
+	return J
\ No newline at end of file
@@ -0,0 +1,138 @@
+'''
+Ecuaciones diferenciales de ode_pendulo para un unico estado, en codigo escalar que func_jit
+compila con numba.
+Archivo generado por gen_jacobianos.py: no editar a mano.
+'''
+
+# ---Imports---
+# numpy (np): manejo de arrays
+import numpy as np
+# math (sin, cos, tan): funciones trigonometricas sobre escalares usadas por el codigo generado
+from math import sin, cos, tan
+
+# ---Funciones---
+def Simple(y, c):
+	'''
+	ode_pendulo.Simple para un unico estado (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* y: array con los valores (th,w)
+	* c: array con las constantes (g,L,b,m) de ode_pendulo.Simple
+
+	---Return---
+	* <np.array>: derivadas del estado, de forma (2,)
+	'''
+	th, w = y[0], y[1]
+	g, L, b, m = c[0], c[1], c[2], c[3]
+	dy = np.empty(2)
+	dy[0] = w
+	dy[1] = -b*w/m - g*sin(th)/L
+	return dy
+
+def Doble(y, c):
+	'''
+	ode_pendulo.Doble para un unico estado (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* y: array con los valores (th1,w1,th2,w2)
+	* c: array con las constantes (g,L1,L2,m1,m2) de ode_pendulo.Doble
+
+	---Return---
+	* <np.array>: derivadas del estado, de forma (4,)
+	'''
+	th1, w1, th2, w2 = y[0], y[1], y[2], y[3]
+	g, L1, L2, m1, m2 = c[0], c[1], c[2], c[3], c[4]
+	x0 = -2*th2
+	x1 = 2*m1 + m2
+	x2 = 1/(-m2*cos(2*th1 + x0) + x1)
+	x3 = L2*w2**2
+	x4 = th1 - th2
+	x5 = cos(x4)
+	x6 = L1*w1**2
+	x7 = 2*sin(x4)
+	dy = np.empty(4)
+	dy[0] = w1
+	dy[1] = x2*(-g*(m2*sin(th1 + x0) + x1*sin(th1)) - m2*x7*(x3 + x5*x6))/L1
+	dy[2] = w2
+	dy[3] = x2*x7*(m2*x3*x5 + (m1 + m2)*(g*cos(th1) + x6))/L2
+	return dy
+
+def Triple(y, c):
+	'''
+	ode_pendulo.Triple para un unico estado (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* y: array con los valores (th1,w1,th2,w2,th3,w3)
+	* c: array con las constantes (g,L1,L2,L3,m1,m2,m3) de ode_pendulo.Triple
+
+	---Return---
+	* <np.array>: derivadas del estado, de forma (6,)
+	'''
+	th1, w1, th2, w2, th3, w3 = y[0], y[1], y[2], y[3], y[4], y[5]
+	g, L1, L2, L3, m1, m2, m3 = c[0], c[1], c[2], c[3], c[4], c[5], c[6]
+	x0 = 2*th2
+	x1 = 2*th3
+	x2 = -x1
+	x3 = x0 + x2
+	x4 = m2 + m3
+	x5 = 2*th1
+	x6 = -x0
+	x7 = x5 + x6
+	x8 = 2*m1
+	x9 = m1 + m2
+	x10 = m2**2 + m2*x8 + m3*x9
+	x11 = 1/(m1*m3*cos(x3) + m2*x4*cos(x7) - x10)
+	x12 = w1**2
+	x13 = m2*x4
+	x14 = x13*sin(x7)
+	x15 = -th2
+	x16 = sin(th1 + x15)
+	x17 = 1/L1
+	x18 = 2*m2
+	x19 = w2**2
+	x20 = L2*x19
+	x21 = -th3
+	x22 = sin(th1 + x21)
+	x23 = th1 + x6
+	x24 = sin(th3 + x23)
+	x25 = w3**2
+	x26 = L3*m3*x25
+	x27 = (1/2)*m1
+	x28 = m3*x27
+	x29 = m1*m3
+	x30 = x29*sin(x3)
+	x31 = 1/L2
+	x32 = sin(th2 + x21)
+	x33 = th2 + x2
+	x34 = L1*x12
+	x35 = m2*x9 + m3*(m2 + x27)
+	x36 = x4/L3
+	dy = np.empty(6)
+	dy[0] = w1
+	dy[1] = x11*(g*x17*(x10*sin(th1) + x13*sin(x23) + x28*(-sin(th1 + x3) - sin(x1 + x23))) + m2*x17*x26*(x22 + x24) + x12*x14 + x16*x17*x18*x20*x4)
+	dy[2] = w2
+	dy[3] = x11*(g*x31*(x28*sin(x33) + x28*sin(x33 + x5) + x35*sin(th2) - x35*sin(x15 + x5)) + x19*(-x14 + x30) + x26*x31*(m2*sin(th2 + th3 - x5) + x32*(m2 + x8)) + x31*x34*(-x16*(m2*(x18 + x8) + m3*(m1 + x18)) + x29*sin(th1 + x33)))
+	dy[4] = w3
+	dy[5] = x11*(g*x27*x36*(sin(th3) + sin(th3 + x7) - sin(x0 + x21) - sin(x21 + x5)) + m1*x34*x36*(-x22 + x24) - x20*x32*x36*x8 - x25*x30)
+	return dy
+
+def Esferico(y, c):
+	'''
+	ode_pendulo.Esferico para un unico estado (generado por gen_jacobianos.py)
+
+	---Parametros---
+	* y: array con los valores (th,wth,ph,wph)
+	* c: array con las constantes (g,L) de ode_pendulo.Esferico
+
+	---Return---
+	* <np.array>: derivadas del estado, de forma (4,)
+	'''
+	th, wth, ph, wph = y[0], y[1], y[2], y[3]
+	g, L = c[0], c[1]
+	x0 = sin(ph)
+	dy = np.empty(4)
+	dy[0] = wth
+	dy[1] = -2*wph*wth/tan(ph)
+	dy[2] = wph
+	dy[3] = wth**2*x0*cos(ph) - g*x0/L
+	return dy
\ No newline at end of file
@@ -5,12 +5,14 @@ Permite navegar por las distintas secciones del programa de manera comoda
 # ---Imports---
 # curses: funciones de menu
 import curses
-# func_pendulo (fp): funciones para trabajar con pendulos
-import func_pendulo as fp
-# func_vpython (vp): funciones para realizar las animaciones de pendulos con vpython
-import func_vpython as vp
-# func_energias (fe): funciones para mostrar graficas con regimenes energeticos
-import func_energias as fe
+# importlib: importacion de los modulos de cada opcion al elegirla
+import importlib
+# func_perfil (fpe): instrumentacion opcional
+import func_perfil as fpe
+
+# Los modulos de las opciones (func_pendulo, func_vpython, func_energias) no se importan aqui: cargan
+# scipy, matplotlib y vpython, que tardan y vpython abre el navegador. Se importan en lanza al elegir
+# cada opcion, de forma que el menu aparece enseguida y las graficas de energia no cargan vpython.
 
 # ---Menus---
 # Principal
@@ -23,6 +25,19 @@ submenu_triple = ['Animación péndulo triple', 'Representación con vpython pé
 submenu_esferico = ['Animación péndulo esférico', 'Representación con vpython péndulo esférico', 'Regímenes de energía', 'Volver al menú principal', 'Salir']
 
 # ---Funciones---
+def lanza(modulo, nombre):
+	'''
+	Cierra la pantalla del menu, importa el modulo de la opcion elegida y la ejecuta,
+	midiendo la importacion y la ejecucion si la instrumentacion esta activa
+
+	---Parametros---
+	* modulo: nombre del modulo de la opcion ('func_pendulo', 'func_vpython' o 'func_energias')
+	* nombre: nombre de la funcion del modulo ('Simple', 'Doble', 'Triple' o 'Esferico')
+	'''
+	curses.endwin()
+	with fpe.bloque('importar ' + modulo): funcion = getattr(importlib.import_module(modulo), nombre)
+	with fpe.bloque('menu %s.%s' % (modulo, nombre)): funcion()
+
 def print_menu(stdscr, indice, menu):
 	'''
 	Imprime el menu en su situacion actual
@@ -109,56 +124,56 @@ def main(stdscr, menu):
 			elif menu == submenu_simple:
 
 				if indice == 0: 		# Animacion matplotlib
-					curses.endwin(); fp.Simple()
+					lanza('func_pendulo', 'Simple')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 1: 	# Animacion vpython
-					curses.endwin(); vp.Simple()
+					lanza('func_vpython', 'Simple')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 2: 	# Regimenes de energia
-					curses.endwin(); fe.Simple()
+					lanza('func_energias', 'Simple')
 					curses.wrapper(main, menuprincipal); break
 
 			# ---Submenu doble---
 			elif menu == submenu_doble:
 
 				if indice == 0:		# Animacion matplotlib
-					curses.endwin(); fp.Doble()
+					lanza('func_pendulo', 'Doble')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 1:	# Animacion vpython
-					curses.endwin(); vp.Doble()
+					lanza('func_vpython', 'Doble')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 2: 	# Regimenes de energia
-					curses.endwin(); fe.Doble()
+					lanza('func_energias', 'Doble')
 					curses.wrapper(main, menuprincipal); break
 
 			# ---Submenu triple---
 			elif menu == submenu_triple:
 
 				if indice == 0:		# Animacion matplotlib
-					curses.endwin(); fp.Triple()
+					lanza('func_pendulo', 'Triple')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 1:	# Animacion vpython
-					curses.endwin(); vp.Triple()
+					lanza('func_vpython', 'Triple')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 2: 	# Regimenes de energia
-					curses.endwin(); fe.Triple()
+					lanza('func_energias', 'Triple')
 					curses.wrapper(main, menuprincipal); break
 
 			# ---Submenu esferico---
 			elif menu == submenu_esferico:
 
 				if indice == 0:		# Animacion matplotlib
-					curses.endwin(); fp.Esferico()
+					lanza('func_pendulo', 'Esferico')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 1:	# Animacion vpython
-					curses.endwin(); vp.Esferico()
+					lanza('func_vpython', 'Esferico')
 					curses.wrapper(main, menuprincipal); break
 				elif indice == 2: 	# Regimenes de energia
-					curses.endwin(); fe.Esferico()
+					lanza('func_energias', 'Esferico')
 					curses.wrapper(main, menuprincipal); break
 
 		# Otra tecla: no actua
 		else: pass
 
 		# Se imprime el menu con las nuevas selecciones
-		print_menu(stdscr, indice, menu)
+		print_menu(stdscr, indice, menu)
\ No newline at end of file
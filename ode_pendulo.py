@@ -1,8 +1,11 @@
 '''
-Funciones con ecuaciones diferenciales para los distintos pendulos
+Funciones con ecuaciones diferenciales para los distintos pendulos.
+Cadena generaliza el simple (sin rozamiento), el doble y el triple a una cadena de N barras.
 '''
 
 # ---Imports---
+# math: funciones trigonometricas rapidas sobre escalares
+import math
 # numpy (np): manejo de arrays
 import numpy as np
 
@@ -79,11 +82,172 @@ def Triple(params, t, g, L1, L2, L3, m1, m2, m3):
 	den = m1*m3*np.cos(2*th32)+m2*m23*np.cos(2*th21)-m12*m3-m2**2-2*m1*m2
 
 	a1 = (L3/L1*m2*m3*(np.sin(th32-th21)-np.sin(th31))*w3**2-2*L2/L1*m2*m23*np.sin(th21)*w2**2-m2*m23*np.sin(2*th21)*w1**2+g/L1*(0.5*m1*m3*(np.sin(2*th32-th1)-np.sin(2*th32+th1))-m2*m23*np.sin(th2+th21)+(m12*m3+m2**2+2*m1*m2)*np.sin(th1)))/den
-	a2 = (L3/L2*m3*(m2*np.sin(th31+th21)-(m12+m1)*np.sin(th32))*w3**2+(m2*m23*np.sin(2*th21)-m1*m3*np.sin(2*th32))*w2**2+L1/L2*(((m12+m1)*m3+2*m12*m2)*np.sin(th21)-m1*m3*np.sin(th32+th31))*w1**2+g/L2*(-0.5*m1*m3*np.sin(th32+th31-th1)-0.5*m1*m3*np.sin(th32+th3)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th21-th1)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th2)))/den
+	a2 = (L3/L2*m3*(m2*np.sin(th31+th21)-(m12+m1)*np.sin(th32))*w3**2+(m2*m23*np.sin(2*th21)-m1*m3*np.sin(2*th32))*w2**2+L1/L2*(((m12+m2)*m3+2*m12*m2)*np.sin(th21)-m1*m3*np.sin(th32+th31))*w1**2+g/L2*(-0.5*m1*m3*np.sin(th32+th31-th1)-0.5*m1*m3*np.sin(th32+th3)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th21-th1)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th2)))/den
 	a3 = (m1*m3*np.sin(2*th32)*w3**2+2*L2/L3*m1*m23*np.sin(th32)*w2**2+L1/L3*m1*m23*(np.sin(th32-th21)+np.sin(th31))*w1**2+0.5*g/L3*m1*m23*(np.sin(th32-th21+th1)+np.sin(th32-th2)+np.sin(th31-th1)+np.sin(th3)))/den
 
 	return [w1, a1, w2, a2, w3, a3]
 
+def Doble_gen(g, L1, L2, m1, m2):
+	'''
+	Genera la ecuacion diferencial del pendulo doble con las constantes ya fijadas.
+	Las combinaciones de constantes se calculan una unica vez y los senos y cosenos de
+	las diferencias de angulos se obtienen de los de cada angulo.
+
+	---Parametros---
+	* g: gravedad
+	* L1: longitud de la barra 1
+	* L2: longitud de la barra 2
+	* m1: masa de la bola 1
+	* m2: masa de la bola 2
+
+	---Return---
+	* <funcion>: f(params, t) equivalente a Doble, que admite un estado (th1,w1,th2,w2)
+	  o un array apilado de forma (4, N)
+	'''
+	# Se precalculan las combinaciones de constantes
+	A = 2*m1 + m2
+	gA = g*A; gm2 = g*m2; m12 = m1 + m2; gm12 = g*m12
+	dm2 = 2*m2
+
+	def f(params, t = 0):
+		# Para un unico estado se trabaja con floats y math, mucho mas rapido que numpy sobre escalares
+		if isinstance(params, np.ndarray) and params.ndim == 1: params = params.tolist()
+		th1, w1, th2, w2 = params
+		sin, cos = (math.sin, math.cos) if isinstance(th1, float) else (np.sin, np.cos)
+
+		# Funciones trigonometricas de cada angulo y de su diferencia
+		s1 = sin(th1); c1 = cos(th1); s2 = sin(th2); c2 = cos(th2)
+		sdth = s1*c2 - c1*s2; cdth = c1*c2 + s1*s2
+		Lth1 = w1*w1*L1; Lth2 = w2*w2*L2
+		B = A - m2*(cdth*cdth - sdth*sdth)
+
+		a1 = (-(gA*s1 + gm2*(sdth*c2 - cdth*s2)) - dm2*sdth*(Lth2 + Lth1*cdth))/(L1*B)
+		a2 = (2*sdth*(m12*Lth1 + gm12*c1 + Lth2*m2*cdth))/(L2*B)
+
+		return [w1, a1, w2, a2]
+
+	return f
+
+def Triple_gen(g, L1, L2, L3, m1, m2, m3):
+	'''
+	Genera la ecuacion diferencial del pendulo triple con las constantes ya fijadas.
+	Todas las combinaciones de masas y longitudes se calculan una unica vez, y los senos
+	de Triple se reescriben a partir de sin/cos de th1, th2 y th3 (seis llamadas en total).
+
+	---Parametros---
+	* g: gravedad
+	* L1: longitud de la barra 1
+	* L2: longitud de la barra 2
+	* L3: longitud de la barra 3
+	* m1: masa de la bola 1
+	* m2: masa de la bola 2
+	* m3: masa de la bola 3
+
+	---Return---
+	* <funcion>: f(params, t) equivalente a Triple, que admite un estado (th1,w1,th2,w2,th3,w3)
+	  o un array apilado de forma (6, N)
+	'''
+	# Se precalculan las combinaciones de constantes
+	m12 = m1 + m2; m23 = m2 + m3
+	d13 = m1*m3; d22 = m2*m23; d0 = m12*m3 + m2**2 + 2*m1*m2
+
+	# Coeficientes de a1
+	k1a = L3/L1*m2*m3; k1b = 2*L2/L1*m2*m23
+	k1g1 = g/L1*m1*m3; k1g2 = g/L1*m2*m23; k1g3 = g/L1*d0
+
+	# Coeficientes de a2
+	k2a = L3/L2*m3*m2; k2b = L3/L2*m3*(m12 + m1)
+	k2e = L1/L2*((m12 + m2)*m3 + 2*m12*m2); k2f = L1/L2*m1*m3
+	k2g1 = 0.5*g/L2*m1*m3; k2g2 = g/L2*(0.5*(m12 + m2)*m3 + m2*m12)
+
+	# Coeficientes de a3
+	k3b = 2*L2/L3*m1*m23; k3c = L1/L3*m1*m23; k3g = 0.5*g/L3*m1*m23
+
+	def f(params, t = 0):
+		# Para un unico estado se trabaja con floats y math, mucho mas rapido que numpy sobre escalares
+		if isinstance(params, np.ndarray) and params.ndim == 1: params = params.tolist()
+		th1, w1, th2, w2, th3, w3 = params
+		sin, cos = (math.sin, math.cos) if isinstance(th1, float) else (np.sin, np.cos)
+
+		# Funciones trigonometricas de cada angulo
+		s1 = sin(th1); c1 = cos(th1); s2 = sin(th2); c2 = cos(th2); s3 = sin(th3); c3 = cos(th3)
+
+		# Diferencias de angulos y sus dobles
+		s21 = s2*c1 - c2*s1; c21 = c2*c1 + s2*s1
+		s32 = s3*c2 - c3*s2; c32 = c3*c2 + s3*s2
+		s31 = s3*c1 - c3*s1; c31 = c3*c1 + s3*s1
+		s2_21 = 2*s21*c21; c2_21 = c21*c21 - s21*s21
+		s2_32 = 2*s32*c32; c2_32 = c32*c32 - s32*s32
+
+		# Combinaciones de angulos que aparecen en las aceleraciones
+		sa = s32*c21 - c32*s21; ca = c32*c21 + s32*s21		# th32-th21
+		sb = s32*c31 + c32*s31; cb = c32*c31 - s32*s31		# th32+th31
+
+		ww1 = w1*w1; ww2 = w2*w2; ww3 = w3*w3
+		den = d13*c2_32 + d22*c2_21 - d0
+
+		a1 = (k1a*(sa - s31)*ww3 - k1b*s21*ww2 - d22*s2_21*ww1 - k1g1*c2_32*s1 - k1g2*(s21*c2 + c21*s2) + k1g3*s1)/den
+		a2 = ((k2a*(s31*c21 + c31*s21) - k2b*s32)*ww3 + (d22*s2_21 - d13*s2_32)*ww2 + (k2e*s21 - k2f*sb)*ww1 + k2g1*(-(sb*c1 - cb*s1) - (s32*c3 + c32*s3)) + k2g2*((s21*c1 - c21*s1) + s2))/den
+		a3 = (d13*s2_32*ww3 + k3b*s32*ww2 + k3c*(sa + s31)*ww1 + k3g*((sa*c1 + ca*s1) + (s32*c2 - c32*s2) + (s31*c1 - c31*s1) + s3))/den
+
+		return [w1, a1, w2, a2, w3, a3]
+
+	return f
+
+def Cadena(params, t, g, L, m):
+	'''
+	Ecuacion diferencial de una cadena de N barras sin masa con una bola al final de cada una.
+	En lugar de invertir la matriz de masas M_ij = (m_max(i,j) + ... + m_N) L_i L_j cos(th_i - th_j) se
+	calculan las tensiones de las barras, que cumplen un sistema tridiagonal (cada bola solo nota las
+	barras que la unen a sus vecinas); se resuelve con el algoritmo de Thomas en O(N) y de las tensiones
+	salen las aceleraciones. Con N = 1, 2 y 3 coincide con Simple (b = 0), Doble y Triple.
+
+	---Parametros---
+	* params: array con los valores (th1,w1,th2,w2,...,thN,wN), de forma (2N,) o (2N, lote)
+	* t: tiempo
+	* g: gravedad
+	* L: array con las longitudes de las barras, de forma (N,) o (N, lote)
+	* m: array con las masas de las bolas, de forma (N,) o (N, lote)
+
+	---Return---
+	* <np.array>: derivadas (diff1 de th1, diff2 de th1, ...), con la forma de params
+	'''
+	y = np.asarray(params, dtype=float)
+	th, w = y[0::2], y[1::2]
+	N = len(th)
+	L = np.asarray(L, dtype=float); m = np.asarray(m, dtype=float)
+	L = L.reshape(L.shape + (1,)*(th.ndim - L.ndim)); inv = 1/m.reshape(m.shape + (1,)*(th.ndim - m.ndim))
+
+	# Funciones trigonometricas de cada angulo y de la diferencia entre barras consecutivas
+	s = np.sin(th); c = np.cos(th)
+	sd = s[1:]*c[:-1] - c[1:]*s[:-1]; cd = c[1:]*c[:-1] + s[1:]*s[:-1]
+
+	# Sistema tridiagonal de las tensiones: diagonal, elementos fuera de la diagonal y termino independiente
+	diagonal = np.broadcast_to(inv, th.shape).copy(); diagonal[1:] += inv[:-1]
+	fuera = - cd*inv[:-1]
+	b = L*w*w; b[0] += g*c[0]
+
+	# Algoritmo de Thomas: eliminacion hacia delante y sustitucion hacia atras
+	cp = np.empty_like(fuera); dp = np.empty_like(b)
+	den = diagonal[0]; dp[0] = b[0]/den
+	for i in range(1, N):
+		cp[i-1] = fuera[i-1]/den
+		den = diagonal[i] - fuera[i-1]*cp[i-1]
+		dp[i] = (b[i] - fuera[i-1]*dp[i-1])/den
+	T = dp
+	for i in range(N-2, -1, -1): T[i] -= cp[i]*T[i+1]
+
+	# Aceleraciones: componente perpendicular a cada barra de la fuerza relativa entre sus extremos
+	a = np.zeros_like(b)
+	a[0] = - g*s[0]
+	a[:-1] += T[1:]*inv[:-1]*sd
+	a[1:] -= T[:-1]*inv[:-1]*sd
+	a /= L
+
+	dy = np.empty_like(y)
+	dy[0::2] = w; dy[1::2] = a
+	return dy
+
 def Esferico(params, t, g, L):
 
 	'''
@@ -105,6 +269,110 @@ def Esferico(params, t, g, L):
 
 	return [wth, ath, wph, aph]
 
+def Energia_Simple(params, g, L, b, m):
+	'''
+	Energia mecanica del pendulo simple, con el cero de potencial en el punto mas bajo
+
+	---Parametros---
+	* params: tupla con los valores (th,w), escalares o arrays
+	* g: gravedad
+	* L: longitud de la barra
+	* b: coeficiente de rozamiento con el aire (no interviene)
+	* m: masa de la bola
+
+	---Return---
+	* <float/np.array>: energia
+	'''
+	th, w = params[0], params[1]
+
+	return m*L**2*w**2/2 + m*g*L*(1-np.cos(th))
+
+def Energia_Doble(params, g, L1, L2, m1, m2):
+	'''
+	Energia mecanica del pendulo doble, con el cero de potencial en el punto mas bajo
+
+	---Parametros---
+	* params: tupla con los valores (th1,w1,th2,w2), escalares o arrays
+	* g: gravedad
+	* L1: longitud de la barra 1
+	* L2: longitud de la barra 2
+	* m1: masa de la bola 1
+	* m2: masa de la bola 2
+
+	---Return---
+	* <float/np.array>: energia
+	'''
+	th1, w1, th2, w2 = params[0], params[1], params[2], params[3]
+
+	T = (m1+m2)*L1**2*w1**2/2 + m2*L2**2*w2**2/2 + m2*L1*L2*w1*w2*np.cos(th1-th2)
+	V = g*((m1+m2)*L1*(1-np.cos(th1)) + m2*L2*(1-np.cos(th2)))
+
+	return T + V
+
+def Energia_Triple(params, g, L1, L2, L3, m1, m2, m3):
+	'''
+	Energia mecanica del pendulo triple, con el cero de potencial en el punto mas bajo
+
+	---Parametros---
+	* params: tupla con los valores (th1,w1,th2,w2,th3,w3), escalares o arrays
+	* g: gravedad
+	* L1: longitud de la barra 1
+	* L2: longitud de la barra 2
+	* L3: longitud de la barra 3
+	* m1: masa de la bola 1
+	* m2: masa de la bola 2
+	* m3: masa de la bola 3
+
+	---Return---
+	* <float/np.array>: energia
+	'''
+	th1, w1, th2, w2, th3, w3 = [params[i] for i in range(6)]
+
+	m123 = m1 + m2 + m3; m23 = m2 + m3
+	T = (m123*L1**2*w1**2 + m23*L2**2*w2**2 + m3*L3**2*w3**2)/2 + m23*L1*L2*w1*w2*np.cos(th1-th2) + m3*L3*w3*(L1*w1*np.cos(th1-th3) + L2*w2*np.cos(th2-th3))
+	V = g*(m123*L1*(1-np.cos(th1)) + m23*L2*(1-np.cos(th2)) + m3*L3*(1-np.cos(th3)))
+
+	return T + V
+
+def Energia_Cadena(params, g, L, m):
+	'''
+	Energia mecanica de una cadena de N barras, con el cero de potencial en el punto mas bajo
+
+	---Parametros---
+	* params: array con los valores (th1,w1,...,thN,wN), de forma (2N, ...)
+	* g: gravedad
+	* L: array con las longitudes de las barras, de forma (N, ...)
+	* m: array con las masas de las bolas, de forma (N, ...)
+
+	---Return---
+	* <float/np.array>: energia
+	'''
+	th, w = np.asarray(params[0::2]), np.asarray(params[1::2])
+	L = np.asarray(L, dtype=float); m = np.asarray(m, dtype=float)
+	L = L.reshape(L.shape + (1,)*(th.ndim - L.ndim)); m = m.reshape(m.shape + (1,)*(th.ndim - m.ndim))
+
+	# Velocidades y alturas de cada bola, sumando las de las barras anteriores
+	vx = np.cumsum(L*np.cos(th)*w, axis=0); vy = np.cumsum(L*np.sin(th)*w, axis=0)
+	h = np.cumsum(L*(1-np.cos(th)), axis=0)
+
+	return np.sum(m*((vx*vx + vy*vy)/2 + g*h), axis=0)
+
+def Energia_Esferico(params, g, L):
+	'''
+	Energia mecanica por unidad de masa del pendulo esferico, con el cero de potencial en el punto mas bajo
+
+	---Parametros---
+	* params: tupla con los valores (th,wth,ph,wph), escalares o arrays
+	* g: gravedad
+	* L: longitud de la barra
+
+	---Return---
+	* <float/np.array>: energia por unidad de masa
+	'''
+	th, wth, ph, wph = params[0], params[1], params[2], params[3]
+
+	return L**2/2*(wph**2 + wth**2*np.sin(ph)**2) + g*L*(1-np.cos(ph))
+
 def a_simple(th, w, ctes):
 	'''
 	Define la ecuacion diferencial de las aceleraciones de un pendulo simple
@@ -135,19 +403,7 @@ def a_doble(th, w, ctes):
 	* <float>: aceleracion angular de la bola 2
 	'''
 	g, m1, m2, L1, L2 = ctes
-	th1, th2 = th
-	w1, w2 = w
-
-	A = 2*m1+m2
-	dth = th1-th2
-	sdth = np.sin(dth)
-	cdth = np.cos(dth)
-	Lth1 = w1**2*L1
-	Lth2 = w2**2*L2
-	B = (A-m2*np.cos(2*dth))
-
-	a1 = (-g*(A*np.sin(th1)+m2*np.sin(th1-2*th2))-2*m2*sdth*(Lth2+Lth1*cdth))/(L1*B)
-	a2 = (2*sdth*((m1+m2)*(Lth1+g*np.cos(th1))+Lth2*m2*cdth)) / (L2*B)
+	_, a1, _, a2 = Doble((th[0], w[0], th[1], w[1]), 0, g, L1, L2, m1, m2)
 
 	return a1, a2
 
@@ -166,22 +422,28 @@ def a_triple(th, w, ctes):
 	* <float>: aceleracion angular de la bola 3
 	'''
 	g, m1, m2, m3, L1, L2, L3 = ctes
-	th1, th2, th3 = th
-	w1, w2, w3 = w
-
-	m12 = m1 + m2
-	m23 = m2 + m3
-	th21 = th2 - th1
-	th32 = th3 - th2
-	th31 = th3 - th1
-	den = m1*m3*np.cos(2*th32)+m2*m23*np.cos(2*th21)-m12*m3-m2**2-2*m1*m2
-
-	a1 = (L3/L1*m2*m3*(np.sin(th32-th21)-np.sin(th31))*w3**2-2*L2/L1*m2*m23*np.sin(th21)*w2**2-m2*m23*np.sin(2*th21)*w1**2+g/L1*(0.5*m1*m3*(np.sin(2*th32-th1)-np.sin(2*th32+th1))-m2*m23*np.sin(th2+th21)+(m12*m3+m2**2+2*m1*m2)*np.sin(th1)))/den
-	a2 = (L3/L2*m3*(m2*np.sin(th31+th21)-(m12+m1)*np.sin(th32))*w3**2+(m2*m23*np.sin(2*th21)-m1*m3*np.sin(2*th32))*w2**2+L1/L2*(((m12+m1)*m3+2*m12*m2)*np.sin(th21)-m1*m3*np.sin(th32+th31))*w1**2+g/L2*(-0.5*m1*m3*np.sin(th32+th31-th1)-0.5*m1*m3*np.sin(th32+th3)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th21-th1)+(0.5*(m12+m2)*m3+m2*m12)*np.sin(th2)))/den
-	a3 = (m1*m3*np.sin(2*th32)*w3**2+2*L2/L3*m1*m23*np.sin(th32)*w2**2+L1/L3*m1*m23*(np.sin(th32-th21)+np.sin(th31))*w1**2+0.5*g/L3*m1*m23*(np.sin(th32-th21+th1)+np.sin(th32-th2)+np.sin(th31-th1)+np.sin(th3)))/den
+	_, a1, _, a2, _, a3 = Triple((th[0], w[0], th[1], w[1], th[2], w[2]), 0, g, L1, L2, L3, m1, m2, m3)
 
 	return a1, a2, a3
 
+def a_cadena(th, w, ctes):
+	'''
+	Define la ecuacion diferencial de las aceleraciones de una cadena de N barras
+
+	---Parametros---
+	* th: lista con el angulo para cada bola
+	* w: lista con la velocidad angular para cada bola
+	* ctes: tupla con las constantes del experimento (g,m,L), con m y L listas de N valores
+
+	---Return---
+	* <np.array>: aceleracion angular de cada bola
+	'''
+	g, m, L = ctes
+	params = np.empty((2*len(th),) + np.shape(th[0]))
+	params[0::2] = th; params[1::2] = w
+
+	return Cadena(params, 0, g, L, m)[1::2]
+
 def a_esferico(ang, w, ctes):
 	'''
 	Define la ecuacion diferencial de las aceleraciones de un pendulo doble
@@ -202,4 +464,4 @@ def a_esferico(ang, w, ctes):
 	ath = -2*wth*wph/np.tan(ph)
 	aph = wth**2*np.sin(ph)*np.cos(ph)-g/L*np.sin(ph)
 
-	return ath, aph
+	return ath, aph
\ No newline at end of file